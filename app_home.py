@@ -0,0 +1,13 @@
+import os
+
+# Local state (caches, stores, saved settings) lives under one directory that
+# deployments can relocate with SURVEIDATA_HOME.
+APP_HOME = os.environ.get(
+    "SURVEIDATA_HOME", os.path.join(os.path.expanduser("~"), ".surveidata")
+)
+
+
+def app_path(*parts: str) -> str:
+    path = os.path.join(APP_HOME, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
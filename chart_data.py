@@ -0,0 +1,164 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from scipy.cluster.hierarchy import leaves_list, linkage
+from scipy.spatial.distance import squareform
+from scipy.stats import gaussian_kde
+
+from sketches import SKETCH_MIN_VALUES, column_sketch
+
+# ------------------------------------------------------------
+# Chart geometry, computed once and drawn by any renderer
+# ------------------------------------------------------------
+def histogram_data(
+    values, bins="auto", kde: bool = True, kde_sample: int = 5000, seed: int = 0
+) -> Optional[dict]:
+    x = np.asarray(values, dtype=float)
+    x = x[np.isfinite(x)]
+    if x.size == 0:
+        return None
+    counts, edges = np.histogram(x, bins=bins)
+    if len(counts) > 60:
+        counts, edges = np.histogram(x, bins=60)
+    data = {"counts": counts, "edges": edges, "n": int(x.size)}
+    if kde and x.size >= 3 and np.ptp(x) > 0:
+        rng = np.random.default_rng(seed)
+        sample = x if x.size <= kde_sample else rng.choice(x, kde_sample, replace=False)
+        grid = np.linspace(edges[0], edges[-1], 120)
+        density = gaussian_kde(sample)(grid)
+        # Scale the density to the count axis like seaborn's histplot(kde=True).
+        data["kde_x"] = grid
+        data["kde_y"] = density * x.size * np.diff(edges).mean()
+    return data
+
+
+def box_data(values, max_outliers: int = 500, seed: int = 0) -> Optional[dict]:
+    x = np.asarray(values, dtype=float)
+    x = x[np.isfinite(x)]
+    if x.size == 0:
+        return None
+    if x.size >= SKETCH_MIN_VALUES:
+        # Quartiles from a sketch; whiskers and the outlier sample need one linear pass.
+        q1, median, q3 = column_sketch(x).quantiles([0.25, 0.5, 0.75])
+    else:
+        q1, median, q3 = np.percentile(x, [25, 50, 75])
+    return box_from_quantiles(q1, median, q3, x.min(), x.max(), x, max_outliers, seed)
+
+
+def box_from_quantiles(
+    q1, median, q3, vmin, vmax, points, max_outliers: int = 500, seed: int = 0
+) -> dict:
+    iqr = q3 - q1
+    lo_fence = q1 - 1.5 * iqr
+    hi_fence = q3 + 1.5 * iqr
+    points = np.asarray(points, dtype=float)
+    inside = points[(points >= lo_fence) & (points <= hi_fence)]
+    outliers = points[(points < lo_fence) | (points > hi_fence)]
+    if outliers.size > max_outliers:
+        rng = np.random.default_rng(seed)
+        outliers = rng.choice(outliers, max_outliers, replace=False)
+    return {
+        "q1": float(q1),
+        "median": float(median),
+        "q3": float(q3),
+        "whisker_lo": float(inside.min()) if inside.size else float(max(vmin, lo_fence)),
+        "whisker_hi": float(inside.max()) if inside.size else float(min(vmax, hi_fence)),
+        "outliers": outliers,
+        "min": float(vmin),
+        "max": float(vmax),
+    }
+
+
+def bar_data(series: pd.Series, top: int = 20) -> dict:
+    return bar_data_from_counts(series.value_counts(), top)
+
+
+def bar_data_from_counts(counts: pd.Series, top: int = 20) -> dict:
+    vc = counts[counts.index.notna()].head(top)
+    return {"labels": [str(v) for v in vc.index], "counts": vc.to_numpy()}
+
+
+def scatter_data(x, y, max_points: int = 2000, grid: int = 120) -> Optional[dict]:
+    """Points for sparse pairs, a 2-D count grid for dense ones."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    ok = np.isfinite(x) & np.isfinite(y)
+    x, y = x[ok], y[ok]
+    if x.size == 0:
+        return None
+    data = {"n": int(x.size), "xlim": (x.min(), x.max()), "ylim": (y.min(), y.max())}
+    if x.size <= max_points:
+        data["x"], data["y"] = x, y
+    else:
+        counts, xedges, yedges = np.histogram2d(x, y, bins=grid)
+        data["density"] = counts
+    return data
+
+
+def heatmap_data(corr: pd.DataFrame, cluster: bool = True, threshold: float = 0.0) -> dict:
+    """Correlation matrix ready to draw as one image.
+
+    With ``cluster`` the variables are reordered by average-linkage
+    clustering on 1 - |r| so related blocks sit together; cells with
+    |r| below ``threshold`` are masked out.
+    """
+    values = corr.to_numpy(dtype=float)
+    order = np.arange(len(corr))
+    if cluster and len(corr) > 2:
+        dist = 1.0 - np.abs(np.nan_to_num(values, nan=0.0))
+        dist = (dist + dist.T) / 2
+        np.fill_diagonal(dist, 0.0)
+        order = leaves_list(linkage(squareform(np.clip(dist, 0, None), checks=False), "average"))
+    matrix = values[np.ix_(order, order)]
+    return {
+        "labels": [str(corr.index[i]) for i in order],
+        "matrix": np.ma.masked_where(~(np.abs(matrix) >= threshold), matrix),
+        "order": order,
+    }
+
+
+def correlation_pairs(heat: dict, rows: slice, cols: slice, threshold: float = 0.0) -> pd.DataFrame:
+    """Distinct variable pairs inside a region of the drawn heatmap, strongest first."""
+    labels = heat["labels"]
+    block = np.ma.getdata(heat["matrix"])[rows, cols]
+    r_idx, c_idx = np.nonzero(np.isfinite(block) & (np.abs(block) >= threshold))
+    r_idx = r_idx + (rows.start or 0)
+    c_idx = c_idx + (cols.start or 0)
+    keep = r_idx != c_idx
+    # Each pair appears twice in a symmetric matrix; keep one orientation.
+    a = np.minimum(r_idx[keep], c_idx[keep])
+    b = np.maximum(r_idx[keep], c_idx[keep])
+    pairs = np.unique(np.stack([a, b], axis=1), axis=0) if a.size else np.zeros((0, 2), dtype=int)
+    full = np.ma.getdata(heat["matrix"])
+    r = full[pairs[:, 0], pairs[:, 1]] if len(pairs) else np.array([])
+    out = pd.DataFrame(
+        {
+            "var_1": [labels[i] for i in pairs[:, 0]],
+            "var_2": [labels[j] for j in pairs[:, 1]],
+            "r": r,
+        }
+    )
+    return out.reindex(out["r"].abs().sort_values(ascending=False).index).reset_index(drop=True)
+
+
+def pair_plot_layout(corr: pd.DataFrame, matrix_max: int = 6, top: int = 24) -> dict:
+    """Which numeric pairs a pair-plot page shows, as a grid of (x, y) cells or None.
+
+    Up to ``matrix_max`` variables give the lower triangle of a scatter
+    matrix: row i holds the pairs of variable i + 1 with each earlier one.
+    Beyond that the ``top`` pairs by |r| are laid out four to a row.
+    """
+    labels = list(corr.index)
+    if len(labels) <= matrix_max:
+        cells = [
+            [(labels[j], labels[i]) if j < i else None for j in range(len(labels) - 1)]
+            for i in range(1, len(labels))
+        ]
+        return {"mode": "matrix", "cells": cells, "per_row": max(len(labels) - 1, 1)}
+    values = np.abs(corr.to_numpy(dtype=float))
+    i, j = np.triu_indices(len(labels), k=1)
+    strength = np.nan_to_num(values[i, j], nan=-1.0)
+    best = np.argsort(-strength, kind="stable")[:top]
+    pairs = [(labels[i[b]], labels[j[b]]) for b in best if strength[b] >= 0]
+    return {"mode": "top", "cells": [pairs[k : k + 4] for k in range(0, len(pairs), 4)], "per_row": 4}
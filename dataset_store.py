@@ -0,0 +1,160 @@
+import glob
+import os
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from app_home import app_path
+
+IDLE_TTL = float(os.environ.get("SURVEIDATA_DATASET_IDLE_TTL", 30 * 60))
+FILE_TTL = float(os.environ.get("SURVEIDATA_DATASET_FILE_TTL", 24 * 60 * 60))
+
+
+# ------------------------------------------------------------
+# Shared dataset store
+# ------------------------------------------------------------
+class _Entry:
+    def __init__(self, df: pd.DataFrame, path: Optional[str]):
+        self.df = df
+        self.path = path
+        self.refs = 0
+        self.last_used = time.time()
+
+
+class DatasetLease:
+    """A session's hold on a shared dataset; released explicitly or when garbage collected."""
+
+    def __init__(self, store: "DatasetStore", content_hash: str, df: pd.DataFrame):
+        self.content_hash = content_hash
+        self.df = df
+        self._finalizer = weakref.finalize(self, store._release, content_hash)
+
+    def release(self) -> None:
+        self._finalizer()
+
+
+class DatasetStore:
+    """Parse each uploaded file once and share it between sessions and processes.
+
+    A parsed dataset is written as an Arrow IPC file named by its content
+    hash and read back through a memory map. Numeric columns without missing
+    values are handed to pandas as views of the mapped pages, so every
+    session in this process uses the same in-memory frame and other server
+    processes reading the same file share the OS page cache. Entries are
+    reference counted per lease. An unreferenced entry is dropped from memory
+    after ``idle_ttl`` seconds, and its file is deleted after ``file_ttl``
+    seconds without use by any process.
+    """
+
+    def __init__(self, root: str, idle_ttl: float = IDLE_TTL, file_ttl: float = FILE_TTL):
+        self.root = root
+        self.idle_ttl = idle_ttl
+        self.file_ttl = file_ttl
+        os.makedirs(root, exist_ok=True)
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._parse_locks: Dict[str, threading.Lock] = {}
+
+    def _path(self, content_hash: str) -> str:
+        return os.path.join(self.root, f"{content_hash}.arrow")
+
+    def acquire(
+        self, content_hash: str, parse: Callable[[], Optional[pd.DataFrame]]
+    ) -> Optional[DatasetLease]:
+        self.evict_idle()
+        with self._lock:
+            parse_lock = self._parse_locks.setdefault(content_hash, threading.Lock())
+        # One session parses; concurrent sessions opening the same file wait here.
+        with parse_lock:
+            with self._lock:
+                entry = self._entries.get(content_hash)
+            if entry is None:
+                entry = self._load(content_hash, parse)
+                if entry is None:
+                    return None
+            with self._lock:
+                self._entries[content_hash] = entry
+                entry.refs += 1
+                entry.last_used = time.time()
+        if entry.path is not None:
+            try:
+                os.utime(entry.path)
+            except OSError:
+                pass
+        return DatasetLease(self, content_hash, entry.df)
+
+    def _load(self, content_hash: str, parse) -> Optional[_Entry]:
+        path = self._path(content_hash)
+        if not os.path.exists(path):
+            df = parse()
+            if df is None:
+                return None
+            if not self._write(df, path):
+                # Not representable in Arrow (e.g. mixed-type object columns):
+                # share the parsed frame in this process only.
+                return _Entry(df, None)
+        try:
+            return _Entry(self._map(path), path)
+        except (OSError, pa.ArrowException):
+            df = parse()
+            return _Entry(df, None) if df is not None else None
+
+    @staticmethod
+    def _write(df: pd.DataFrame, path: str) -> bool:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowException, ValueError, TypeError):
+            return False
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with pa.OSFile(tmp, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+        return True
+
+    @staticmethod
+    def _map(path: str) -> pd.DataFrame:
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        return table.to_pandas(split_blocks=True, self_destruct=False)
+
+    def _release(self, content_hash: str) -> None:
+        with self._lock:
+            entry = self._entries.get(content_hash)
+            if entry is not None:
+                entry.refs = max(0, entry.refs - 1)
+                entry.last_used = time.time()
+
+    def evict_idle(self, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            for key in [
+                k
+                for k, e in self._entries.items()
+                if e.refs == 0 and now - e.last_used > self.idle_ttl
+            ]:
+                del self._entries[key]
+                self._parse_locks.pop(key, None)
+            in_memory = {e.path for e in self._entries.values() if e.path}
+        for path in glob.glob(os.path.join(self.root, "*.arrow")):
+            if path in in_memory:
+                continue
+            try:
+                if now - os.path.getmtime(path) > self.file_ttl:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                key: {"refs": e.refs, "rows": len(e.df), "idle_s": time.time() - e.last_used}
+                for key, e in self._entries.items()
+            }
+
+
+DATASET_STORE = DatasetStore(os.path.dirname(app_path("datasets", "_")))
@@ -0,0 +1,107 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+# ------------------------------------------------------------
+# PCA and exploratory factor analysis on a correlation matrix
+# ------------------------------------------------------------
+def _usable(corr: pd.DataFrame) -> pd.DataFrame:
+    """Drop items without variance (NaN diagonal); pairs never observed together count as 0."""
+    keep = np.isfinite(np.diag(corr.to_numpy(dtype=float)))
+    r = corr.loc[keep, keep]
+    return r.fillna(0.0)
+
+
+def _eigh_desc(r: np.ndarray):
+    vals, vecs = np.linalg.eigh(r)
+    order = np.argsort(vals)[::-1]
+    vecs = vecs[:, order]
+    # Fix the sign so the largest loading of each component is positive.
+    signs = np.sign(vecs[np.abs(vecs).argmax(axis=0), np.arange(vecs.shape[1])])
+    return vals[order], vecs * np.where(signs == 0, 1.0, signs)
+
+
+def kaiser_count(eigenvalues: np.ndarray) -> int:
+    """Components with eigenvalue above 1 (at least one)."""
+    return max(1, int((np.asarray(eigenvalues) > 1.0).sum()))
+
+
+def varimax(loadings: np.ndarray, max_iter: int = 100, tol: float = 1e-6) -> np.ndarray:
+    """Orthogonal varimax rotation of a loadings matrix (items x factors)."""
+    p, k = loadings.shape
+    if k < 2:
+        return loadings
+    rot = np.eye(k)
+    objective = 0.0
+    for _ in range(max_iter):
+        lr = loadings @ rot
+        u, s, vt = np.linalg.svd(loadings.T @ (lr**3 - lr * (lr * lr).sum(axis=0) / p))
+        rot = u @ vt
+        if s.sum() < objective * (1 + tol):
+            break
+        objective = s.sum()
+    return loadings @ rot
+
+
+def principal_axis(r: np.ndarray, n_factors: int, max_iter: int = 100, tol: float = 1e-4):
+    """Principal-axis factoring: loadings and communalities.
+
+    Communalities start at the squared multiple correlations and are
+    re-estimated from the loadings until they change by less than ``tol``.
+    They are kept at or below 1 (Heywood cases).
+    """
+    smc = 1.0 - 1.0 / np.diag(np.linalg.pinv(r))
+    h = np.clip(np.nan_to_num(smc, nan=1.0), 0.0, 1.0)
+    reduced = r.copy()
+    for _ in range(max_iter):
+        np.fill_diagonal(reduced, h)
+        vals, vecs = _eigh_desc(reduced)
+        loadings = vecs[:, :n_factors] * np.sqrt(np.maximum(vals[:n_factors], 0.0))
+        new_h = np.minimum((loadings * loadings).sum(axis=1), 1.0)
+        done = np.abs(new_h - h).max() < tol
+        h = new_h
+        if done:
+            break
+    return loadings, h
+
+
+def factor_analysis(
+    corr: pd.DataFrame, n_factors: Optional[int] = None, method: str = "pca", rotate: bool = True
+) -> Optional[dict]:
+    """PCA or principal-axis EFA from a (pairwise-complete) correlation matrix.
+
+    The matrix is decomposed once with a symmetric eigensolver; its full
+    spectrum gives the scree plot. ``n_factors`` defaults to the Kaiser
+    criterion. Negative eigenvalues, which pairwise-complete matrices can
+    have, count as zero variance. Loadings are varimax-rotated when
+    ``rotate`` and more than one factor is kept. Returns None when fewer
+    than two items vary.
+    """
+    r = _usable(corr)
+    if len(r) < 2:
+        return None
+    items = [str(c) for c in r.index]
+    values = r.to_numpy(dtype=float)
+    eigenvalues, vecs = _eigh_desc(values)
+    k = kaiser_count(eigenvalues) if not n_factors else min(int(n_factors), len(items))
+    if method == "efa":
+        loadings, communality = principal_axis(values, k)
+    else:
+        loadings = vecs[:, :k] * np.sqrt(np.maximum(eigenvalues[:k], 0.0))
+        communality = (loadings * loadings).sum(axis=1)
+    if rotate:
+        loadings = varimax(loadings)
+    names = [f"F{i + 1}" for i in range(k)]
+    table = pd.DataFrame(loadings, index=pd.Index(items, name="item"), columns=names)
+    table["communality"] = communality
+    total = np.maximum(eigenvalues, 0.0).sum()
+    return {
+        "eigenvalues": eigenvalues,
+        "explained": np.maximum(eigenvalues, 0.0) / total if total > 0 else eigenvalues * np.nan,
+        "n_factors": k,
+        # Share of total item variance carried by the kept factors.
+        "explained_kept": float(communality.sum() / len(items)) if items else np.nan,
+        "loadings": table,
+    }
@@ -0,0 +1,189 @@
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.stats import chi2 as chi2_dist, f as f_dist, t as t_dist
+
+
+# ------------------------------------------------------------
+# Batch numeric-by-categorical group comparisons
+# ------------------------------------------------------------
+def _ranks_and_ties(x: np.ndarray):
+    """Average ranks per column (NaN stays NaN) and sum(t^3 - t) over tied runs."""
+    # Work on rows of the transpose: sorting contiguous memory is much faster.
+    xt = np.ascontiguousarray(x.T)
+    p, n = xt.shape
+    order = np.argsort(xt, axis=1)
+    s = np.take_along_axis(xt, order, axis=1)
+    valid = ~np.isnan(s)
+    start = np.ones((p, n), dtype=bool)
+    start[:, 1:] = s[:, 1:] != s[:, :-1]
+    end = np.ones((p, n), dtype=bool)
+    end[:, :-1] = start[:, 1:]
+    pos = np.arange(n, dtype=float)
+    first = np.maximum.accumulate(np.where(start, pos, 0.0), axis=1)
+    last = np.minimum.accumulate(np.where(end, pos, n)[:, ::-1], axis=1)[:, ::-1]
+    ranks = np.empty((p, n))
+    np.put_along_axis(ranks, order, np.where(valid, (first + last) / 2 + 1, np.nan), axis=1)
+    t = np.where(start & valid, last - first + 1, 0.0)
+    return ranks.T, (t**3 - t).sum(axis=1)
+
+
+def _group_sums(codes: np.ndarray, k: int, block: np.ndarray) -> np.ndarray:
+    # Sparse (k x n) indicator of the integer group codes (rows without a
+    # group have no entry): every per-group sum is then one sparse product,
+    # with memory linear in n instead of n x k.
+    rows = np.flatnonzero(codes >= 0)
+    indicator = sparse.csr_matrix((np.ones(rows.size), (codes[rows], rows)), shape=(k, codes.size))
+    return np.asarray(indicator @ block)
+
+
+def _sums_block(valid: np.ndarray, x: np.ndarray, ranks: np.ndarray, w: Optional[np.ndarray]) -> np.ndarray:
+    # [valid | x | x^2 | rank], or [valid | w | wx | wx^2 | w^2 | rank] with weights.
+    x0 = np.where(valid, x, 0.0)
+    r0 = np.where(valid, ranks, 0.0)
+    if w is None:
+        return np.hstack([valid.astype(float), x0, x0 * x0, r0])
+    wv = np.where(valid, w, 0.0)
+    return np.hstack([valid.astype(float), wv, wv * x0, wv * x0 * x0, wv * wv, r0])
+
+
+def group_comparisons(
+    df: pd.DataFrame,
+    numeric_cols: Sequence,
+    cat_cols: Sequence,
+    max_groups: int = 30,
+    weights: Optional[np.ndarray] = None,
+) -> pd.DataFrame:
+    """Welch t (2 groups) or one-way ANOVA F, plus Kruskal-Wallis, for every
+    numeric x categorical pair, with Hedges' g / eta² and epsilon² effect sizes.
+
+    With ``weights``, means, variances and sums of squares are weighted and
+    the t and F degrees of freedom use Kish effective sizes; Kruskal-Wallis
+    stays on unweighted ranks. ``n`` is always the unweighted count.
+    """
+    numeric_cols = list(numeric_cols)
+    w = None if weights is None else np.asarray(weights, dtype=float)[:, None]
+    columns = [
+        "numeric", "group_by", "n", "groups", "test", "statistic", "p_value",
+        "effect", "effect_size", "kw_h", "kw_p", "kw_epsilon2",
+    ]
+    if not numeric_cols or not cat_cols:
+        return pd.DataFrame(columns=columns)
+    x = df[numeric_cols].to_numpy(dtype=float, na_value=np.nan)
+    finite = np.isfinite(x)
+    x = np.where(finite, x, np.nan)
+    ranks, ties = _ranks_and_ties(x)
+    # All per-group sums side by side, so each categorical column needs one product.
+    shared = _sums_block(finite, x, ranks, w)
+
+    frames = []
+    for cat in cat_cols:
+        codes, uniques = pd.factorize(df[cat])
+        k = len(uniques)
+        if k < 2 or k > max_groups:
+            continue
+        cat_missing = codes < 0
+        if cat_missing.any():
+            # Rows without a group drop out, so ranks are taken among the rest.
+            xm = np.where(cat_missing[:, None], np.nan, x)
+            valid = ~np.isnan(xm)
+            r, tie_terms = _ranks_and_ties(xm)
+            block = _sums_block(valid, xm, r, w)
+        else:
+            block, tie_terms = shared, ties
+        sums = _group_sums(codes, k, block)
+        if w is None:
+            cnt, s1, s2, rs = np.split(sums, 4, axis=1)
+            sw = sw2 = cnt
+        else:
+            cnt, sw, s1, s2, sw2, rs = np.split(sums, 6, axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            present = cnt > 0
+            groups = present.sum(axis=0)
+            n = cnt.sum(axis=0)
+            total_w = sw.sum(axis=0)
+            # Kish effective sizes (the plain counts when unweighted).
+            n_eff = np.where(present, sw**2 / sw2, 0.0)
+            mean = np.where(present, s1 / sw, 0.0)
+            grand = s1.sum(axis=0) / total_w
+            ss_between = (sw * (mean - grand) ** 2).sum(axis=0)
+            ss_total = s2.sum(axis=0) - total_w * grand**2
+            ss_within = ss_total - ss_between
+            var = np.where(n_eff > 1, (s2 / sw - mean**2) * n_eff / (n_eff - 1), np.nan)
+
+            # One-way ANOVA F and eta squared
+            df_b = groups - 1
+            df_w = total_w**2 / sw2.sum(axis=0) - groups
+            f_stat = (ss_between / df_b) / (ss_within / df_w)
+            f_p = f_dist.sf(f_stat, df_b, df_w)
+            eta2 = ss_between / ss_total
+
+            # Welch t between the two groups (first two present groups)
+            order = np.argsort(~present, axis=0, kind="stable")[:2]
+            pick = lambda a: np.take_along_axis(a, order, axis=0)
+            n1, n2 = pick(n_eff)
+            m1, m2 = pick(mean)
+            v1, v2 = pick(np.nan_to_num(var, nan=0.0))
+            se2 = v1 / n1 + v2 / n2
+            t_stat = (m1 - m2) / np.sqrt(se2)
+            t_df = se2**2 / ((v1 / n1) ** 2 / (n1 - 1) + (v2 / n2) ** 2 / (n2 - 1))
+            t_p = 2 * t_dist.sf(np.abs(t_stat), t_df)
+            pooled = np.sqrt(((n1 - 1) * v1 + (n2 - 1) * v2) / (n1 + n2 - 2))
+            hedges_g = (m1 - m2) / pooled * (1 - 3 / (4 * (n1 + n2) - 9))
+
+            # Kruskal-Wallis H with tie correction and epsilon squared
+            h = 12.0 / (n * (n + 1)) * np.where(present, rs**2 / cnt, 0.0).sum(axis=0) - 3 * (n + 1)
+            h = h / (1 - tie_terms / (n**3 - n))
+            kw_p = chi2_dist.sf(h, groups - 1)
+            eps2 = h / (n - 1)
+
+        two = groups == 2
+        frame = pd.DataFrame(
+            {
+                "numeric": [str(c) for c in numeric_cols],
+                "group_by": str(cat),
+                "n": n.astype(int),
+                "groups": groups.astype(int),
+                "test": np.where(two, "Welch t", "ANOVA F"),
+                "statistic": np.where(two, t_stat, f_stat),
+                "p_value": np.where(two, t_p, f_p),
+                "effect": np.where(two, "Hedges g", "eta²"),
+                "effect_size": np.where(two, hedges_g, eta2),
+                "kw_h": h,
+                "kw_p": kw_p,
+                "kw_epsilon2": eps2,
+            }
+        )
+        # An ordinal column can be both numeric and categorical; skip self-pairs.
+        keep = (groups >= 2) & (n > groups) & np.array([c != cat for c in numeric_cols])
+        frames.append(frame[keep])
+
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    out = pd.concat(frames, ignore_index=True)
+    return out.sort_values("p_value", kind="stable").reset_index(drop=True)
+
+
+def group_means(df: pd.DataFrame, numeric_col, cat_col, weights: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """Per-group n, mean and standard deviation for one pair, for drill-down."""
+    codes, uniques = pd.factorize(df[cat_col])
+    x = pd.to_numeric(df[numeric_col], errors="coerce").to_numpy(dtype=float, na_value=np.nan)[:, None]
+    valid = ~np.isnan(x)
+    w = None if weights is None else np.asarray(weights, dtype=float)[:, None]
+    block = _sums_block(valid, x, np.zeros_like(x), w)
+    sums = _group_sums(codes, len(uniques), block).T
+    if w is None:
+        cnt, s1, s2, _ = sums
+        sw = sw2 = cnt
+    else:
+        cnt, sw, s1, s2, sw2, _ = sums
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n_eff = sw**2 / sw2
+        mean = s1 / sw
+        std = np.sqrt((s2 / sw - mean**2) * n_eff / (n_eff - 1))
+    return pd.DataFrame(
+        {"group": [str(u) for u in uniques], "n": cnt.astype(int), "mean": mean, "std": std}
+    ).sort_values("n", ascending=False, kind="stable")
@@ -0,0 +1,151 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# ------------------------------------------------------------
+# Per-session dataset limits
+# ------------------------------------------------------------
+class SessionLimits:
+    def __init__(
+        self,
+        max_rows: int = _env_int("SURVEIDATA_MAX_ROWS", 1_000_000),
+        max_cols: int = _env_int("SURVEIDATA_MAX_COLS", 500),
+        max_memory_mb: int = _env_int("SURVEIDATA_MAX_MEMORY_MB", 1024),
+    ):
+        self.max_rows = max_rows
+        self.max_cols = max_cols
+        self.max_memory_mb = max_memory_mb
+
+    @property
+    def key(self) -> Tuple[int, int, int]:
+        return (self.max_rows, self.max_cols, self.max_memory_mb)
+
+
+def estimate_memory_bytes(df: pd.DataFrame, sample: int = 1000) -> float:
+    """Cheap estimate of memory_usage(deep=True): string sizes come from a sample."""
+    total = float(df.memory_usage(index=False, deep=False).sum())
+    if len(df) == 0:
+        return total
+    rows = np.linspace(0, len(df) - 1, min(sample, len(df))).astype(int)
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+            avg = s.iloc[rows].dropna().astype(str).str.len().mean()
+            if avg == avg:
+                total += (avg + 49) * len(df)
+    return total
+
+
+_LIMITED: "OrderedDict[tuple, Tuple[pd.DataFrame, dict]]" = OrderedDict()
+_LIMITED_LOCK = threading.Lock()
+
+
+def apply_limits(
+    df: pd.DataFrame, dataset_hash: str, limits: SessionLimits, seed: int = 0
+) -> Tuple[pd.DataFrame, dict]:
+    """Keep a dataset within the session limits by sampling instead of failing.
+
+    Columns beyond ``max_cols`` are dropped; rows are randomly sampled (order
+    kept) down to ``max_rows`` and to what fits in ``max_memory_mb``. The
+    reduced frame is cached so every session on the same file shares it.
+    """
+    key = (dataset_hash, limits.key, seed)
+    with _LIMITED_LOCK:
+        if key in _LIMITED:
+            _LIMITED.move_to_end(key)
+            return _LIMITED[key]
+
+    info = {"rows": len(df), "cols": df.shape[1], "sampled_rows": None, "kept_cols": None}
+    out = df
+    if df.shape[1] > limits.max_cols:
+        out = out.iloc[:, : limits.max_cols]
+        info["kept_cols"] = limits.max_cols
+    allowed = limits.max_rows
+    mem = estimate_memory_bytes(out)
+    budget = limits.max_memory_mb * 1024 * 1024
+    if mem > budget:
+        allowed = min(allowed, int(len(out) * budget / mem))
+    if len(out) > allowed:
+        out = out.sample(n=max(allowed, 1), random_state=seed).sort_index()
+        info["sampled_rows"] = len(out)
+    info["key"] = dataset_hash
+    if out is not df:
+        info["key"] = f"{dataset_hash}:{out.shape[0]}x{out.shape[1]}"
+
+    with _LIMITED_LOCK:
+        _LIMITED[key] = (out, info)
+        while len(_LIMITED) > 8:
+            _LIMITED.popitem(last=False)
+    return out, info
+
+
+# ------------------------------------------------------------
+# Bounded pool for heavy jobs with visible queue position
+# ------------------------------------------------------------
+class JobTicket:
+    def __init__(self, label: str):
+        self.label = label
+        self.submitted_at = time.time()
+        self.future: Optional[Future] = None
+
+    def done(self, timeout: float = 0.0) -> bool:
+        try:
+            self.future.result(timeout=timeout)
+        except Exception:
+            pass
+        return self.future.done()
+
+    def result(self):
+        return self.future.result()
+
+
+class HeavyJobScheduler:
+    """Run at most ``max_workers`` heavy jobs at a time; others wait in FIFO order."""
+
+    def __init__(self, max_workers: int = _env_int("SURVEIDATA_MAX_HEAVY_JOBS", 2)):
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="heavy-job")
+        self._waiting: List[JobTicket] = []
+        self._lock = threading.Lock()
+
+    def submit(self, label: str, fn: Callable, *args, **kwargs) -> JobTicket:
+        ticket = JobTicket(label)
+
+        def run():
+            with self._lock:
+                if ticket in self._waiting:
+                    self._waiting.remove(ticket)
+            return fn(*args, **kwargs)
+
+        with self._lock:
+            self._waiting.append(ticket)
+            ticket.future = self._executor.submit(run)
+        return ticket
+
+    def position(self, ticket: JobTicket) -> int:
+        """0 once the job runs, otherwise its 1-based place in the queue."""
+        with self._lock:
+            if ticket in self._waiting:
+                return self._waiting.index(ticket) + 1
+        return 0
+
+    def queue_length(self) -> int:
+        with self._lock:
+            return len(self._waiting)
+
+
+HEAVY_JOBS = HeavyJobScheduler()
@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# ------------------------------------------------------------
+# Missing-data index shared by all analyses
+# ------------------------------------------------------------
+class MissingnessIndex:
+    """Per-column validity bitmaps built with a single NaN scan.
+
+    ``bitmaps[j]`` holds one bit per row for column j (1 = value present).
+    Complete-case masks for any set of columns are bitwise ANDs of those
+    rows, so analyses select complete values without copying the frame.
+    """
+
+    def __init__(self, df: pd.DataFrame, chunk_rows: int = 65536):
+        self.columns: List = list(df.columns)
+        self._pos = {col: i for i, col in enumerate(self.columns)}
+        self.n_rows = len(df)
+        p = len(self.columns)
+        nbytes = (self.n_rows + 7) // 8
+        self.bitmaps = np.zeros((p, nbytes), dtype=np.uint8)
+        self.valid_counts = np.zeros(p, dtype=np.int64)
+        self.pair_counts = np.zeros((p, p), dtype=np.float64)
+        self.pattern_counts: Dict[bytes, int] = {}
+
+        for start in range(0, self.n_rows, chunk_rows):
+            # chunk_rows is a multiple of 8, so packed chunks line up on byte boundaries.
+            valid = df.iloc[start : start + chunk_rows].notna().to_numpy()
+            packed = np.packbits(valid.T, axis=1)
+            self.bitmaps[:, start // 8 : start // 8 + packed.shape[1]] = packed
+            self.valid_counts += valid.sum(axis=0)
+            v = valid.astype(np.float32)
+            self.pair_counts += v.T @ v
+            codes, counts = np.unique(np.packbits(~valid, axis=1), axis=0, return_counts=True)
+            for code, cnt in zip(codes, counts):
+                key = code.tobytes()
+                self.pattern_counts[key] = self.pattern_counts.get(key, 0) + int(cnt)
+        self.pair_counts = self.pair_counts.astype(np.int64)
+
+    def has_columns(self, cols: Sequence) -> bool:
+        return all(c in self._pos for c in cols)
+
+    def mask(self, cols: Sequence) -> np.ndarray:
+        """Boolean mask of rows where every column in ``cols`` has a value."""
+        idx = [self._pos[c] for c in cols]
+        packed = np.bitwise_and.reduce(self.bitmaps[idx], axis=0)
+        return np.unpackbits(packed, count=self.n_rows).astype(bool)
+
+    def complete_count(self, cols: Sequence) -> int:
+        if len(cols) == 2:
+            return int(self.pair_counts[self._pos[cols[0]], self._pos[cols[1]]])
+        return int(self.mask(cols).sum())
+
+    def summary(self) -> pd.DataFrame:
+        missing = self.n_rows - self.valid_counts
+        return pd.DataFrame(
+            {
+                "missing": missing,
+                "missing_pct": (missing / max(self.n_rows, 1) * 100).round(2),
+            },
+            index=self.columns,
+        )
+
+    def pairwise_complete(self, cols: Optional[Sequence] = None) -> pd.DataFrame:
+        cols = self.columns if cols is None else list(cols)
+        idx = [self._pos[c] for c in cols]
+        return pd.DataFrame(self.pair_counts[np.ix_(idx, idx)], index=cols, columns=cols)
+
+    def patterns(self, top: int = 10) -> pd.DataFrame:
+        """Most common combinations of missing columns."""
+        if self.n_rows == 0:
+            return pd.DataFrame(columns=["missing_columns", "rows", "pct"])
+        ranked = sorted(self.pattern_counts.items(), key=lambda kv: -kv[1])[:top]
+        rows = []
+        for code, cnt in ranked:
+            bits = np.unpackbits(np.frombuffer(code, dtype=np.uint8), count=len(self.columns))
+            missing_cols = [str(c) for c, b in zip(self.columns, bits) if b]
+            rows.append(
+                {
+                    "missing_columns": ", ".join(missing_cols) if missing_cols else "-",
+                    "rows": cnt,
+                    "pct": round(cnt / self.n_rows * 100, 2),
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def complete_values(self, df: pd.DataFrame, cols: Sequence) -> Tuple[np.ndarray, ...]:
+        m = self.mask(cols)
+        return tuple(df[c].to_numpy()[m] for c in cols)
+
+
+_INDEX_CACHE: "OrderedDict[tuple, MissingnessIndex]" = OrderedDict()
+_INDEX_LOCK = threading.Lock()
+
+
+def missingness_index(df: pd.DataFrame, dataset_hash: str) -> MissingnessIndex:
+    key = (dataset_hash, tuple(map(str, df.columns)), tuple(map(str, df.dtypes)))
+    with _INDEX_LOCK:
+        if key in _INDEX_CACHE:
+            _INDEX_CACHE.move_to_end(key)
+            return _INDEX_CACHE[key]
+    index = MissingnessIndex(df)
+    with _INDEX_LOCK:
+        _INDEX_CACHE[key] = index
+        while len(_INDEX_CACHE) > 8:
+            _INDEX_CACHE.popitem(last=False)
+    return index
+
+
+def complete_values(
+    df: pd.DataFrame, cols: Sequence, missing: Optional[MissingnessIndex] = None
+) -> Tuple[np.ndarray, ...]:
+    """Values of ``cols`` on rows where all are present, via the index when available."""
+    if missing is not None and missing.n_rows == len(df) and missing.has_columns(cols):
+        return missing.complete_values(df, cols)
+    data = df[list(cols)].dropna()
+    return tuple(data[c].to_numpy() for c in cols)
@@ -0,0 +1,188 @@
+from io import BytesIO
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+# ------------------------------------------------------------
+# Themes: plain colour sets applied to each figure's own artists
+# ------------------------------------------------------------
+THEMES = {
+    "light": {
+        "face": "#ffffff",
+        "fg": "#222222",
+        "text": "#000000",
+        "grid": "#cccccc",
+        "bar": "#4c72b0",
+        "edge": "#ffffff",
+        "density": "Blues",
+    },
+    "dark": {
+        "face": "#111111",
+        "fg": "#dddddd",
+        "text": "#ffffff",
+        "grid": "#3a3a3a",
+        "bar": "#6fa8dc",
+        "edge": "#111111",
+        "density": "viridis",
+    },
+}
+
+
+def new_figure(theme: str = "light", figsize: Tuple[float, float] = (6.4, 4.8)):
+    """A Figure that is not registered with pyplot, styled without touching rcParams.
+
+    Nothing here reads or writes global matplotlib state beyond rcParams
+    defaults, so figures can be built concurrently from worker threads.
+    """
+    colors = THEMES[theme]
+    fig = Figure(figsize=figsize, facecolor=colors["face"])
+    ax = fig.add_subplot()
+    style_axes(ax, theme)
+    return fig, ax
+
+
+def style_axes(ax: Axes, theme: str = "light", grid: bool = True) -> None:
+    colors = THEMES[theme]
+    ax.set_facecolor(colors["face"])
+    for spine in ax.spines.values():
+        spine.set_color(colors["fg"])
+    ax.tick_params(colors=colors["fg"], labelcolor=colors["fg"])
+    ax.xaxis.label.set_color(colors["text"])
+    ax.yaxis.label.set_color(colors["text"])
+    ax.title.set_color(colors["text"])
+    if grid:
+        ax.grid(True, color=colors["grid"], linewidth=0.8)
+        ax.set_axisbelow(True)
+
+
+def figure_png(fig: Figure, dpi: int = 150) -> bytes:
+    buf = BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", facecolor=fig.get_facecolor())
+    return buf.getvalue()
+
+
+def render_png(
+    draw: Callable[[Axes, str], None],
+    theme: str = "light",
+    figsize: Tuple[float, float] = (6.4, 4.8),
+    dpi: int = 150,
+) -> bytes:
+    fig, ax = new_figure(theme, figsize)
+    draw(ax, theme)
+    return figure_png(fig, dpi)
+
+
+# ------------------------------------------------------------
+# Charts drawn from chart_data geometry
+# ------------------------------------------------------------
+def _title(ax: Axes, theme: str, title: Optional[str]) -> None:
+    if title:
+        ax.set_title(title, color=THEMES[theme]["text"])
+
+
+def draw_histogram(ax: Axes, data: Optional[dict], theme: str = "light", title: Optional[str] = None) -> None:
+    colors = THEMES[theme]
+    if data is not None:
+        edges = data["edges"]
+        ax.bar(
+            edges[:-1],
+            data["counts"],
+            width=np.diff(edges),
+            align="edge",
+            color=colors["bar"],
+            alpha=0.75,
+            edgecolor=colors["edge"],
+            linewidth=0.5,
+        )
+        if "kde_x" in data:
+            ax.plot(data["kde_x"], data["kde_y"], color=colors["bar"], linewidth=1.5)
+    ax.set_ylabel("Count")
+    _title(ax, theme, title)
+
+
+def draw_boxplot(ax: Axes, data: Optional[dict], theme: str = "light", title: Optional[str] = None) -> None:
+    colors = THEMES[theme]
+    if data is not None:
+        stats = {
+            "med": data["median"],
+            "q1": data["q1"],
+            "q3": data["q3"],
+            "whislo": data["whisker_lo"],
+            "whishi": data["whisker_hi"],
+            "fliers": np.asarray(data["outliers"]),
+        }
+        ax.bxp(
+            [stats],
+            orientation="horizontal",
+            widths=0.6,
+            patch_artist=True,
+            boxprops={"facecolor": colors["bar"], "edgecolor": colors["fg"]},
+            medianprops={"color": colors["fg"], "linewidth": 1.5},
+            whiskerprops={"color": colors["fg"]},
+            capprops={"color": colors["fg"]},
+            flierprops={"marker": "d", "markerfacecolor": colors["fg"], "markeredgecolor": colors["fg"], "markersize": 4},
+        )
+        ax.set_yticks([])
+    _title(ax, theme, title)
+
+
+def draw_bar_chart(
+    ax: Axes, data: dict, theme: str = "light", title: Optional[str] = None, xlabel: Optional[str] = None
+) -> None:
+    colors = THEMES[theme]
+    labels: Sequence[str] = data["labels"]
+    pos = np.arange(len(labels))
+    ax.barh(pos, data["counts"], color=colors["bar"])
+    ax.set_yticks(pos)
+    ax.set_yticklabels(labels)
+    ax.invert_yaxis()
+    if xlabel:
+        ax.set_xlabel(xlabel)
+    _title(ax, theme, title)
+
+
+def draw_scatter(
+    ax: Axes,
+    data: Optional[dict],
+    theme: str = "light",
+    title: Optional[str] = None,
+    xlabel: Optional[str] = None,
+    ylabel: Optional[str] = None,
+) -> None:
+    colors = THEMES[theme]
+    if data is not None:
+        if "density" in data:
+            (x0, x1), (y0, y1) = data["xlim"], data["ylim"]
+            density = np.ma.masked_equal(data["density"].T, 0)
+            ax.imshow(
+                density,
+                origin="lower",
+                extent=(x0, x1, y0, y1),
+                aspect="auto",
+                cmap=colors["density"],
+                interpolation="nearest",
+            )
+        else:
+            ax.scatter(data["x"], data["y"], s=14, color=colors["bar"], alpha=0.7, edgecolors="none")
+    if xlabel:
+        ax.set_xlabel(xlabel)
+    if ylabel:
+        ax.set_ylabel(ylabel)
+    _title(ax, theme, title)
+
+
+def draw_scree(
+    ax: Axes, eigenvalues: Sequence[float], theme: str = "light", title: Optional[str] = None, top: int = 30
+) -> None:
+    colors = THEMES[theme]
+    vals = np.asarray(eigenvalues, dtype=float)[:top]
+    pos = np.arange(1, vals.size + 1)
+    ax.plot(pos, vals, marker="o", markersize=4, color=colors["bar"], linewidth=1.5)
+    # Kaiser criterion: components above 1 explain more than one item.
+    ax.axhline(1.0, color=colors["fg"], linestyle="--", linewidth=0.8)
+    ax.set_xlabel("Component")
+    ax.set_ylabel("Eigenvalue")
+    _title(ax, theme, title)
+
@@ -0,0 +1,141 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Tried in order; the first that splits answers into a small option set wins.
+MULTI_DELIMITERS = [";", "|", ","]
+
+
+# ------------------------------------------------------------
+# Detection and parsing of multi-select ("A;C;D") answers
+# ------------------------------------------------------------
+def detect_delimiter(
+    values: pd.Series,
+    max_options: int = 50,
+    min_share: float = 0.1,
+    max_words: int = 4,
+) -> Optional[str]:
+    """Delimiter of a multiple-response column, or None.
+
+    A delimiter qualifies when at least ``min_share`` of the answers contain
+    it and splitting yields at most ``max_options`` distinct short options
+    (at most ``max_words`` words), fewer than the distinct raw answers.
+    Free text with commas fails the option-count and length tests.
+    """
+    s = values.dropna().astype(str)
+    if s.empty:
+        return None
+    raw_distinct = s.nunique()
+    for delim in MULTI_DELIMITERS:
+        if s.str.contains(delim, regex=False).mean() < min_share:
+            continue
+        options = s.str.split(delim, regex=False).explode().str.strip()
+        options = options[options != ""]
+        distinct = options.unique()
+        if not 2 <= len(distinct) <= max_options or len(distinct) >= raw_distinct:
+            continue
+        if pd.Series(distinct).str.split().str.len().max() > max_words:
+            continue
+        return delim
+    return None
+
+
+def indicator_matrix(series: pd.Series, delimiter: str) -> Tuple[sparse.csr_matrix, List[str]]:
+    """Rows x options sparse 0/1 matrix from one vectorized split.
+
+    Distinct answers are split once and their rows gathered for every
+    respondent. Options are ordered by how many respondents chose them.
+    A missing or empty answer gives an all-zero row.
+    """
+    answer_codes, answers = pd.factorize(series)
+    parts = pd.Series(answers, dtype="string").str.split(delimiter, regex=False)
+    per_answer = parts.str.len().to_numpy(dtype=np.int64)
+    owner = np.repeat(np.arange(len(answers)), per_answer)
+    tokens = parts.explode().str.strip().to_numpy(dtype=object, na_value="")
+    keep = tokens != ""
+    codes, options = pd.factorize(tokens[keep])
+    distinct = sparse.csr_matrix(
+        (np.ones(codes.size, dtype=np.int32), (owner[keep], codes)),
+        shape=(len(answers) + 1, len(options)),
+    )
+    # A repeated option within one answer counts once.
+    distinct.data = np.minimum(distinct.data, 1)
+    # Missing answers (code -1) pick the all-zero last row.
+    ind = distinct[np.where(answer_codes >= 0, answer_codes, len(answers))]
+    counts = np.asarray(ind.sum(axis=0)).ravel()
+    order = np.argsort(-counts, kind="stable")
+    return ind[:, order].tocsr(), [str(options[i]) for i in order]
+
+
+# ------------------------------------------------------------
+# Frequencies, co-selection and crosstabs from the indicator matrix
+# ------------------------------------------------------------
+def _row_weights(ind: sparse.csr_matrix, weights: Optional[np.ndarray]) -> np.ndarray:
+    return np.ones(ind.shape[0]) if weights is None else np.asarray(weights, dtype=float)
+
+
+def option_frequencies(
+    ind: sparse.csr_matrix, options: List[str], weights: Optional[np.ndarray] = None
+) -> pd.DataFrame:
+    """Respondents per option, as a share of respondents who answered and of all mentions.
+
+    With ``weights`` (one per row) counts are summed weights.
+    """
+    w = _row_weights(ind, weights)
+    counts = ind.T @ w
+    answered = w[ind.getnnz(axis=1) > 0].sum()
+    mentions = counts.sum()
+    return pd.DataFrame(
+        {
+            "option": options,
+            "count": counts if weights is not None else counts.astype(np.int64),
+            "pct_respondents": np.round(counts / max(answered, 1) * 100, 2),
+            "pct_mentions": np.round(counts / max(mentions, 1) * 100, 2),
+        }
+    )
+
+
+def co_selection(
+    ind: sparse.csr_matrix, options: List[str], weights: Optional[np.ndarray] = None
+) -> pd.DataFrame:
+    """Respondents choosing both options (X.T @ W @ X); the diagonal is each option's count."""
+    if weights is None:
+        x = ind.astype(np.int64)
+        return pd.DataFrame((x.T @ x).toarray(), index=options, columns=options)
+    x = ind.astype(float)
+    both = x.T @ sparse.diags(np.asarray(weights, dtype=float)) @ x
+    return pd.DataFrame(both.toarray(), index=options, columns=options)
+
+
+def multi_crosstab(
+    ind: sparse.csr_matrix, options: List[str], by: pd.Series, weights: Optional[np.ndarray] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Option counts per category of ``by`` and the percentage of each
+    category's answering respondents that chose the option."""
+    codes, groups = pd.factorize(by, sort=True)
+    valid = codes >= 0
+    dtype = np.int64 if weights is None else float
+    g = sparse.csr_matrix(
+        (_row_weights(ind, weights)[valid].astype(dtype), (np.flatnonzero(valid), codes[valid])),
+        shape=(ind.shape[0], len(groups)),
+    )
+    counts = (ind.astype(dtype).T @ g).toarray()
+    answered = np.asarray(g.T @ (ind.getnnz(axis=1) > 0).astype(dtype)).ravel()
+    columns = pd.Index(groups, name=by.name)
+    table = pd.DataFrame(counts, index=pd.Index(options, name="option"), columns=columns)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = pd.DataFrame(
+            np.round(counts / answered * 100, 2), index=table.index, columns=columns
+        )
+    return table, pct
+
+
+def subset_rows(ind: sparse.csr_matrix, options: List[str], rows: np.ndarray) -> Tuple[sparse.csr_matrix, List[str]]:
+    """The indicator matrix of a subset of respondents, as ``indicator_matrix`` would build it:
+    options nobody in the subset chose are dropped and the rest ordered by count."""
+    sub = ind[rows]
+    counts = np.asarray(sub.sum(axis=0)).ravel()
+    order = np.argsort(-counts, kind="stable")[: int((counts > 0).sum())]
+    return sub[:, order].tocsr(), [options[i] for i in order]
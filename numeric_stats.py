@@ -0,0 +1,229 @@
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from query_engine import normaltest_from_moments
+from sketches import SKETCH_MIN_VALUES, column_sketch
+
+STAT_COLUMNS = [
+    "count", "sum", "mean", "median", "q1", "q3", "mode", "min", "max",
+    "std", "skew", "kurtosis", "normaltest_stat", "normaltest_p",
+]
+# Integer columns spanning at most this many values get a bincount mode.
+BINCOUNT_MAX_RANGE = 10_000
+
+
+# ------------------------------------------------------------
+# Column-batched descriptive statistics
+# ------------------------------------------------------------
+def _sorted_quantile(s: np.ndarray, n: np.ndarray, q: float) -> np.ndarray:
+    """Linear-interpolated quantile (pandas default) of rows sorted NaN-last."""
+    pos = np.maximum(n - 1, 0) * q
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.ceil(pos).astype(np.int64)
+    a = np.take_along_axis(s, lo[:, None], axis=1)[:, 0]
+    b = np.take_along_axis(s, hi[:, None], axis=1)[:, 0]
+    return a + (b - a) * (pos - lo)
+
+
+def _mode(row: np.ndarray, integer: bool, presorted: bool = True):
+    """Most frequent value of one NaN-free row; ties go to the smallest."""
+    lo, hi = (row[0], row[-1]) if presorted else (row.min(), row.max())
+    if integer and hi - lo <= BINCOUNT_MAX_RANGE:
+        return np.bincount((row - lo).astype(np.int64)).argmax() + lo
+    if not presorted:
+        counts = pd.Series(row).value_counts()
+        return counts.index[counts.to_numpy() == counts.iloc[0]].min()
+    starts = np.flatnonzero(np.r_[True, row[1:] != row[:-1]])
+    runs = np.diff(np.r_[starts, row.size])
+    return row[starts[runs.argmax()]]
+
+
+def _describe_block(x: np.ndarray, sketch: bool = False) -> np.ndarray:
+    # Rows of the transpose are columns: sorting contiguous memory is faster.
+    xt = np.ascontiguousarray(x.T)
+    valid = np.isfinite(xt)
+    xt = np.where(valid, xt, np.nan)
+    n = valid.sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Central moments from one zero-filled copy, updated in place.
+        d = np.where(valid, xt, 0.0)
+        total = d.sum(axis=1)
+        mean = total / n
+        integer = np.all(d == np.round(d), axis=1)
+        d -= np.where(n > 0, mean, 0.0)[:, None]
+        d[~valid] = 0.0
+        d2 = d * d
+        m2 = d2.sum(axis=1) / n
+        d *= d2
+        m3 = d.sum(axis=1) / n
+        d2 *= d2
+        m4 = d2.sum(axis=1) / n
+        std = np.sqrt(m2 * n / (n - 1))
+        skew = m3 / m2**1.5
+        kurt = m4 / m2**2
+
+    out = np.full((xt.shape[0], len(STAT_COLUMNS)), np.nan)
+    out[:, 0] = n
+    out[:, 1] = total
+    out[:, 2] = mean
+    out[:, 9] = std
+    out[:, 10] = skew
+    out[:, 11] = kurt - 3.0
+    if sketch:
+        # Quantiles from a KLL sketch fed in chunks; no column is ever sorted.
+        for i in np.flatnonzero(n > 0):
+            row = xt[i, valid[i]]
+            sk = column_sketch(row)
+            out[i, 4], out[i, 3], out[i, 5] = sk.quantiles([0.25, 0.5, 0.75])
+            out[i, 7], out[i, 8] = sk.min, sk.max
+            out[i, 6] = _mode(row, bool(integer[i]), presorted=False)
+    else:
+        s = np.sort(xt, axis=1)
+        out[:, 3] = _sorted_quantile(s, n, 0.5)
+        out[:, 4] = _sorted_quantile(s, n, 0.25)
+        out[:, 5] = _sorted_quantile(s, n, 0.75)
+        out[:, 7] = s[:, 0]
+        out[:, 8] = np.take_along_axis(s, np.maximum(n - 1, 0)[:, None], axis=1)[:, 0]
+        for i in np.flatnonzero(n > 0):
+            out[i, 6] = _mode(s[i, : n[i]], bool(integer[i]))
+    for i in np.flatnonzero((n >= 8) & (m2 > 0)):
+        out[i, 12], out[i, 13] = normaltest_from_moments(n[i], skew[i], kurt[i])
+    return out
+
+
+def _describe_block_weighted(x: np.ndarray, w: np.ndarray) -> np.ndarray:
+    xt = np.ascontiguousarray(x.T)
+    valid = np.isfinite(xt)
+    n = valid.sum(axis=1)
+    wv = np.where(valid, w[None, :], 0.0)
+    x0 = np.where(valid, xt, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sw = wv.sum(axis=1)
+        sw2 = (wv * wv).sum(axis=1)
+        total = (wv * x0).sum(axis=1)
+        mean = total / sw
+        integer = np.all(x0 == np.round(x0), axis=1)
+        d = np.where(valid, x0 - mean[:, None], 0.0)
+        d2 = d * d
+        m2 = (wv * d2).sum(axis=1) / sw
+        m3 = (wv * d2 * d).sum(axis=1) / sw
+        m4 = (wv * d2 * d2).sum(axis=1) / sw
+        # Reliability-weight variance: equals the sample variance for unit weights.
+        std = np.sqrt(m2 * sw / (sw - sw2 / sw))
+        skew = m3 / m2**1.5
+        kurt = m4 / m2**2
+        n_eff = sw * sw / sw2
+
+    order = np.argsort(np.where(valid, xt, np.nan), axis=1)
+    s = np.take_along_axis(xt, order, axis=1)
+    cum = np.cumsum(np.take_along_axis(wv, order, axis=1), axis=1)
+
+    out = np.full((xt.shape[0], len(STAT_COLUMNS)), np.nan)
+    out[:, 0] = n
+    out[:, 1] = total
+    out[:, 2] = mean
+    out[:, 9] = std
+    out[:, 10] = skew
+    out[:, 11] = kurt - 3.0
+    for i in np.flatnonzero(n > 0):
+        row, cw = s[i, : n[i]], cum[i, : n[i]]
+        weights = np.diff(np.r_[0.0, cw])
+        # Weighted linear interpolation; with unit weights this is pandas' default.
+        span = cw[-1] - weights[-1]
+        pos = (cw - weights) / span if span > 0 else np.zeros(n[i])
+        out[i, 3:6] = np.interp([0.5, 0.25, 0.75], pos, row)
+        out[i, 7], out[i, 8] = row[0], row[-1]
+        if integer[i] and row[-1] - row[0] <= BINCOUNT_MAX_RANGE:
+            out[i, 6] = np.bincount((row - row[0]).astype(np.int64), weights=weights).argmax() + row[0]
+        else:
+            starts = np.flatnonzero(np.r_[True, row[1:] != row[:-1]])
+            out[i, 6] = row[starts[np.add.reduceat(weights, starts).argmax()]]
+        if n_eff[i] >= 8 and m2[i] > 0:
+            out[i, 12], out[i, 13] = normaltest_from_moments(n_eff[i], skew[i], kurt[i])
+    return out
+
+
+def describe_numeric(
+    df: pd.DataFrame, cols: Sequence, batch_cells: int = 4_000_000, weights: Optional[np.ndarray] = None
+) -> pd.DataFrame:
+    """All descriptive statistics for ``cols`` as one table, one row per column.
+
+    Columns are processed in batches of about ``batch_cells`` values; each
+    batch is sorted once (median, quartiles, min, max, mode) and reduced
+    once for the moments, whose skewness and kurtosis give the D'Agostino
+    K² normality test directly. From ``SKETCH_MIN_VALUES`` rows on, the
+    median and quartiles come from per-column quantile sketches instead of
+    a sort. With ``weights`` (one per row) the sum, moments, quantiles and
+    mode are weighted and the normality test uses the Kish effective n;
+    ``count`` stays the number of respondents. Columns without values get
+    a zero count.
+    """
+    cols = list(cols)
+    sketch = len(df) >= SKETCH_MIN_VALUES
+    step = max(1, batch_cells // max(len(df), 1))
+    parts = []
+    for i in range(0, len(cols), step):
+        block = df[cols[i : i + step]].to_numpy(dtype=float, na_value=np.nan)
+        if weights is not None:
+            parts.append(_describe_block_weighted(block, np.asarray(weights, dtype=float)))
+        else:
+            parts.append(_describe_block(block, sketch))
+    values = np.vstack(parts) if parts else np.zeros((0, len(STAT_COLUMNS)))
+    table = pd.DataFrame(values, index=pd.Index(cols), columns=STAT_COLUMNS)
+    table["count"] = table["count"].astype(np.int64)
+    return table
+
+
+# ------------------------------------------------------------
+# Pairwise-complete correlation from co-moment products
+# ------------------------------------------------------------
+def pairwise_corr(
+    df: pd.DataFrame, cols: Sequence, weights: Optional[np.ndarray] = None, batch_cells: int = 4_000_000
+) -> pd.DataFrame:
+    """Pearson correlation matrix over pairwise-complete rows, like ``DataFrame.corr``.
+
+    Rows are read in batches of about ``batch_cells`` values and each batch
+    adds its weighted counts, sums, sums of squares and cross-products per
+    column pair as BLAS products; batches without missing values need only
+    the cross-product. Columns are shifted by their mean first so the
+    co-moments do not cancel. With ``weights`` (one per row) the
+    correlations are weighted.
+    """
+    cols = list(cols)
+    p = len(cols)
+    shift = df[cols].mean().to_numpy(dtype=float, na_value=0.0)
+    shift = np.nan_to_num(shift)
+    w_all = None if weights is None else np.asarray(weights, dtype=float)
+    sw = np.zeros((p, p))
+    s1 = np.zeros((p, p))
+    s2 = np.zeros((p, p))
+    sxy = np.zeros((p, p))
+    step = max(1, batch_cells // max(p, 1))
+    for start in range(0, len(df), step):
+        x = df[cols].iloc[start : start + step].to_numpy(dtype=float, na_value=np.nan) - shift
+        valid = np.isfinite(x)
+        x0 = np.where(valid, x, 0.0)
+        w = np.ones(len(x)) if w_all is None else w_all[start : start + step]
+        xw = x0 * w[:, None]
+        sxy += xw.T @ x0
+        if valid.all():
+            # Every pair sees every row: the per-pair sums are column sums.
+            sw += w.sum()
+            s1 += xw.sum(axis=0)[:, None]
+            s2 += (xw * x0).sum(axis=0)[:, None]
+            continue
+        v = valid * w[:, None]
+        sw += v.T @ valid
+        s1 += xw.T @ valid
+        s2 += (xw * x0).T @ valid
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sw * sxy - s1 * s1.T
+        var_x = sw * s2 - s1 * s1
+        r = cov / np.sqrt(var_x * var_x.T)
+    r = np.clip(r, -1.0, 1.0)
+    np.fill_diagonal(r, np.where(np.diag(var_x) > 0, 1.0, np.nan))
+    return pd.DataFrame(r, index=cols, columns=cols)
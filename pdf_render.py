@@ -0,0 +1,462 @@
+from io import BytesIO
+from typing import List, Optional, Sequence
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from PIL import Image
+from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Table, TableStyle
+
+BAR_COLOR = colors.HexColor("#4c72b0")
+LINE_COLOR = colors.HexColor("#1f3b63")
+AXIS_COLOR = colors.HexColor("#444444")
+
+# ------------------------------------------------------------
+# Canvas layout helper
+# ------------------------------------------------------------
+class PageCursor:
+    """Tracks the vertical write position on a reportlab canvas."""
+
+    def __init__(self, c, width: float, height: float, margin: float = 30):
+        self.c = c
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.y = height - margin
+
+    @property
+    def content_width(self) -> float:
+        return self.width - 2 * self.margin
+
+    def new_page(self) -> None:
+        self.c.showPage()
+        self.y = self.height - self.margin
+
+    def ensure(self, needed: float) -> None:
+        if self.y - needed < self.margin:
+            self.new_page()
+
+
+def draw_table(cursor: PageCursor, rows: List[Sequence], col_widths=None, font_size: float = 8) -> None:
+    """Draw rows (first row is the header) as a platypus Table, splitting across pages."""
+    table = Table(rows, colWidths=col_widths, repeatRows=1, hAlign="LEFT")
+    table.setStyle(
+        TableStyle(
+            [
+                ("FONT", (0, 0), (-1, -1), "Helvetica", font_size),
+                ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", font_size),
+                ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.9, 0.9, 0.9)),
+                ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.grey),
+                ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+                ("TOPPADDING", (0, 0), (-1, -1), 1),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
+            ]
+        )
+    )
+    pending = [table]
+    while pending:
+        part = pending.pop(0)
+        avail = cursor.y - cursor.margin
+        _, h = part.wrapOn(cursor.c, cursor.content_width, avail)
+        if h <= avail:
+            part.drawOn(cursor.c, cursor.margin, cursor.y - h)
+            cursor.y -= h + 6
+            continue
+        pieces = part.split(cursor.content_width, avail)
+        if len(pieces) < 2:
+            # Not even the header and one row fit here: start a new page.
+            cursor.new_page()
+            pending.insert(0, part)
+            continue
+        pending = list(pieces) + pending
+
+
+# ------------------------------------------------------------
+# Tiled heatmap for large matrices
+# ------------------------------------------------------------
+COLOR_LEVELS = 21
+
+
+def _color_bins(values: np.ndarray, vmin: float, vmax: float, cmap_name: str):
+    cmap = matplotlib.colormaps[cmap_name]
+    levels = np.linspace(0, 1, COLOR_LEVELS)
+    palette = [colors.Color(*cmap(v)[:3]) for v in levels]
+    scaled = np.clip((values - vmin) / (vmax - vmin), 0, 1)
+    bins = np.rint(scaled * (COLOR_LEVELS - 1)).astype(int)
+    bins[~np.isfinite(values)] = -1
+    return bins, palette
+
+
+def _short(label, n: int) -> str:
+    label = str(label)
+    return label if len(label) <= n else label[: n - 1] + "…"
+
+
+def format_count(cnt) -> str:
+    """A count as text; weighted (fractional) counts get 2 decimals, like the app's tables."""
+    cnt = float(cnt)
+    return f"{cnt:.0f}" if cnt.is_integer() else f"{cnt:.2f}"
+
+
+def draw_matrix_heatmap(
+    cursor: PageCursor,
+    matrix: pd.DataFrame,
+    tile_size: int = 30,
+    vmin: float = -1.0,
+    vmax: float = 1.0,
+    cmap_name: str = "coolwarm",
+    label_chars: int = 16,
+) -> None:
+    """Draw a matrix as colored cells, tile by tile.
+
+    Cells are grouped by color level and each level is filled as one path,
+    so the content stream holds one fill per color rather than one text
+    object per cell. Values are printed only when cells are big enough to
+    read them.
+    """
+    c = cursor.c
+    values = matrix.to_numpy(dtype=float)
+    bins, palette = _color_bins(values, vmin, vmax, cmap_name)
+    n_rows, n_cols = values.shape
+    label_w = 5.0 * label_chars
+    grid_w = cursor.content_width - label_w
+
+    for r0 in range(0, n_rows, tile_size):
+        for c0 in range(0, n_cols, tile_size):
+            r1 = min(r0 + tile_size, n_rows)
+            c1 = min(c0 + tile_size, n_cols)
+            cell = min(grid_w / (c1 - c0), 24.0)
+            header_h = label_w
+            cursor.ensure(header_h + cell * (r1 - r0) + 20)
+            if n_rows > tile_size or n_cols > tile_size:
+                c.setFont("Helvetica-Oblique", 7)
+                c.drawString(
+                    cursor.margin,
+                    cursor.y - 8,
+                    f"rows {r0 + 1}-{r1} / {n_rows}, columns {c0 + 1}-{c1} / {n_cols}",
+                )
+                cursor.y -= 12
+            x0 = cursor.margin + label_w
+            top = cursor.y - header_h
+
+            label_size = min(7.0, cell * 0.8)
+            c.setFont("Helvetica", label_size)
+            for j in range(c0, c1):
+                c.saveState()
+                c.translate(x0 + (j - c0 + 0.6) * cell, top + 2)
+                c.rotate(90)
+                c.drawString(0, 0, _short(matrix.columns[j], label_chars))
+                c.restoreState()
+            for i in range(r0, r1):
+                c.drawRightString(
+                    x0 - 2, top - (i - r0 + 0.7) * cell, _short(matrix.index[i], label_chars)
+                )
+
+            tile_bins = bins[r0:r1, c0:c1]
+            for level in np.unique(tile_bins):
+                if level < 0:
+                    continue
+                path = c.beginPath()
+                for i, j in zip(*np.nonzero(tile_bins == level)):
+                    path.rect(x0 + j * cell, top - (i + 1) * cell, cell, cell)
+                c.setFillColor(palette[level])
+                c.drawPath(path, fill=1, stroke=0)
+
+            if cell >= 18:
+                c.setFillColor(colors.black)
+                c.setFont("Helvetica", min(6.5, cell * 0.32))
+                for i in range(r0, r1):
+                    for j in range(c0, c1):
+                        v = values[i, j]
+                        if np.isfinite(v):
+                            c.drawCentredString(
+                                x0 + (j - c0 + 0.5) * cell,
+                                top - (i - r0 + 0.65) * cell,
+                                f"{v:.2f}",
+                            )
+            c.setFillColor(colors.black)
+            cursor.y = top - cell * (r1 - r0) - 8
+
+    _draw_color_legend(cursor, palette, vmin, vmax)
+
+
+def _draw_color_legend(cursor: PageCursor, palette, vmin: float, vmax: float) -> None:
+    c = cursor.c
+    cursor.ensure(24)
+    step = 10.0
+    x = cursor.margin
+    y = cursor.y - 10
+    for i, color in enumerate(palette):
+        c.setFillColor(color)
+        c.rect(x + i * step, y, step, 8, fill=1, stroke=0)
+    c.setFillColor(colors.black)
+    c.setFont("Helvetica", 7)
+    c.drawString(x, y - 8, f"{vmin:g}")
+    c.drawRightString(x + len(palette) * step, y - 8, f"{vmax:g}")
+    cursor.y = y - 16
+
+
+# ------------------------------------------------------------
+# Vector charts drawn straight onto the canvas
+# ------------------------------------------------------------
+def _fmt(v: float) -> str:
+    return f"{v:.4g}"
+
+
+def _chart_frame(cursor: PageCursor, title: str, height: float):
+    """Reserve space for a chart and return its plot box (x0, y0, w, h)."""
+    c = cursor.c
+    cursor.ensure(height + 24)
+    c.setFillColor(colors.black)
+    c.setFont("Helvetica-Bold", 9)
+    c.drawString(cursor.margin, cursor.y - 10, title)
+    x0 = cursor.margin + 40
+    w = cursor.content_width - 50
+    y0 = cursor.y - height - 4
+    h = height - 26
+    c.setStrokeColor(AXIS_COLOR)
+    c.setLineWidth(0.5)
+    c.line(x0, y0, x0 + w, y0)
+    cursor.y = y0 - 24
+    return x0, y0, w, h
+
+
+def _x_ticks(c, x0, y0, w, lo, hi, n: int = 5) -> None:
+    c.setFont("Helvetica", 6.5)
+    c.setFillColor(AXIS_COLOR)
+    for v in np.linspace(lo, hi, n):
+        x = x0 + (v - lo) / (hi - lo) * w if hi > lo else x0 + w / 2
+        c.line(x, y0, x, y0 - 2)
+        c.drawCentredString(x, y0 - 9, _fmt(v))
+
+
+def draw_histogram(cursor: PageCursor, data: dict, title: str, height: float = 140) -> None:
+    c = cursor.c
+    x0, y0, w, h = _chart_frame(cursor, title, height)
+    counts, edges = data["counts"], data["edges"]
+    lo, hi = float(edges[0]), float(edges[-1])
+    top = float(counts.max()) or 1.0
+    if "kde_y" in data:
+        top = max(top, float(np.max(data["kde_y"])))
+    span = (hi - lo) or 1.0
+
+    path = c.beginPath()
+    for cnt, left, right in zip(counts, edges[:-1], edges[1:]):
+        if cnt <= 0:
+            continue
+        path.rect(x0 + (left - lo) / span * w, y0, (right - left) / span * w, cnt / top * h)
+    c.setFillColor(BAR_COLOR, alpha=0.75)
+    c.setStrokeColor(colors.white)
+    c.setLineWidth(0.3)
+    c.drawPath(path, fill=1, stroke=1)
+
+    if "kde_y" in data:
+        line = c.beginPath()
+        xs = x0 + (data["kde_x"] - lo) / span * w
+        ys = y0 + data["kde_y"] / top * h
+        line.moveTo(xs[0], ys[0])
+        for x, y in zip(xs[1:], ys[1:]):
+            line.lineTo(x, y)
+        c.setStrokeColor(LINE_COLOR)
+        c.setLineWidth(1)
+        c.drawPath(line, fill=0, stroke=1)
+
+    c.setStrokeColor(AXIS_COLOR)
+    c.setLineWidth(0.5)
+    c.line(x0, y0, x0, y0 + h)
+    c.setFont("Helvetica", 6.5)
+    c.setFillColor(AXIS_COLOR)
+    c.drawRightString(x0 - 3, y0 + h - 3, _fmt(top))
+    c.drawRightString(x0 - 3, y0, "0")
+    _x_ticks(c, x0, y0, w, lo, hi)
+
+
+def draw_boxplot(cursor: PageCursor, data: dict, title: str, height: float = 70) -> None:
+    c = cursor.c
+    x0, y0, w, h = _chart_frame(cursor, title, height)
+    lo = min(data["min"], data["whisker_lo"])
+    hi = max(data["max"], data["whisker_hi"])
+    span = (hi - lo) or 1.0
+
+    def sx(v):
+        return x0 + (v - lo) / span * w
+
+    mid = y0 + h / 2
+    box_h = h * 0.6
+    c.setStrokeColor(LINE_COLOR)
+    c.setLineWidth(0.8)
+    c.setFillColor(BAR_COLOR, alpha=0.6)
+    c.rect(sx(data["q1"]), mid - box_h / 2, sx(data["q3"]) - sx(data["q1"]), box_h, fill=1, stroke=1)
+    c.setLineWidth(1.4)
+    c.line(sx(data["median"]), mid - box_h / 2, sx(data["median"]), mid + box_h / 2)
+    c.setLineWidth(0.8)
+    c.line(sx(data["whisker_lo"]), mid, sx(data["q1"]), mid)
+    c.line(sx(data["q3"]), mid, sx(data["whisker_hi"]), mid)
+    for v in (data["whisker_lo"], data["whisker_hi"]):
+        c.line(sx(v), mid - box_h / 4, sx(v), mid + box_h / 4)
+
+    outliers = data["outliers"]
+    if len(outliers):
+        path = c.beginPath()
+        for v in outliers:
+            path.circle(sx(v), mid, 1.2)
+        c.setFillColor(LINE_COLOR)
+        c.drawPath(path, fill=1, stroke=0)
+    c.setStrokeColor(AXIS_COLOR)
+    c.setLineWidth(0.5)
+    _x_ticks(c, x0, y0, w, lo, hi)
+
+
+def draw_bar_chart(cursor: PageCursor, data: dict, title: str, label_chars: int = 24) -> None:
+    c = cursor.c
+    labels, counts = data["labels"], data["counts"]
+    if not len(counts):
+        return
+    bar_h = 9.0
+    height = bar_h * len(counts) + 30
+    cursor.ensure(height + 24)
+    c.setFillColor(colors.black)
+    c.setFont("Helvetica-Bold", 9)
+    c.drawString(cursor.margin, cursor.y - 10, title)
+    x0 = cursor.margin + 5.0 * label_chars
+    w = cursor.content_width - 5.0 * label_chars - 40
+    top_y = cursor.y - 18
+    top = float(max(counts)) or 1.0
+
+    path = c.beginPath()
+    for i, cnt in enumerate(counts):
+        path.rect(x0, top_y - (i + 1) * bar_h + 1, cnt / top * w, bar_h - 2)
+    c.setFillColor(BAR_COLOR)
+    c.drawPath(path, fill=1, stroke=0)
+
+    c.setFont("Helvetica", 6.5)
+    c.setFillColor(AXIS_COLOR)
+    for i, (label, cnt) in enumerate(zip(labels, counts)):
+        y = top_y - (i + 1) * bar_h + 2.5
+        c.drawRightString(x0 - 3, y, _short(label, label_chars))
+        c.drawString(x0 + cnt / top * w + 3, y, format_count(cnt))
+    cursor.y = top_y - len(counts) * bar_h - 10
+
+
+def _scatter_body(c, data: dict, x0: float, y0: float, w: float, h: float) -> None:
+    (xlo, xhi), (ylo, yhi) = data["xlim"], data["ylim"]
+    xspan = (xhi - xlo) or 1.0
+    yspan = (yhi - ylo) or 1.0
+    if "density" in data:
+        density = data["density"].T[::-1]
+        scaled = np.log1p(density) / (np.log1p(density.max()) or 1.0)
+        rgba = (matplotlib.colormaps["Blues"](scaled) * 255).astype(np.uint8)
+        rgba[density == 0] = (255, 255, 255, 255)
+        buf = BytesIO()
+        Image.fromarray(rgba[:, :, :3]).save(buf, format="PNG", optimize=True)
+        buf.seek(0)
+        c.drawImage(ImageReader(buf), x0, y0, width=w, height=h)
+    else:
+        radius = 1.3 if h > 80 else 0.8
+        path = c.beginPath()
+        for x, y in zip(data["x"], data["y"]):
+            path.circle(x0 + (x - xlo) / xspan * w, y0 + (y - ylo) / yspan * h, radius)
+        c.setFillColor(BAR_COLOR, alpha=0.6)
+        c.drawPath(path, fill=1, stroke=0)
+
+
+def draw_scatter(cursor: PageCursor, data: dict, title: str, height: float = 150) -> None:
+    """Sparse pairs become vector dots; dense pairs a small density raster."""
+    c = cursor.c
+    x0, y0, w, h = _chart_frame(cursor, title, height)
+    (xlo, xhi), (ylo, yhi) = data["xlim"], data["ylim"]
+    _scatter_body(c, data, x0, y0, w, h)
+
+    c.setStrokeColor(AXIS_COLOR)
+    c.setLineWidth(0.5)
+    c.line(x0, y0, x0, y0 + h)
+    c.setFont("Helvetica", 6.5)
+    c.setFillColor(AXIS_COLOR)
+    c.drawRightString(x0 - 3, y0 + h - 3, _fmt(yhi))
+    c.drawRightString(x0 - 3, y0, _fmt(ylo))
+    _x_ticks(c, x0, y0, w, xlo, xhi)
+
+
+def draw_scatter_tiles(
+    cursor: PageCursor, tiles: List[Sequence[Optional[dict]]], per_row: int, tile_height: float = 110
+) -> None:
+    """A grid of small scatter plots on the page itself; ``tiles`` is a list of rows.
+
+    Each tile is ``{"title", "data"}`` (scatter_data geometry) or None for
+    an empty cell. Rows move to a new page only when they do not fit.
+    """
+    c = cursor.c
+    tile_w = cursor.content_width / per_row
+    for row in tiles:
+        cursor.ensure(tile_height)
+        top = cursor.y
+        for col, tile in enumerate(row):
+            if tile is None:
+                continue
+            left = cursor.margin + col * tile_w
+            x0, y0 = left + 24, top - tile_height + 14
+            w, h = tile_w - 30, tile_height - 28
+            c.setFillColor(colors.black)
+            c.setFont("Helvetica-Bold", 6.5)
+            c.drawString(left + 2, top - 8, _short(tile["title"], int(tile_w / 3.6)))
+            data = tile["data"]
+            if data is None:
+                continue
+            _scatter_body(c, data, x0, y0, w, h)
+            (xlo, xhi), (ylo, yhi) = data["xlim"], data["ylim"]
+            c.setStrokeColor(AXIS_COLOR)
+            c.setLineWidth(0.4)
+            c.rect(x0, y0, w, h, fill=0, stroke=1)
+            c.setFont("Helvetica", 5)
+            c.setFillColor(AXIS_COLOR)
+            c.drawRightString(x0 - 2, y0 + h - 4, _fmt(yhi))
+            c.drawRightString(x0 - 2, y0, _fmt(ylo))
+            c.drawString(x0, y0 - 7, _fmt(xlo))
+            c.drawRightString(x0 + w, y0 - 7, _fmt(xhi))
+        cursor.y = top - tile_height
+
+
+def draw_scree(cursor: PageCursor, eigenvalues: Sequence[float], title: str, height: float = 130, top: int = 30) -> None:
+    """Eigenvalues by component as a line with markers and a dashed Kaiser line at 1."""
+    c = cursor.c
+    vals = np.asarray(eigenvalues, dtype=float)[:top]
+    if not vals.size:
+        return
+    x0, y0, w, h = _chart_frame(cursor, title, height)
+    hi = max(float(vals.max()), 1.0)
+    lo = min(float(vals.min()), 0.0)
+    span = (hi - lo) or 1.0
+    step = w / max(vals.size - 1, 1)
+    xs = x0 + np.arange(vals.size) * step
+    ys = y0 + (vals - lo) / span * h
+
+    c.setStrokeColor(AXIS_COLOR)
+    c.setLineWidth(0.5)
+    c.setDash(2, 2)
+    c.line(x0, y0 + (1.0 - lo) / span * h, x0 + w, y0 + (1.0 - lo) / span * h)
+    c.setDash()
+    line = c.beginPath()
+    line.moveTo(xs[0], ys[0])
+    for x, y in zip(xs[1:], ys[1:]):
+        line.lineTo(x, y)
+    c.setStrokeColor(LINE_COLOR)
+    c.setLineWidth(1)
+    c.drawPath(line, fill=0, stroke=1)
+    dots = c.beginPath()
+    for x, y in zip(xs, ys):
+        dots.circle(x, y, 1.6)
+    c.setFillColor(BAR_COLOR)
+    c.drawPath(dots, fill=1, stroke=0)
+
+    c.setStrokeColor(AXIS_COLOR)
+    c.setLineWidth(0.5)
+    c.line(x0, y0, x0, y0 + h)
+    c.setFont("Helvetica", 6.5)
+    c.setFillColor(AXIS_COLOR)
+    c.drawRightString(x0 - 3, y0 + h - 3, _fmt(hi))
+    c.drawRightString(x0 - 3, y0, _fmt(lo))
+    for i, x in enumerate(xs):
+        if vals.size <= 15 or i % 5 == 4 or i == 0:
+            c.drawCentredString(x, y0 - 9, str(i + 1))
@@ -0,0 +1,156 @@
+import re
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Column names that usually hold the completion time of a response.
+DURATION_PATTERN = re.compile(r"duration|seconds|time_taken|completion_time|elapsed", re.IGNORECASE)
+
+
+# ------------------------------------------------------------
+# Row-wise response-quality checks
+# ------------------------------------------------------------
+def straightline_flags(df: pd.DataFrame, items: Sequence, min_items: int = 3) -> np.ndarray:
+    """Rows that gave the same answer to every item of a block (zero row variance)."""
+    if len(items) < min_items:
+        return np.zeros(len(df), dtype=bool)
+    x = df[list(items)].to_numpy(dtype=float, na_value=np.nan)
+    valid = np.isfinite(x)
+    answered = valid.sum(axis=1)
+    lo = np.where(valid, x, np.inf).min(axis=1)
+    hi = np.where(valid, x, -np.inf).max(axis=1)
+    return (answered >= min_items) & (lo == hi)
+
+
+def duplicate_flags(df: pd.DataFrame, cols: Optional[Sequence] = None) -> np.ndarray:
+    """Exact repeats of an earlier row over ``cols`` (the first occurrence is kept)."""
+    frame = df if cols is None else df[list(cols)]
+    if frame.shape[1] == 0:
+        return np.zeros(len(df), dtype=bool)
+    hashes = pd.util.hash_pandas_object(frame, index=False)
+    return hashes.duplicated(keep="first").to_numpy()
+
+
+def _shingles(texts: pd.Series, min_tokens: int):
+    """Row ids and 64-bit hashes of word bigrams for rows with enough words."""
+    tokens = texts.fillna("").astype(str).str.lower().str.findall(r"\w+")
+    lengths = tokens.str.len().to_numpy()
+    keep = lengths >= min_tokens
+    flat = tokens[keep].explode()
+    rows = np.repeat(np.flatnonzero(keep), lengths[keep])
+    words = flat.to_numpy(dtype=object)
+    same_row = rows[1:] == rows[:-1]
+    bigrams = (words[:-1] + " " + words[1:])[same_row]
+    return rows[1:][same_row], pd.util.hash_array(bigrams.astype(object))
+
+
+def minhash_signatures(
+    rows: np.ndarray, hashes: np.ndarray, n_rows: int, num_perm: int = 32, chunk: int = 250_000, seed: int = 0
+) -> np.ndarray:
+    """MinHash signature per row from (row id, shingle hash) pairs sorted by row.
+
+    Permutations are multiply-shift hashes on uint64, so a chunk of shingles
+    is hashed for all permutations at once and reduced per row with
+    ``np.minimum.reduceat``. Rows without shingles keep the maximum value.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+    sig = np.full((n_rows, num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+    start = 0
+    while start < rows.size:
+        stop = min(start + chunk, rows.size)
+        # Extend the chunk to a row boundary so every row is reduced once.
+        while stop < rows.size and rows[stop] == rows[stop - 1]:
+            stop += 1
+        r = rows[start:stop]
+        firsts = np.flatnonzero(np.r_[True, r[1:] != r[:-1]])
+        h = (hashes[start:stop, None] * a + b) >> np.uint64(32)
+        sig[r[firsts]] = np.minimum.reduceat(h, firsts, axis=0)
+        start = stop
+    return sig
+
+
+def near_duplicate_flags(
+    df: pd.DataFrame,
+    text_cols: Sequence,
+    threshold: float = 0.8,
+    min_tokens: int = 5,
+    num_perm: int = 32,
+    bands: int = 8,
+) -> np.ndarray:
+    """Rows whose open-ended answers nearly repeat an earlier row's.
+
+    Texts are joined per row, reduced to MinHash signatures over word
+    bigrams and bucketed by LSH bands; a row is flagged when it shares a
+    bucket with an earlier row and their signatures agree on at least
+    ``threshold`` of the permutations (estimated Jaccard similarity).
+    Answers shorter than ``min_tokens`` words are never compared.
+    """
+    n = len(df)
+    flags = np.zeros(n, dtype=bool)
+    if not text_cols or n == 0:
+        return flags
+    parts = [df[c].fillna("").astype(str) for c in text_cols]
+    joined = parts[0].str.cat(parts[1:], sep=" ") if len(parts) > 1 else parts[0]
+    # Identical answers share one signature: shingle each distinct text once.
+    codes, uniques = pd.factorize(joined)
+    rows, hashes = _shingles(pd.Series(uniques, dtype=object), min_tokens)
+    if rows.size == 0:
+        return flags
+    sig = minhash_signatures(rows, hashes, len(uniques), num_perm)
+    has_text = np.zeros(len(uniques), dtype=bool)
+    has_text[rows] = True
+    # Distinct texts are numbered by first appearance, so "earlier" carries
+    # over: a text matching an earlier text flags all of its rows, and any
+    # later repeat of the same text is flagged as well.
+    idx = np.flatnonzero(has_text)
+    sub = sig[idx]
+    similar = np.zeros(len(uniques), dtype=bool)
+    width = num_perm // bands
+    for band in range(bands):
+        key = pd.util.hash_pandas_object(
+            pd.DataFrame(sub[:, band * width : (band + 1) * width]), index=False
+        ).to_numpy()
+        first = pd.Series(np.arange(idx.size)).groupby(key).transform("min").to_numpy()
+        cand = np.flatnonzero(first != np.arange(idx.size))
+        if cand.size:
+            agree = (sub[cand] == sub[first[cand]]).mean(axis=1)
+            similar[idx[cand[agree >= threshold]]] = True
+    repeat = pd.Series(codes).duplicated(keep="first").to_numpy()
+    return has_text[codes] & (similar[codes] | repeat)
+
+
+def speeder_flags(durations: pd.Series, ratio: float = 0.3) -> np.ndarray:
+    """Completion times below ``ratio`` times the median."""
+    d = pd.to_numeric(durations, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    valid = np.isfinite(d) & (d >= 0)
+    if not valid.any():
+        return np.zeros(d.size, dtype=bool)
+    return valid & (d < ratio * np.median(d[valid]))
+
+
+def detect_duration_column(cols: Sequence) -> Optional[str]:
+    for col in cols:
+        if DURATION_PATTERN.search(str(col)):
+            return col
+    return None
+
+
+def quality_flags(
+    df: pd.DataFrame,
+    item_groups: Dict[str, List],
+    text_cols: Sequence,
+    duration_col: Optional[str] = None,
+    speeder_ratio: float = 0.3,
+) -> pd.DataFrame:
+    """One boolean column per check (straight-lining per item group), aligned with ``df``."""
+    flags = {}
+    for name, items in item_groups.items():
+        flags[f"straightline:{name}"] = straightline_flags(df, items)
+    flags["duplicate"] = duplicate_flags(df)
+    flags["near_duplicate"] = near_duplicate_flags(df, text_cols) & ~flags["duplicate"]
+    if duration_col is not None:
+        flags["speeder"] = speeder_flags(df[duration_col], speeder_ratio)
+    return pd.DataFrame(flags, index=df.index)
@@ -0,0 +1,279 @@
+import copy
+import glob
+import hashlib
+import os
+import threading
+import time
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from scipy.stats import chi2 as chi2_dist
+
+from app_home import app_path
+from dataset_store import FILE_TTL
+from job_scheduler import _env_int
+
+try:
+    import duckdb
+except ImportError:  # optional: the pandas path is used without it
+    duckdb = None
+
+ENGINE = os.environ.get("SURVEIDATA_ENGINE", "pandas").lower()
+ENGINE_THREADS = _env_int("SURVEIDATA_ENGINE_THREADS", 0) or None
+
+
+def engine_enabled() -> bool:
+    return ENGINE == "duckdb" and duckdb is not None
+
+
+# ------------------------------------------------------------
+# D'Agostino-Pearson K² from moments (matches scipy.stats.normaltest)
+# ------------------------------------------------------------
+def normaltest_from_moments(n: float, skew: float, kurtosis: float):
+    """K² statistic and p-value from biased skewness and (non-excess) kurtosis."""
+    n = float(n)
+    y = skew * np.sqrt(((n + 1) * (n + 3)) / (6.0 * (n - 2)))
+    beta2 = (3.0 * (n * n + 27 * n - 70) * (n + 1) * (n + 3)) / (
+        (n - 2.0) * (n + 5) * (n + 7) * (n + 9)
+    )
+    w2 = -1 + np.sqrt(2 * (beta2 - 1))
+    delta = 1 / np.sqrt(0.5 * np.log(w2))
+    alpha = np.sqrt(2.0 / (w2 - 1))
+    y = np.where(y == 0, 1, y)
+    z_skew = delta * np.log(y / alpha + np.sqrt((y / alpha) ** 2 + 1))
+
+    e = 3.0 * (n - 1) / (n + 1)
+    var_b2 = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) * (n + 1.0) * (n + 3) * (n + 5))
+    x = (kurtosis - e) / np.sqrt(var_b2)
+    sqrt_beta1 = (
+        6.0 * (n * n - 5 * n + 2) / ((n + 7) * (n + 9))
+        * np.sqrt((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3)))
+    )
+    a = 6.0 + 8.0 / sqrt_beta1 * (2.0 / sqrt_beta1 + np.sqrt(1 + 4.0 / sqrt_beta1**2))
+    term1 = 1 - 2 / (9.0 * a)
+    denom = 1 + x * np.sqrt(2 / (a - 4.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        term2 = np.sign(denom) * np.where(
+            denom == 0.0, np.nan, ((1 - 2.0 / a) / np.abs(denom)) ** (1 / 3.0)
+        )
+    z_kurt = (term1 - term2) / np.sqrt(2 / (9.0 * a))
+
+    k2 = z_skew**2 + z_kurt**2
+    return float(k2), float(chi2_dist.sf(k2, 2))
+
+
+# ------------------------------------------------------------
+# DuckDB engine: SQL aggregates over a columnar copy of the upload
+# ------------------------------------------------------------
+def _quote(name) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _literal(text: str) -> str:
+    return "'" + str(text).replace("'", "''") + "'"
+
+
+class DuckDBEngine:
+    """Runs the profile aggregates as SQL over a Parquet copy of the parsed upload.
+
+    The frame pandas parsed is written once to Parquet (named by the upload's
+    content hash), so column types and missing values are exactly the ones
+    the pandas path sees; queries are multi-threaded columnar scans of only
+    the columns they touch. Results follow the pandas conventions used by
+    the app (value_counts order, crosstab layout, sample std,
+    pairwise-complete correlation).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._con = duckdb.connect()
+        if ENGINE_THREADS:
+            self._con.execute(f"SET threads = {ENGINE_THREADS}")
+        self._src = f"read_parquet({_literal(path)}, file_row_number = true)"
+        self._samples = {}
+        self._samples_lock = threading.Lock()
+        self.types = {
+            name: str(kind)
+            for name, kind in self._cursor().execute(
+                f"SELECT column_name, column_type FROM (DESCRIBE SELECT * FROM read_parquet({_literal(path)}))"
+            ).fetchall()
+        }
+
+    def _cursor(self):
+        # One cursor per query: cursors are independent connections to the same
+        # database, so heavy jobs on other threads can query concurrently.
+        return self._con.cursor()
+
+    def on_rows(self, rows: np.ndarray) -> "DuckDBEngine":
+        """The same engine restricted to the given file row numbers, e.g. a row sample.
+
+        The row numbers are stored once as a table in the engine's database;
+        queries then read the Parquet copy semi-joined to it.
+        """
+        rows = np.ascontiguousarray(rows, dtype=np.int64)
+        tag = hashlib.sha1(rows.tobytes()).hexdigest()[:16]
+        with self._samples_lock:
+            view = self._samples.get(tag)
+            if view is not None:
+                return view
+            con = self._cursor()
+            con.register("sample_rows", pd.DataFrame({"r": rows}))
+            con.execute(f"CREATE TABLE IF NOT EXISTS rows_{tag} AS SELECT r FROM sample_rows")
+            con.unregister("sample_rows")
+            view = copy.copy(self)
+            view._src = f"(SELECT * FROM {self._src} WHERE file_row_number IN (SELECT r FROM rows_{tag}))"
+            self._samples[tag] = view
+            return view
+
+    def has(self, *cols) -> bool:
+        return all(str(c) in self.types for c in cols)
+
+    def _is_integer(self, col) -> bool:
+        return any(t in self.types[str(col)] for t in ("INT", "BIGINT", "SMALLINT", "TINYINT"))
+
+    def _numeric(self, col) -> str:
+        return f"TRY_CAST({_quote(col)} AS DOUBLE)"
+
+    def value_counts(self, col) -> pd.Series:
+        rows = self._cursor().execute(
+            f"""SELECT {_quote(col)} AS v, COUNT(*) AS c, MIN(file_row_number) AS first
+                FROM {self._src} GROUP BY 1 ORDER BY c DESC, first"""
+        ).fetchall()
+        index = [np.nan if v is None else v for v, _, _ in rows]
+        return pd.Series([c for _, c, _ in rows], index=pd.Index(index, name=col), name="count")
+
+    def crosstab(self, col1, col2) -> pd.DataFrame:
+        pairs = self._cursor().execute(
+            f"""SELECT {_quote(col1)}, {_quote(col2)}, COUNT(*)
+                FROM {self._src}
+                WHERE {_quote(col1)} IS NOT NULL AND {_quote(col2)} IS NOT NULL
+                GROUP BY 1, 2"""
+        ).fetchdf()
+        if pairs.empty:
+            return pd.DataFrame()
+        pairs.columns = ["a", "b", "n"]
+        ct = pairs.pivot(index="a", columns="b", values="n").fillna(0).astype(np.int64)
+        ct = ct.sort_index().sort_index(axis=1)
+        ct.index.name = col1
+        ct.columns.name = col2
+        return ct
+
+    def describe(self, col) -> Optional[dict]:
+        x = self._numeric(col)
+        row = self._cursor().execute(
+            f"""WITH v AS (SELECT {x} AS x FROM {self._src} WHERE {x} IS NOT NULL),
+                     m AS (SELECT AVG(x) AS mu FROM v)
+                SELECT COUNT(*), SUM(x), AVG(x), QUANTILE_CONT(x, 0.5), MIN(x), MAX(x),
+                       STDDEV_SAMP(x),
+                       AVG(POWER(x - mu, 2)), AVG(POWER(x - mu, 3)), AVG(POWER(x - mu, 4))
+                FROM v, m"""
+        ).fetchone()
+        n = row[0]
+        if not n:
+            return None
+        mode = self._cursor().execute(
+            f"""SELECT x FROM (SELECT {x} AS x, COUNT(*) AS c FROM {self._src}
+                               WHERE {x} IS NOT NULL GROUP BY 1)
+                ORDER BY c DESC, x LIMIT 1"""
+        ).fetchone()[0]
+        integer = self._is_integer(col)
+        cast = int if integer else float
+        desc = {
+            "sum": cast(row[1]),
+            "mean": row[2],
+            "median": row[3],
+            "mode": cast(mode),
+            "min": cast(row[4]),
+            "max": cast(row[5]),
+            "std": row[6] if row[6] is not None else np.nan,
+            "count": n,
+            "normaltest_stat": None,
+            "normaltest_p": None,
+        }
+        m2, m3, m4 = row[7], row[8], row[9]
+        if n >= 8 and m2:
+            desc["normaltest_stat"], desc["normaltest_p"] = normaltest_from_moments(
+                n, m3 / m2**1.5, m4 / m2**2
+            )
+        return desc
+
+    def corr(self, cols: Sequence) -> pd.DataFrame:
+        cols = list(cols)
+        k = len(cols)
+        pairs = [(i, j) for i in range(k) for j in range(i + 1, k)]
+        out = np.eye(k)
+        if pairs:
+            exprs = ", ".join(
+                f"CORR({self._numeric(cols[i])}, {self._numeric(cols[j])})" for i, j in pairs
+            )
+            values = self._cursor().execute(f"SELECT {exprs} FROM {self._src}").fetchone()
+            for (i, j), r in zip(pairs, values):
+                out[i, j] = out[j, i] = np.nan if r is None else r
+        # pandas leaves the diagonal NaN for constant or empty columns.
+        var = self._cursor().execute(
+            "SELECT " + ", ".join(f"VAR_SAMP({self._numeric(c)})" for c in cols) + f" FROM {self._src}"
+        ).fetchone()
+        for i, v in enumerate(var):
+            if not v:
+                out[i, :] = out[:, i] = np.nan
+        return pd.DataFrame(out, index=cols, columns=cols)
+
+
+# ------------------------------------------------------------
+# Columnar copies of uploads, shared by sessions and cleaned up by age
+# ------------------------------------------------------------
+_ENGINES = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _parquet_copy(content_hash: str, df: pd.DataFrame) -> Optional[str]:
+    path = app_path("columnar", f"{content_hash}-frame.parquet")
+    if os.path.exists(path):
+        os.utime(path)
+        return path
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, ValueError, TypeError):
+        # Not representable in Arrow (e.g. mixed-type object columns).
+        return None
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}"
+    try:
+        pq.write_table(table, tmp)
+        os.replace(tmp, path)
+        return path
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def evict_stale(now: Optional[float] = None) -> None:
+    now = time.time() if now is None else now
+    for path in glob.glob(os.path.join(os.path.dirname(app_path("columnar", "_")), "*.parquet")):
+        try:
+            if now - os.path.getmtime(path) > FILE_TTL:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def get_engine(content_hash: str, df: pd.DataFrame) -> Optional[DuckDBEngine]:
+    """The SQL engine for an upload parsed into ``df``, or None when this deployment uses pandas."""
+    if not engine_enabled():
+        return None
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(content_hash)
+        if engine is not None and os.path.exists(engine.path):
+            return engine
+    evict_stale()
+    path = _parquet_copy(content_hash, df)
+    if path is None:
+        return None
+    engine = DuckDBEngine(path)
+    with _ENGINES_LOCK:
+        _ENGINES[content_hash] = engine
+        while len(_ENGINES) > 8:
+            _ENGINES.pop(next(iter(_ENGINES)))
+    return engine
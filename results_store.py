@@ -0,0 +1,226 @@
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from app_home import app_path
+
+# Bump when a stored result's format or the code producing it changes;
+# older stores are then dropped instead of serving stale results.
+RESULTS_SCHEMA_VERSION = 5
+RESULTS_MAX_MB = float(os.environ.get("SURVEIDATA_RESULTS_MAX_MB", 512))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    dataset_hash TEXT PRIMARY KEY,
+    name TEXT,
+    n_rows INTEGER,
+    n_cols INTEGER,
+    first_seen REAL,
+    last_used REAL
+);
+CREATE TABLE IF NOT EXISTS results (
+    dataset_hash TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (dataset_hash, kind, params)
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+# ------------------------------------------------------------
+# Persistent results store
+# ------------------------------------------------------------
+class ResultsStore:
+    """Computed results kept in a local SQLite file, keyed by dataset hash.
+
+    Each result is stored under ``(dataset_hash, kind, params)``; ``params``
+    is any JSON-serialisable description of the inputs (columns, options).
+    A small in-memory LRU sits in front so reruns do not hit the disk. When
+    the file grows past ``max_bytes`` the least recently used results are
+    deleted first.
+    """
+
+    def __init__(self, path: str, max_bytes: float = RESULTS_MAX_MB * 1024 * 1024, memory_items: int = 64):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._ready = False
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            if not self._ready:
+                with self._lock:
+                    if not self._ready:
+                        self._init_schema(conn)
+                        self._ready = True
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != RESULTS_SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS results; DROP TABLE IF EXISTS datasets;")
+            # auto_vacuum only takes effect on a database without tables.
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {RESULTS_SCHEMA_VERSION}")
+        conn.commit()
+
+    @staticmethod
+    def _params_key(params) -> str:
+        return json.dumps(params, sort_keys=True, default=str, ensure_ascii=False)
+
+    def _remember(self, key: tuple, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def get(self, dataset_hash: str, kind: str, params=()) -> Optional[Any]:
+        key = (dataset_hash, kind, self._params_key(params))
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT payload FROM results WHERE dataset_hash = ? AND kind = ? AND params = ?",
+                    key,
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE results SET last_used = ? WHERE dataset_hash = ? AND kind = ? AND params = ?",
+                    (time.time(),) + key,
+                )
+            value = pickle.loads(row[0])
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        self._remember(key, value)
+        return value
+
+    def put(self, dataset_hash: str, kind: str, params, value: Any) -> None:
+        key = (dataset_hash, kind, self._params_key(params))
+        self._remember(key, value)
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        if len(payload) > self.max_bytes / 4:
+            return
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    key + (payload, len(payload), now, now),
+                )
+            self.cleanup()
+        except sqlite3.Error:
+            pass
+
+    def cached(self, dataset_hash: Optional[str], kind: str, params, compute: Callable[[], Any]) -> Any:
+        """Stored result if present, otherwise compute, store and return it."""
+        if dataset_hash is None:
+            return compute()
+        value = self.get(dataset_hash, kind, params)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.put(dataset_hash, kind, params, value)
+        return value
+
+    def touch_dataset(self, dataset_hash: str, name: str, n_rows: int, n_cols: int) -> None:
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """INSERT INTO datasets VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(dataset_hash) DO UPDATE SET name = excluded.name, last_used = excluded.last_used""",
+                    (dataset_hash, name, n_rows, n_cols, now, now),
+                )
+        except sqlite3.Error:
+            pass
+
+    def history(self) -> pd.DataFrame:
+        try:
+            with self._connect() as conn:
+                return pd.read_sql_query(
+                    """SELECT d.name, d.n_rows, d.n_cols,
+                              datetime(d.last_used, 'unixepoch', 'localtime') AS last_used,
+                              COUNT(r.kind) AS results,
+                              ROUND(COALESCE(SUM(r.size), 0) / 1048576.0, 2) AS size_mb
+                       FROM datasets d LEFT JOIN results r ON r.dataset_hash = d.dataset_hash
+                       GROUP BY d.dataset_hash ORDER BY d.last_used DESC""",
+                    conn,
+                )
+        except sqlite3.Error:
+            return pd.DataFrame()
+
+    def cleanup(self) -> None:
+        with self._connect() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            target = total - self.max_bytes * 0.8
+            freed = 0
+            stale = []
+            for dataset_hash, kind, params, size in conn.execute(
+                "SELECT dataset_hash, kind, params, size FROM results ORDER BY last_used"
+            ):
+                stale.append((dataset_hash, kind, params))
+                freed += size
+                if freed >= target:
+                    break
+            conn.executemany(
+                "DELETE FROM results WHERE dataset_hash = ? AND kind = ? AND params = ?", stale
+            )
+            # Forget only datasets that lost their last result here; ones touched
+            # but without results yet stay in the history.
+            evicted = sorted({dataset_hash for dataset_hash, _, _ in stale})
+            conn.executemany(
+                """DELETE FROM datasets WHERE dataset_hash = ?
+                   AND NOT EXISTS (SELECT 1 FROM results WHERE dataset_hash = ?)""",
+                [(h, h) for h in evicted],
+            )
+        with self._connect() as conn:
+            conn.execute("PRAGMA incremental_vacuum")
+        with self._lock:
+            for key in stale:
+                self._memory.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+            conn.execute("DELETE FROM datasets")
+        with self._connect() as conn:
+            conn.execute("PRAGMA incremental_vacuum")
+
+
+RESULTS_STORE = ResultsStore(app_path("results.sqlite3"))
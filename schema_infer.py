@@ -0,0 +1,183 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app_home import app_path
+from multi_response import detect_delimiter
+from sketches import HyperLogLog
+
+ROLE_NUMERIC = "numeric"
+ROLE_ORDINAL = "ordinal"
+ROLE_CATEGORICAL = "categorical"
+ROLE_TEXT = "text"
+ROLE_MULTI = "multi"
+ROLE_IGNORE = "ignore"
+ROLES = [ROLE_NUMERIC, ROLE_ORDINAL, ROLE_CATEGORICAL, ROLE_TEXT, ROLE_MULTI, ROLE_IGNORE]
+
+OVERRIDES_FILE = "column_roles.json"
+
+
+# ------------------------------------------------------------
+# Column role inference
+# ------------------------------------------------------------
+def approx_distinct(series: pd.Series, p: int = 12) -> float:
+    hll = HyperLogLog(p)
+    hll.add_hashes(pd.util.hash_pandas_object(series.dropna(), index=False).values)
+    return hll.estimate()
+
+
+def _infer_column(
+    series: pd.Series,
+    max_categories: int,
+    max_codes: int,
+    sample_rows: int,
+    rng: np.random.Generator,
+) -> dict:
+    if pd.api.types.is_bool_dtype(series):
+        return {"role": ROLE_CATEGORICAL, "distinct": 2.0, "source": "dtype"}
+
+    valid = series.dropna()
+    if len(valid) > sample_rows:
+        sample = valid.iloc[rng.choice(len(valid), sample_rows, replace=False)]
+    else:
+        sample = valid
+    sample_distinct = sample.nunique()
+
+    if pd.api.types.is_numeric_dtype(series):
+        values = sample.to_numpy(dtype=float, na_value=np.nan)
+        integer_coded = values.size > 0 and bool(np.all(values == np.round(values)))
+        if not integer_coded or sample_distinct > max_codes:
+            return {"role": ROLE_NUMERIC, "distinct": float(sample_distinct), "source": "sample"}
+        distinct = round(approx_distinct(series))
+        role = ROLE_ORDINAL if distinct <= max_codes else ROLE_NUMERIC
+        return {"role": role, "distinct": float(distinct), "source": "hll"}
+
+    if (
+        pd.api.types.is_object_dtype(series)
+        or pd.api.types.is_string_dtype(series)
+        or isinstance(series.dtype, pd.CategoricalDtype)
+    ):
+        delimiter = detect_delimiter(sample)
+        if delimiter is not None:
+            return {"role": ROLE_MULTI, "distinct": float(sample_distinct), "source": "sample", "delimiter": delimiter}
+        # A sample can only undercount distinct values, so it settles "text" on its own.
+        if sample_distinct > max_categories:
+            return {"role": ROLE_TEXT, "distinct": float(sample_distinct), "source": "sample"}
+        distinct = round(approx_distinct(series))
+        role = ROLE_CATEGORICAL if distinct <= max_categories else ROLE_TEXT
+        return {"role": role, "distinct": float(distinct), "source": "hll"}
+
+    return {"role": ROLE_IGNORE, "distinct": float("nan"), "source": "dtype"}
+
+
+def infer_schema(
+    df: pd.DataFrame,
+    max_categories: int = 30,
+    max_codes: int = 10,
+    sample_rows: int = 5000,
+    seed: int = 0,
+) -> Dict[str, dict]:
+    """Assign a role to every column.
+
+    Object columns whose answers split on a delimiter into a small option
+    set ("A;C;D") are multiple-response. Other object columns are
+    categorical when they have at most ``max_categories`` distinct values,
+    otherwise free text. Integer-coded numeric columns with
+    at most ``max_codes`` distinct values (Likert items, 0/1 flags, region
+    codes) are "ordinal": they are analysed both as numbers and as categories.
+    """
+    rng = np.random.default_rng(seed)
+    return {
+        col: _infer_column(df[col], max_categories, max_codes, sample_rows, rng)
+        for col in df.columns
+    }
+
+
+# ------------------------------------------------------------
+# Cache per dataset and persisted user overrides
+# ------------------------------------------------------------
+_SCHEMA_CACHE: "OrderedDict[tuple, Dict[str, dict]]" = OrderedDict()
+_SCHEMA_LOCK = threading.Lock()
+_SCHEMA_CACHE_SIZE = 64
+
+
+def cached_schema(
+    df: pd.DataFrame, dataset_hash: str, max_categories: int = 30, max_codes: int = 10
+) -> Dict[str, dict]:
+    key = (dataset_hash, max_categories, max_codes)
+    with _SCHEMA_LOCK:
+        if key in _SCHEMA_CACHE:
+            _SCHEMA_CACHE.move_to_end(key)
+            return _SCHEMA_CACHE[key]
+    schema = infer_schema(df, max_categories=max_categories, max_codes=max_codes)
+    with _SCHEMA_LOCK:
+        _SCHEMA_CACHE[key] = schema
+        while len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.popitem(last=False)
+    return schema
+
+
+def layout_key(columns) -> str:
+    # Overrides follow the column layout, so next month's file with the same
+    # questions picks them up even though its content hash differs.
+    return json.dumps([str(c) for c in columns], ensure_ascii=False)
+
+
+def load_overrides(columns) -> Dict[str, str]:
+    try:
+        with open(app_path(OVERRIDES_FILE), encoding="utf-8") as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {c: r for c, r in saved.get(layout_key(columns), {}).items() if r in ROLES}
+
+
+def save_overrides(columns, overrides: Dict[str, str]) -> None:
+    path = app_path(OVERRIDES_FILE)
+    with _SCHEMA_LOCK:
+        try:
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = {}
+        if overrides:
+            saved[layout_key(columns)] = overrides
+        else:
+            saved.pop(layout_key(columns), None)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(saved, f, ensure_ascii=False, indent=1)
+
+
+def apply_overrides(schema: Dict[str, dict], overrides: Dict[str, str]) -> Dict[str, dict]:
+    merged = {}
+    for col, info in schema.items():
+        role = overrides.get(str(col))
+        if role is not None and role != info["role"]:
+            merged[col] = dict(info, role=role, source="override")
+        else:
+            merged[col] = info
+    return merged
+
+
+def columns_by_role(schema: Dict[str, dict]):
+    numeric_cols: List[str] = []
+    cat_cols: List[str] = []
+    text_cols: List[str] = []
+    for col, info in schema.items():
+        role = info["role"]
+        if role in (ROLE_NUMERIC, ROLE_ORDINAL):
+            numeric_cols.append(col)
+        if role in (ROLE_ORDINAL, ROLE_CATEGORICAL):
+            cat_cols.append(col)
+        if role == ROLE_TEXT:
+            text_cols.append(col)
+    return numeric_cols, cat_cols, text_cols
+
+
+def multi_response_columns(schema: Dict[str, dict]) -> Dict[str, Optional[str]]:
+    """Multiple-response columns and their detected delimiter (None when set by override)."""
+    return {col: info.get("delimiter") for col, info in schema.items() if info["role"] == ROLE_MULTI}
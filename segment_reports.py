@@ -0,0 +1,110 @@
+import hashlib
+import os
+import re
+import zipfile
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from text_engine import get_process_pool, reset_process_pool
+
+# Columns with more values than this are not offered for segmenting.
+SEGMENT_MAX = 50
+OVERALL_NAME = "overall"
+# Below this many rows in total, reports are built faster inline than by
+# starting pool workers.
+POOL_MIN_ROWS = 20_000
+
+
+# ------------------------------------------------------------
+# Segmented report export: one PDF per category value, zipped
+# ------------------------------------------------------------
+def segment_rows(series: pd.Series, max_segments: int = SEGMENT_MAX) -> List[Tuple[int, str, np.ndarray]]:
+    """(code, value, row positions) per category of ``series``, largest first.
+
+    Rows without a value are left out. Codes tell apart values that print
+    the same (1 and "1").
+    """
+    codes, uniques = pd.factorize(series)
+    if len(uniques) > max_segments:
+        return []
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    segments = [(i, str(uniques[i]), order[bounds[i] : bounds[i + 1]]) for i in range(len(uniques))]
+    return sorted(segments, key=lambda s: -s[2].size)
+
+
+def segment_key(dataset_hash: str, col, code: int, value: str) -> str:
+    """Cache key of a segment's rows, derived from the dataset's."""
+    tag = hashlib.sha1(f"{col}\x00{code}\x00{value}".encode("utf-8")).hexdigest()[:12]
+    return f"{dataset_hash}-s{tag}"
+
+
+def report_filename(col, value: str, used: Set[str]) -> str:
+    """A file name for a segment's report, not yet in ``used`` (compared case-insensitively).
+
+    Values that only differ in characters dropped from file names ("a/b",
+    "a b") get a numbered suffix instead of overwriting each other. The
+    chosen name is added to ``used``.
+    """
+    stem = re.sub(r"[^\w.-]+", "_", f"{col}_{value}").strip("_")[:80] or "segment"
+    name, n = f"{stem}.pdf", 1
+    while name.lower() in used:
+        n += 1
+        name = f"{stem}_{n}.pdf"
+    used.add(name.lower())
+    return name
+
+
+def _report_pdf(kwargs: dict) -> bytes:
+    # Imported here so pool workers load the report module (not the Streamlit
+    # app) once, on their first report.
+    import survey_report
+
+    return survey_report.build_survey_report_pdf(**kwargs).getvalue()
+
+
+def build_reports(
+    jobs: List[Tuple[str, dict]], progress: Optional[Callable[[int, int, str], None]] = None
+) -> List[bytes]:
+    """Build one PDF per (label, keyword arguments of ``build_survey_report_pdf``) job.
+
+    Jobs with at least ``POOL_MIN_ROWS`` rows in total run concurrently on
+    the shared process pool, and ``progress(done, total, label)`` is called
+    as each report finishes. Reports come back in job order. Small exports,
+    or exports without a usable pool, are built one after another.
+    """
+    reports: Dict[int, bytes] = {}
+    total = len(jobs)
+    rows = sum(len(kwargs["df"]) for _, kwargs in jobs)
+    if total > 1 and rows >= POOL_MIN_ROWS and (os.cpu_count() or 1) > 1:
+        try:
+            pool = get_process_pool()
+            futures = {pool.submit(_report_pdf, kwargs): i for i, (_, kwargs) in enumerate(jobs)}
+            for future in as_completed(futures):
+                i = futures[future]
+                reports[i] = future.result()
+                if progress is not None:
+                    progress(len(reports), total, jobs[i][0])
+        except (BrokenProcessPool, OSError):
+            reset_process_pool()
+    for i, (label, kwargs) in enumerate(jobs):
+        if i in reports:
+            continue
+        reports[i] = _report_pdf(kwargs)
+        if progress is not None:
+            progress(len(reports), total, label)
+    return [reports[i] for i in range(total)]
+
+
+def zip_reports(reports: Dict[str, bytes]) -> bytes:
+    buffer = BytesIO()
+    # PDFs are already compressed; storing them keeps zipping instant.
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zf:
+        for filename, pdf in reports.items():
+            zf.writestr(filename, pdf)
+    return buffer.getvalue()
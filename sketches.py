@@ -0,0 +1,212 @@
+import heapq
+import math
+import os
+from typing import Dict, Hashable, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+# Normalised rank error of the quantile sketches, and the column size from
+# which medians and boxplots use a sketch instead of an exact sort.
+QUANTILE_EPS = float(os.environ.get("SURVEIDATA_QUANTILE_EPS", 0.005))
+SKETCH_MIN_VALUES = int(os.environ.get("SURVEIDATA_SKETCH_MIN_VALUES", 5_000_000))
+
+# ------------------------------------------------------------
+# Space-Saving heavy hitters (mergeable, fixed capacity)
+# ------------------------------------------------------------
+class SpaceSaving:
+    """Top-k counter that never holds more than ``capacity`` items.
+
+    Counts are upper bounds; ``errors`` holds how much each count may be
+    overestimated. Two summaries merge into one with the same guarantees,
+    so per-chunk summaries can be built independently and combined.
+    """
+
+    def __init__(self, capacity: int = 2000):
+        self.capacity = int(capacity)
+        self.counts: Dict[Hashable, int] = {}
+        self.errors: Dict[Hashable, int] = {}
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def _floor(self) -> int:
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def _truncate(self) -> None:
+        if len(self.counts) <= self.capacity:
+            return
+        keep = heapq.nlargest(self.capacity, self.counts.items(), key=lambda kv: kv[1])
+        self.counts = dict(keep)
+        self.errors = {k: self.errors.get(k, 0) for k in self.counts}
+
+    def update_counts(self, counts: Mapping[Hashable, int]) -> None:
+        """Fold exact counts (e.g. a chunk ``Counter``) into the summary."""
+        self.merge_raw(counts, {}, 0, sum(counts.values()))
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        local: Dict[Hashable, int] = {}
+        for item in items:
+            local[item] = local.get(item, 0) + 1
+        self.update_counts(local)
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        self.merge_raw(other.counts, other.errors, other._floor(), other.total)
+        return self
+
+    def merge_raw(
+        self,
+        counts: Mapping[Hashable, int],
+        errors: Mapping[Hashable, int],
+        other_floor: int,
+        other_total: int,
+    ) -> None:
+        own_floor = self._floor()
+        merged: Dict[Hashable, int] = {}
+        merged_err: Dict[Hashable, int] = {}
+        for key, cnt in self.counts.items():
+            if key in counts:
+                merged[key] = cnt + counts[key]
+                merged_err[key] = self.errors.get(key, 0) + errors.get(key, 0)
+            else:
+                merged[key] = cnt + other_floor
+                merged_err[key] = self.errors.get(key, 0) + other_floor
+        for key, cnt in counts.items():
+            if key not in merged:
+                merged[key] = cnt + own_floor
+                merged_err[key] = errors.get(key, 0) + own_floor
+        self.counts = merged
+        self.errors = merged_err
+        self.total += other_total
+        self._truncate()
+
+    def most_common(self, k: int = 10) -> List[Tuple[Hashable, int]]:
+        return heapq.nlargest(k, self.counts.items(), key=lambda kv: kv[1])
+
+
+# ------------------------------------------------------------
+# HyperLogLog distinct counter
+# ------------------------------------------------------------
+class HyperLogLog:
+    """Approximate distinct count from 64-bit hashes (relative error ~1.04/sqrt(2**p))."""
+
+    def __init__(self, p: int = 12):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if hashes.size == 0:
+            return
+        tail_bits = 64 - self.p
+        idx = (hashes >> np.uint64(tail_bits)).astype(np.int64)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        # bit_length(tail) through float exponent; tail == 0 gives rank tail_bits + 1
+        _, exp = np.frexp(tail.astype(np.float64))
+        rank = (tail_bits - exp + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return float(m * np.log(m / zeros))
+        return float(raw)
+
+
+# ------------------------------------------------------------
+# KLL quantile sketch (mergeable, bounded memory)
+# ------------------------------------------------------------
+class KLLSketch:
+    """Approximate quantiles with normalised rank error of about ``eps``.
+
+    Items live in compactors; an item at level h stands for 2**h inputs.
+    A full compactor is sorted and every other item (random offset) moves
+    up a level, so memory stays O(k log(n / k)). Sketches of separate
+    chunks merge level by level.
+    """
+
+    def __init__(self, eps: float = QUANTILE_EPS, seed: int = 0):
+        self.eps = eps
+        self.k = max(8, math.ceil(2.3 / eps))
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, math.ceil(self.k * (2.0 / 3.0) ** depth))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so weights are preserved exactly.
+                keep = items[: items.size % 2]
+                pairs = items[items.size % 2 :]
+                promoted = pairs[int(self._rng.integers(2)) :: 2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values) -> None:
+        x = np.asarray(values, dtype=float).ravel()
+        x = x[np.isfinite(x)]
+        if x.size == 0:
+            return
+        self.n += int(x.size)
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+        self.levels[0] = np.concatenate([self.levels[0], x])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        qs = np.asarray(qs, dtype=float)
+        if self.n == 0:
+            return np.full(qs.shape, np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level.size, 2.0**h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items, cum = items[order], np.cumsum(weights[order])
+        idx = np.searchsorted(cum, qs * cum[-1], side="left")
+        out = items[np.minimum(idx, items.size - 1)]
+        out = np.where(qs <= 0, self.min, out)
+        return np.where(qs >= 1, self.max, out)
+
+    def quantile(self, q: float) -> float:
+        return float(self.quantiles([q])[0])
+
+
+def column_sketch(values, eps: float = QUANTILE_EPS, chunk_rows: int = 1_000_000) -> KLLSketch:
+    """Sketch of one column, fed in chunks so no full sort or copy is needed."""
+    x = np.asarray(values, dtype=float).ravel()
+    sketch = KLLSketch(eps)
+    for start in range(0, x.size, chunk_rows):
+        sketch.update(x[start : start + chunk_rows])
+    return sketch
@@ -0,0 +1,350 @@
+import hashlib
+import time
+from io import BytesIO
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from chart_data import bar_data_from_counts, box_data, histogram_data, pair_plot_layout, scatter_data
+from factor_analysis import factor_analysis
+from group_tests import group_comparisons
+from missing_index import MissingnessIndex, complete_values
+from multi_response import indicator_matrix, option_frequencies
+from numeric_stats import STAT_COLUMNS, describe_numeric, pairwise_corr
+from pdf_render import (
+    PageCursor,
+    draw_bar_chart,
+    draw_boxplot,
+    draw_histogram,
+    draw_matrix_heatmap,
+    draw_scatter_tiles,
+    draw_scree,
+    draw_table,
+    format_count,
+)
+from results_store import RESULTS_STORE
+from text_engine import analyze_text_columns, get_tokenizer
+from translations import TEXTS
+from weighting import design_effect, weighted_value_counts, weights_tag
+
+# Everything the PDF report needs, without Streamlit: report workers import
+# this module instead of the app.
+
+
+# ------------------------------------------------------------
+# Shared computations (app and report)
+# ------------------------------------------------------------
+def frame_fingerprint(obj) -> str:
+    """Content hash of a Series/DataFrame, used as a cache key."""
+    hashed = pd.util.hash_pandas_object(obj, index=False).values
+    names = obj.name if isinstance(obj, pd.Series) else tuple(obj.columns)
+    return hashlib.sha1(hashed.tobytes() + repr(names).encode("utf-8")).hexdigest()
+
+
+def text_stats_for_columns(
+    df: pd.DataFrame,
+    cols: List[str],
+    language: str,
+    ngram_max: int = 3,
+    dataset_hash: Optional[str] = None,
+) -> dict:
+    tokenizer = get_tokenizer(language)
+    stored = {}
+    if dataset_hash is not None:
+        for col in cols:
+            stats = RESULTS_STORE.get(dataset_hash, "text", [str(col), tokenizer.config_key, ngram_max])
+            if stats is not None:
+                stored[col] = stats
+    todo = [col for col in cols if col not in stored]
+    if todo:
+        computed = analyze_text_columns(
+            {col: df[col] for col in todo},
+            tokenizer,
+            column_keys={col: frame_fingerprint(df[col]) for col in todo},
+            ngram_max=ngram_max,
+        )
+        for col, stats in computed.items():
+            if dataset_hash is not None:
+                RESULTS_STORE.put(dataset_hash, "text", [str(col), tokenizer.config_key, ngram_max], stats)
+            stored[col] = stats
+    return {col: stored[col] for col in cols}
+
+
+def descriptive_stats(df: pd.DataFrame, cols: List[str], engine=None, weights=None) -> pd.DataFrame:
+    """One row of statistics per numeric column (see numeric_stats.STAT_COLUMNS)."""
+    if weights is not None:
+        return describe_numeric(df, cols, weights=weights)
+    if engine is not None and engine.has(*cols):
+        rows = {col: engine.describe(col) or {"count": 0} for col in cols}
+        table = pd.DataFrame.from_dict(rows, orient="index").reindex(columns=STAT_COLUMNS)
+        return table.astype(float).fillna({"count": 0}).astype({"count": np.int64})
+    return describe_numeric(df, cols)
+
+
+def value_counts(df: pd.DataFrame, col: str, engine=None, weights=None) -> pd.Series:
+    if weights is not None:
+        return weighted_value_counts(df[col], weights)
+    if engine is not None and engine.has(col):
+        return engine.value_counts(col)
+    return df[col].value_counts(dropna=False)
+
+
+def correlation_matrix(df: pd.DataFrame, cols: List[str], engine=None, weights=None) -> pd.DataFrame:
+    if engine is not None and weights is None and engine.has(*cols):
+        return engine.corr(cols)
+    return pairwise_corr(df, cols, weights)
+
+
+def likert_items(numeric_cols: List[str], cat_cols: List[str]) -> List[str]:
+    """Ordinal columns (numeric and categorical at once), or every numeric column when there are fewer than 3."""
+    ordinal = [c for c in numeric_cols if c in set(cat_cols)]
+    return ordinal if len(ordinal) >= 3 else list(numeric_cols)
+
+
+def multi_response_indicator(df: pd.DataFrame, col, delimiter: str, dataset_hash: Optional[str]):
+    """Sparse respondents x options matrix of a multiple-response column, parsed once per dataset."""
+    return RESULTS_STORE.cached(
+        dataset_hash,
+        "multi",
+        [str(col), delimiter],
+        lambda: indicator_matrix(df[col], delimiter),
+    )
+
+
+# ------------------------------------------------------------
+# PDF report
+# ------------------------------------------------------------
+def report_params(language: str, numeric_cols, cat_cols, text_cols, multi_cols: dict, engine_tag: str) -> list:
+    """Cache parameters of a full PDF report."""
+    return [
+        language,
+        [str(c) for c in numeric_cols],
+        [str(c) for c in cat_cols],
+        [str(c) for c in text_cols],
+        [[str(c), d] for c, d in multi_cols.items()],
+        engine_tag,
+    ]
+
+
+def build_survey_report_pdf(
+    df: pd.DataFrame,
+    numeric_cols,
+    cat_cols,
+    text_cols,
+    language: str,
+    missing: Optional[MissingnessIndex] = None,
+    dataset_hash: Optional[str] = None,
+    engine=None,
+    weights=None,
+    multi_cols: Optional[dict] = None,
+    timestamp: bool = True,
+) -> BytesIO:
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+    margin = 30
+    cur = PageCursor(c, width, height, margin)
+
+    texts = TEXTS.get(language, TEXTS["EN"])
+    if missing is None:
+        missing = MissingnessIndex(df)
+    engine_tag = "duckdb" if engine is not None else "pandas"
+    if weights is not None:
+        engine_tag = f"{engine_tag}+w:{weights_tag(weights)}"
+
+    def draw_line(text, font="Helvetica", size=9, new_page_if_needed=True):
+        c.setFont(font, size)
+        if new_page_if_needed and cur.y < margin + 50:
+            cur.new_page()
+            c.setFont(font, size)
+        c.drawString(margin, cur.y, text)
+        cur.y -= size + 3
+
+    c.setTitle(texts["title"])
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(margin, cur.y, texts["title"])
+    cur.y -= 24
+    c.setFont("Helvetica", 9)
+    if timestamp:
+        draw_line(time.strftime(texts["pdf_generated_on"]), new_page_if_needed=False)
+    cur.y -= 4
+
+    draw_line("-" * 90)
+    draw_line(texts["pdf_dataset_metadata"], "Helvetica-Bold", 11)
+    draw_line(f"{texts['rows']}: {df.shape[0]}")
+    draw_line(f"{texts['cols']}: {df.shape[1]}")
+    draw_line(f"{texts['num_cols']}: {len(numeric_cols)}")
+    draw_line(f"{texts['cat_cols']}: {len(cat_cols)}")
+    draw_line(f"{texts['text_cols']}: {len(text_cols)}")
+    if weights is not None:
+        draw_line(f"{texts['pdf_weighted']}: {design_effect(weights):.2f}")
+
+    if numeric_cols:
+        draw_line("-" * 90)
+        draw_line(texts["pdf_numeric_stats"], "Helvetica-Bold", 11)
+        stats_table = RESULTS_STORE.cached(
+            dataset_hash,
+            "describe",
+            [[str(c) for c in numeric_cols], engine_tag],
+            lambda: descriptive_stats(df, numeric_cols, engine, weights),
+        )
+
+        for col in numeric_cols:
+            desc = stats_table.loc[col]
+            if desc["count"] == 0:
+                continue
+            (s,) = complete_values(df, [col], missing)
+            draw_line(f"{texts['pdf_column']}: {col}", "Helvetica-Bold", 10)
+            draw_line(
+                f"  {texts['pdf_count']}: {int(desc['count'])}  "
+                f"{texts['pdf_mean']}: {desc['mean']:.4f}  "
+                f"{texts['pdf_median']}: {desc['median']:.4f}"
+            )
+            draw_line(
+                f"  {texts['pdf_mode']}: {desc['mode']:.4f}  "
+                f"{texts['pdf_min']}: {desc['min']:.4f}  "
+                f"{texts['pdf_max']}: {desc['max']:.4f}  "
+                f"{texts['pdf_std']}: {desc['std']:.4f}"
+            )
+            if pd.notna(desc["normaltest_stat"]):
+                draw_line(
+                    f"  {texts['pdf_normaltest_stat_label']}: {desc['normaltest_stat']:.4f}, "
+                    f"{texts['pdf_p_value_label']}: {desc['normaltest_p']:.4g}"
+                )
+            else:
+                draw_line(f"  {texts['pdf_normaltest_not_enough']}")
+
+            draw_histogram(cur, histogram_data(s), f"{texts['hist_title']} - {col}")
+            draw_boxplot(cur, box_data(s), f"{texts['box_title']} - {col}")
+
+    if numeric_cols:
+        corr = RESULTS_STORE.cached(
+            dataset_hash,
+            "corr",
+            [[str(c) for c in numeric_cols], engine_tag],
+            lambda: correlation_matrix(df, numeric_cols, engine, weights),
+        )
+
+    if len(numeric_cols) >= 2:
+        draw_line("-" * 90)
+        draw_line(texts["pdf_scatter_plots"], "Helvetica-Bold", 11)
+        # A scatter matrix for a few variables, otherwise the strongest pairs;
+        # small tiles share one page instead of one figure per pair.
+        layout = pair_plot_layout(corr)
+        if layout["mode"] == "top":
+            shown = sum(len(row) for row in layout["cells"])
+            draw_line(texts["pdf_pairs_top"].format(n=shown), "Helvetica-Oblique", 9)
+
+        def pair_tile(pair):
+            col_x, col_y = pair
+            data = None
+            if missing.complete_count([col_x, col_y]) >= 3:
+                data = scatter_data(*complete_values(df, [col_x, col_y], missing), max_points=400, grid=40)
+            return {"title": f"{col_y} vs {col_x} (r = {corr.loc[col_x, col_y]:.2f})", "data": data}
+
+        tiles = [[pair_tile(cell) if cell else None for cell in row] for row in layout["cells"]]
+        draw_scatter_tiles(cur, tiles, layout["per_row"])
+
+    if numeric_cols:
+        draw_line("-" * 90)
+        draw_line(texts["corr_matrix_title"], "Helvetica-Bold", 11)
+        draw_matrix_heatmap(cur, corr)
+
+    items = likert_items(numeric_cols, cat_cols)
+    fa = None
+    if len(items) >= 3:
+        fa = RESULTS_STORE.cached(
+            dataset_hash,
+            "factors",
+            [[str(c) for c in items], engine_tag, "pca", 0],
+            lambda: factor_analysis(corr.loc[items, items], method="pca"),
+        )
+    if fa is not None:
+        draw_line("-" * 90)
+        draw_line(texts["fa_title"], "Helvetica-Bold", 11)
+        draw_scree(cur, fa["eigenvalues"], texts["fa_scree"])
+        loadings = fa["loadings"]
+        factors = list(loadings.columns[:-1][:8])
+        rows = [[texts["fa_item"]] + factors + [texts["fa_communality"]]]
+        for item, r in loadings.iterrows():
+            rows.append([str(item)[:30]] + [f"{r[f]:.2f}" for f in factors] + [f"{r['communality']:.2f}"])
+        draw_table(cur, rows, col_widths=[140] + [40] * len(factors) + [60])
+
+    if numeric_cols and cat_cols:
+        groups = RESULTS_STORE.cached(
+            dataset_hash,
+            "group_tests",
+            [[str(c) for c in numeric_cols], [str(c) for c in cat_cols], engine_tag],
+            lambda: group_comparisons(df, numeric_cols, cat_cols, weights=weights),
+        )
+        if groups is not None and not groups.empty:
+            draw_line("-" * 90)
+            draw_line(texts["group_tests_title"], "Helvetica-Bold", 11)
+            if weights is not None:
+                draw_line(texts["group_tests_weighted"], "Helvetica-Oblique", 9)
+            rows = [[texts["pdf_column"], texts["pdf_group_by"], texts["pdf_test"], "p", texts["pdf_effect"]]]
+            for r in groups.head(15).itertuples():
+                rows.append(
+                    [
+                        r.numeric[:30],
+                        r.group_by[:30],
+                        f"{r.test} = {r.statistic:.2f}",
+                        f"{r.p_value:.4g}",
+                        f"{r.effect} = {r.effect_size:.3f}",
+                    ]
+                )
+            draw_table(cur, rows, col_widths=[140, 120, 110, 60, 100])
+
+    if cat_cols:
+        draw_line("-" * 90)
+        draw_line(texts["pdf_cat_cols"], "Helvetica-Bold", 11)
+        for col in cat_cols:
+            draw_line(f"{texts['pdf_column']}: {col}", "Helvetica-Bold", 10)
+            vc = value_counts(df, col, engine, weights)
+            total = vc.sum()
+            top_vc = vc.head(10)
+            rows = [[texts["pdf_column"], texts["pdf_count"], texts["percent"]]]
+            for idx, val in top_vc.items():
+                perc = val / total * 100 if total > 0 else 0
+                rows.append([str(idx)[:40], format_count(val), f"{perc:.1f}"])
+            draw_table(cur, rows, col_widths=[240, 70, 70])
+            draw_bar_chart(cur, bar_data_from_counts(vc, top=10), f"{texts['bar_title']} - {col}")
+
+    if multi_cols:
+        draw_line("-" * 90)
+        draw_line(texts["multi_title"], "Helvetica-Bold", 11)
+        for col, delimiter in multi_cols.items():
+            draw_line(f"{texts['pdf_column']}: {col}", "Helvetica-Bold", 10)
+            ind, options = multi_response_indicator(df, col, delimiter, dataset_hash)
+            freq = option_frequencies(ind, options, weights)
+            rows = [[texts["multi_option"], texts["pdf_count"], texts["multi_pct_respondents"]]]
+            for r in freq.head(15).itertuples():
+                rows.append([str(r.option)[:40], format_count(r.count), f"{r.pct_respondents:.1f}"])
+            draw_table(cur, rows, col_widths=[240, 70, 110])
+            counts = freq.set_index("option")["count"]
+            draw_bar_chart(cur, bar_data_from_counts(counts, top=15), f"{texts['bar_title']} - {col}")
+
+    if text_cols:
+        draw_line("-" * 90)
+        draw_line(texts["pdf_text_summary"], "Helvetica-Bold", 11)
+        text_stats_by_col = text_stats_for_columns(
+            df, text_cols, language, dataset_hash=dataset_hash
+        )
+        for col in text_cols:
+            draw_line(f"{texts['pdf_text_column']}: {col}", "Helvetica-Bold", 10)
+            text_stats = text_stats_by_col[col]
+            for word, cnt in text_stats.top(1, 10):
+                draw_line(f"  {word}: {cnt}")
+            phrases = text_stats.top(2, 5) + text_stats.top(3, 5)
+            if phrases:
+                draw_line(f"  {texts['pdf_top_phrases']}:", "Helvetica-Oblique", 9)
+                for phrase, cnt in phrases:
+                    draw_line(f"    {phrase[:60]}: {cnt}")
+
+    c.showPage()
+    c.save()
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,25 @@
+import os
+import sys
+import tempfile
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# Stores and columnar copies live under the app home, which is read at import.
+os.environ["SURVEIDATA_HOME"] = tempfile.mkdtemp(prefix="surveidata-tests-")
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+
+@pytest.fixture
+def survey_csv() -> str:
+    """Small survey export: ZIP codes with leading zeros, ISO dates, blanks in most columns."""
+    return os.path.join(FIXTURES, "survey.csv")
+
+
+@pytest.fixture
+def survey_df(survey_csv) -> pd.DataFrame:
+    # Parsed the way the app parses uploads.
+    return pd.read_csv(survey_csv)
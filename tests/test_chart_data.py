@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from chart_data import correlation_pairs, heatmap_data
+
+
+def _corr_with_empty_column() -> pd.DataFrame:
+    # "c" has no overlap with the others, so its correlations are NaN.
+    return pd.DataFrame(
+        [[1.0, 0.6, np.nan], [0.6, 1.0, np.nan], [np.nan, np.nan, np.nan]],
+        index=["a", "b", "c"],
+        columns=["a", "b", "c"],
+    )
+
+
+def test_correlation_pairs_skip_nan_cells():
+    heat = heatmap_data(_corr_with_empty_column(), cluster=False)
+    pairs = correlation_pairs(heat, slice(0, 3), slice(0, 3))
+    assert pairs.to_dict("records") == [{"var_1": "a", "var_2": "b", "r": 0.6}]
+
+
+def test_correlation_pairs_skip_nan_cells_when_clustered():
+    corr = _corr_with_empty_column().reindex(index=list("abcd"), columns=list("abcd"))
+    corr.loc["d"] = corr["d"] = [-0.9, 0.1, np.nan, 1.0]
+    heat = heatmap_data(corr, cluster=True)
+    pairs = correlation_pairs(heat, slice(0, 4), slice(0, 4))
+    assert not pairs["r"].isna().any()
+    assert {frozenset(p) for p in zip(pairs["var_1"], pairs["var_2"])} == {
+        frozenset("ab"), frozenset("ad"), frozenset("bd")
+    }
+    assert list(pairs["r"]) == [-0.9, 0.6, 0.1]
+
+
+def test_correlation_pairs_threshold_and_block():
+    corr = pd.DataFrame(np.eye(3), index=list("xyz"), columns=list("xyz"))
+    corr.loc["x", "y"] = corr.loc["y", "x"] = 0.2
+    corr.loc["x", "z"] = corr.loc["z", "x"] = 0.7
+    heat = heatmap_data(corr, cluster=False)
+    assert correlation_pairs(heat, slice(0, 3), slice(0, 3), threshold=0.5)[["var_1", "var_2"]].values.tolist() == [
+        ["x", "z"]
+    ]
+    # Only the x row and the y column: one pair.
+    assert correlation_pairs(heat, slice(0, 1), slice(1, 2))["r"].tolist() == [0.2]
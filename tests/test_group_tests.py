@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from group_tests import group_comparisons, group_means
+
+NUMERIC = ["age", "score", "satisfaction"]
+
+
+def _groups(df, num, cat):
+    data = df[[num, cat]].dropna()
+    return [g[num].to_numpy() for _, g in data.groupby(cat, sort=False)]
+
+
+def _row(result, num, cat):
+    hit = result[(result["numeric"] == num) & (result["group_by"] == cat)]
+    assert len(hit) == 1
+    return hit.iloc[0]
+
+
+@pytest.mark.parametrize("num", NUMERIC)
+def test_two_groups_match_welch_t_and_kruskal(survey_df, num):
+    result = group_comparisons(survey_df, NUMERIC, ["gender"])
+    row = _row(result, num, "gender")
+    a, b = _groups(survey_df, num, "gender")
+    t = stats.ttest_ind(a, b, equal_var=False)
+    kw = stats.kruskal(a, b)
+    assert row["test"] == "Welch t"
+    assert row["n"] == a.size + b.size
+    assert row["statistic"] == pytest.approx(t.statistic)
+    assert row["p_value"] == pytest.approx(t.pvalue)
+    assert row["kw_h"] == pytest.approx(kw.statistic)
+    assert row["kw_p"] == pytest.approx(kw.pvalue)
+
+
+@pytest.mark.parametrize("num", NUMERIC)
+def test_several_groups_match_anova_and_kruskal(survey_df, num):
+    # region has blanks: those rows belong to no group.
+    result = group_comparisons(survey_df, NUMERIC, ["region"])
+    row = _row(result, num, "region")
+    groups = _groups(survey_df, num, "region")
+    f = stats.f_oneway(*groups)
+    kw = stats.kruskal(*groups)
+    assert row["test"] == "ANOVA F"
+    assert row["groups"] == len(groups)
+    assert row["statistic"] == pytest.approx(f.statistic)
+    assert row["p_value"] == pytest.approx(f.pvalue)
+    assert row["kw_h"] == pytest.approx(kw.statistic)
+    assert row["kw_p"] == pytest.approx(kw.pvalue)
+
+
+def test_unit_weights_match_unweighted(survey_df):
+    plain = group_comparisons(survey_df, NUMERIC, ["gender", "region"])
+    weighted = group_comparisons(survey_df, NUMERIC, ["gender", "region"], weights=np.ones(len(survey_df)))
+    pd.testing.assert_frame_equal(plain, weighted)
+
+
+def test_group_means_match_pandas(survey_df):
+    means = group_means(survey_df, "score", "region").set_index("group")
+    expected = survey_df.groupby("region")["score"].agg(["count", "mean", "std"])
+    for group, row in expected.iterrows():
+        assert means.loc[group, "n"] == row["count"]
+        assert means.loc[group, "mean"] == pytest.approx(row["mean"])
+        assert means.loc[group, "std"] == pytest.approx(row["std"])
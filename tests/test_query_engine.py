@@ -0,0 +1,76 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+pytest.importorskip("duckdb")
+
+import query_engine
+from numeric_stats import describe_numeric
+
+NUMERIC = ["age", "score", "rating", "satisfaction"]
+
+
+@pytest.fixture
+def engine(survey_csv, survey_df, monkeypatch):
+    monkeypatch.setattr(query_engine, "ENGINE", "duckdb")
+    with open(survey_csv, "rb") as f:
+        content_hash = hashlib.sha1(f.read()).hexdigest()
+    engine = query_engine.get_engine(content_hash, survey_df)
+    assert engine is not None
+    return engine
+
+
+def test_pandas_engine_by_default(survey_df, monkeypatch):
+    monkeypatch.setattr(query_engine, "ENGINE", "pandas")
+    assert query_engine.get_engine("unused", survey_df) is None
+
+
+@pytest.mark.parametrize("col", ["zip", "visited", "region", "gender", "age", "score", "rating"])
+def test_value_counts_match_pandas(engine, survey_df, col):
+    # Includes leading-zero ZIP codes and ISO dates, which must keep the
+    # values pandas parsed rather than being re-inferred by DuckDB.
+    got = engine.value_counts(col)
+    expected = survey_df[col].value_counts(dropna=False)
+    assert list(got.to_numpy()) == list(expected.to_numpy())
+    assert got.index.equals(expected.index)
+    assert [type(v) for v in got.index] == [type(v) for v in expected.index]
+
+
+def test_crosstab_matches_pandas(engine, survey_df):
+    got = engine.crosstab("region", "gender")
+    expected = pd.crosstab(survey_df["region"], survey_df["gender"])
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False, check_index_type=False)
+
+
+@pytest.mark.parametrize("col", NUMERIC)
+def test_describe_matches_pandas_path(engine, survey_df, col):
+    got = engine.describe(col)
+    expected = describe_numeric(survey_df, [col]).loc[col]
+    for key in ("count", "sum", "mean", "median", "mode", "min", "max", "std", "normaltest_stat", "normaltest_p"):
+        assert got[key] == pytest.approx(expected[key]), key
+
+
+def test_normaltest_from_moments_matches_scipy(survey_df):
+    x = survey_df["satisfaction"].to_numpy()
+    expected = stats.normaltest(x)
+    got = query_engine.normaltest_from_moments(x.size, stats.skew(x), stats.kurtosis(x, fisher=False))
+    assert got == pytest.approx((expected.statistic, expected.pvalue))
+
+
+def test_corr_matches_pandas(engine, survey_df):
+    got = engine.corr(NUMERIC)
+    pd.testing.assert_frame_equal(got, survey_df[NUMERIC].corr(), check_exact=False)
+
+
+def test_row_sample_matches_pandas(engine, survey_df):
+    rows = np.sort(np.random.default_rng(0).choice(len(survey_df), 25, replace=False))
+    sample = engine.on_rows(rows)
+    part = survey_df.iloc[rows]
+    assert sample.value_counts("region").sort_index().equals(
+        part["region"].value_counts(dropna=False).sort_index()
+    )
+    assert sample.describe("score")["mean"] == pytest.approx(part["score"].mean())
+    pd.testing.assert_frame_equal(sample.corr(NUMERIC), part[NUMERIC].corr(), check_exact=False)
@@ -0,0 +1,41 @@
+import numpy as np
+
+from results_store import ResultsStore
+
+
+def _payload(seed: int) -> np.ndarray:
+    # About 40 kB pickled; random so it does not compress away.
+    return np.random.default_rng(seed).random(5000)
+
+
+def test_get_put_roundtrip(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.sqlite"), memory_items=0)
+    store.put("h1", "describe", ["a", "b"], {"mean": 1.5})
+    assert store.get("h1", "describe", ["a", "b"]) == {"mean": 1.5}
+    assert store.get("h1", "describe", ["a"]) is None
+    calls = []
+    value = store.cached("h1", "corr", [], lambda: calls.append(1) or 42)
+    assert value == store.cached("h1", "corr", [], lambda: calls.append(1) or 0) == 42
+    assert calls == [1]
+
+
+def test_cleanup_evicts_least_recent_and_keeps_new_datasets(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.sqlite"), max_bytes=200_000, memory_items=0)
+    store.touch_dataset("old", "old.csv", 10, 2)
+    for i in range(3):
+        store.put("old", "describe", [i], _payload(i))
+    # Opened in the app but nothing computed yet.
+    store.touch_dataset("fresh", "fresh.csv", 5, 1)
+    store.touch_dataset("busy", "busy.csv", 20, 3)
+    for i in range(3):
+        store.put("busy", "describe", [i], _payload(10 + i))
+
+    # The oldest results went first; "old" still has one, so it stays listed.
+    history = store.history().set_index("name")
+    assert history["results"].to_dict() == {"old.csv": 1, "fresh.csv": 0, "busy.csv": 3}
+
+    store.put("busy", "describe", [3], _payload(13))
+    assert store.get("old", "describe", [2]) is None
+    history = store.history().set_index("name")
+    assert set(history.index) == {"fresh.csv", "busy.csv"}
+    assert history.loc["fresh.csv", "results"] == 0
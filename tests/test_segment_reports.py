@@ -0,0 +1,50 @@
+import io
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from segment_reports import OVERALL_NAME, report_filename, segment_key, segment_rows, zip_reports
+
+
+def _filenames(col, values):
+    used = {f"{OVERALL_NAME}.pdf"}
+    return [report_filename(col, v, used) for v in values]
+
+
+def test_report_filenames_are_unique():
+    names = _filenames("seg", ["a/b", "a b", "a:b", "A B", "", "überall", "x" * 200])
+    assert len({n.lower() for n in names}) == len(names)
+    assert names[:4] == ["seg_a_b.pdf", "seg_a_b_2.pdf", "seg_a_b_3.pdf", "seg_A_B_4.pdf"]
+    assert all(len(n) <= 80 + len("_n.pdf") for n in names)
+
+
+def test_report_filenames_avoid_the_overall_report():
+    used = {f"{OVERALL_NAME}.pdf"}
+    assert report_filename("", OVERALL_NAME, used) == "overall_2.pdf"
+    assert report_filename("", "", used) == "segment.pdf"
+
+
+def test_segment_rows_keep_values_that_print_alike():
+    series = pd.Series([1, "1", 1, None, "b", 1], dtype=object)
+    segments = segment_rows(series)
+    assert [(value, rows.tolist()) for _, value, rows in segments] == [
+        ("1", [0, 2, 5]),
+        ("1", [1]),
+        ("b", [4]),
+    ]
+    keys = {segment_key("h", "col", code, value) for code, value, _ in segments}
+    assert len(keys) == len(segments)
+    assert segment_rows(pd.Series(np.arange(100)), max_segments=50) == []
+
+
+def test_zip_holds_one_entry_per_segment(survey_df):
+    survey_df = survey_df.assign(seg=survey_df["region"].map({"north": OVERALL_NAME, "south": "a/b", "east": "a b"}))
+    segments = segment_rows(survey_df["seg"])
+    names = [f"{OVERALL_NAME}.pdf"] + _filenames("seg", [value for _, value, _ in segments])
+    reports = {name: f"%PDF {name}".encode() for name in names}
+    archive = zipfile.ZipFile(io.BytesIO(zip_reports(reports)))
+    assert archive.namelist() == names
+    assert len(set(archive.namelist())) == len(segments) + 1
+    for name in names:
+        assert archive.read(name) == reports[name]
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sketches import HyperLogLog, KLLSketch, column_sketch
+
+QS = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def _rank_errors(sketch: KLLSketch, x: np.ndarray) -> np.ndarray:
+    s = np.sort(x)
+    ranks = np.searchsorted(s, sketch.quantiles(QS), side="right") / s.size
+    return np.abs(ranks - np.array(QS))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_kll_rank_error_within_eps(seed):
+    x = np.random.default_rng(seed).lognormal(size=200_000)
+    sketch = column_sketch(x, eps=0.01, chunk_rows=10_000)
+    assert sketch.n == x.size
+    assert sketch.min == x.min() and sketch.max == x.max()
+    assert _rank_errors(sketch, x).max() <= sketch.eps
+
+
+def test_kll_merged_chunks_within_eps():
+    x = np.random.default_rng(3).normal(size=150_000)
+    parts = [KLLSketch(eps=0.01, seed=i) for i in range(3)]
+    for part, chunk in zip(parts, np.array_split(x, 3)):
+        part.update(chunk)
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    assert merged.n == x.size
+    assert _rank_errors(merged, x).max() <= merged.eps
+
+
+def test_kll_ignores_missing_values():
+    sketch = KLLSketch()
+    sketch.update([np.nan, 1.0, np.inf, 2.0, 3.0])
+    assert sketch.n == 3
+    assert sketch.quantile(0.5) == 2.0
+    assert np.isnan(KLLSketch().quantile(0.5))
+
+
+@pytest.mark.parametrize("distinct", [500, 20_000, 300_000])
+def test_hyperloglog_estimate_within_tolerance(distinct):
+    # Hashed the way schema inference feeds columns in, with repeats.
+    values = pd.Series(np.random.default_rng(distinct).integers(0, distinct, 3 * distinct))
+    hashes = pd.util.hash_pandas_object(values, index=False).values
+    hll = HyperLogLog(p=12)
+    hll.add_hashes(hashes)
+    exact = values.nunique()
+    # Three standard errors of 1.04 / sqrt(2**p).
+    assert abs(hll.estimate() - exact) / exact < 3 * 1.04 / 64
+
+
+def test_hyperloglog_merge_matches_union():
+    values = pd.Series([f"id{i}" for i in range(50_000)])
+    hashes = pd.util.hash_pandas_object(values, index=False).values
+    a, b, whole = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    a.add_hashes(hashes[:30_000])
+    b.add_hashes(hashes[20_000:])
+    whole.add_hashes(hashes)
+    assert a.merge(b).estimate() == whole.estimate()
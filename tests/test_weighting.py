@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from weighting import effective_n, rake, weighted_crosstab, weighted_value_counts
+
+MARGINS = {
+    "gender": {"F": 0.5, "M": 0.5},
+    "region": {"north": 0.2, "south": 0.3, "east": 0.5},
+}
+
+
+def _shares(df, col, w):
+    counts = weighted_value_counts(df[col], w)
+    return counts / counts.sum()
+
+
+def test_rake_reproduces_margins(survey_df):
+    w, info = rake(survey_df, MARGINS, tol=1e-8)
+    assert info["converged"]
+    assert w.mean() == pytest.approx(1.0)
+    assert (w > 0).all()
+    assert _shares(survey_df, "gender", w).to_dict() == pytest.approx(MARGINS["gender"])
+    # Rows with a blank region have no target and keep out of that margin.
+    known = survey_df["region"].notna().to_numpy()
+    shares = _shares(survey_df[known], "region", w[known])
+    assert shares.to_dict() == pytest.approx(MARGINS["region"])
+
+
+def test_rake_normalises_targets(survey_df):
+    w, _ = rake(survey_df, MARGINS)
+    scaled = {col: {c: 40 * t for c, t in targets.items()} for col, targets in MARGINS.items()}
+    w_scaled, _ = rake(survey_df, scaled)
+    np.testing.assert_allclose(w, w_scaled)
+
+
+def test_rake_reports_unreachable_targets(survey_df):
+    margins = {"gender": {"F": 0.6, "M": 0.5, "X": 0.1, "Y": -0.2}}
+    w, info = rake(survey_df, margins, tol=1e-8)
+    assert info["empty_categories"] == ["gender=X"]
+    assert info["negative_targets"] == ["gender=Y"]
+    assert (w >= 0).all()
+    shares = _shares(survey_df, "gender", w)
+    assert shares["F"] == pytest.approx(0.6 / 1.1)
+
+
+def test_rake_cap_limits_weights(survey_df):
+    margins = {"gender": {"F": 0.95, "M": 0.05}}
+    w, info = rake(survey_df, margins, cap=3.0)
+    assert info["max"] <= 3.0 * w.mean() + 1e-9
+
+
+def test_weighted_crosstab_with_unit_weights(survey_df):
+    got = weighted_crosstab(survey_df["region"], survey_df["gender"], np.ones(len(survey_df)))
+    expected = pd.crosstab(survey_df["region"], survey_df["gender"])
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+    assert effective_n(np.ones(len(survey_df))) == pytest.approx(len(survey_df))
@@ -0,0 +1,511 @@
+import atexit
+import multiprocessing
+import os
+import re
+import string
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from sketches import SpaceSaving
+
+NGRAM_NAMES = {1: "word", 2: "bigram", 3: "trigram"}
+
+# Built-in stopwords for languages NLTK does not ship (JP, KR) and short
+# particles that NLTK's lists miss. Merged with the NLTK sets by the app.
+EXTRA_STOPWORDS = {
+    "ID": {
+        "yang", "dan", "di", "ke", "dari", "ini", "itu", "untuk", "dengan",
+        "ada", "saya", "kami", "akan", "pada", "juga", "sudah", "atau",
+        "karena", "bisa", "adalah", "dalam", "oleh", "jadi", "agar",
+        "bahwa", "nya", "aja", "sih", "kok", "yg", "dgn", "utk",
+    },
+    "JP": {
+        "の", "に", "は", "を", "た", "が", "で", "て", "と", "し", "れ",
+        "さ", "も", "な", "だ", "か", "へ", "や", "ね", "よ", "ます",
+        "です", "ある", "いる", "する", "こと", "もの", "これ", "それ",
+        "あれ", "この", "その", "あの", "から", "まで", "より", "など",
+    },
+    "KR": {
+        "이", "그", "저", "것", "수", "등", "및", "에", "의", "가", "을",
+        "를", "은", "는", "으로", "로", "와", "과", "도", "에서", "하다",
+        "있다", "되다", "그리고", "그러나", "하지만", "또는", "매우",
+        "정말", "너무", "좀", "더",
+    },
+    "CN": {
+        "的", "了", "是", "在", "我", "有", "和", "就", "都", "也", "到",
+        "说", "要", "你", "会", "着", "这", "那", "他", "她", "它", "们",
+        "我们", "吗", "吧", "呢", "啊", "把", "被", "与", "及",
+    },
+}
+
+_CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff66-\uff9f"
+_CJK_OR_WORD = re.compile(f"([{_CJK_CHARS}]+)|([^\\W{_CJK_CHARS}]+)")
+
+
+# ------------------------------------------------------------
+# Tokenizers
+# ------------------------------------------------------------
+class Tokenizer:
+    """Lowercase, strip punctuation, split on whitespace, drop stopwords."""
+
+    name = "whitespace"
+
+    def __init__(self, language: str, stopwords: set, punctuation_table: dict):
+        self.language = language
+        self.stopwords = stopwords
+        self.punctuation_table = punctuation_table
+
+    @property
+    def config_key(self) -> Tuple[str, str]:
+        return (self.name, self.language)
+
+    def tokenize(self, text: str) -> List[str]:
+        text = text.lower().translate(self.punctuation_table)
+        return [tok for tok in text.split() if tok and tok not in self.stopwords]
+
+    def join_phrase(self, tokens: Sequence[str]) -> str:
+        return " ".join(tokens)
+
+
+class CJKBigramTokenizer(Tokenizer):
+    """Segment runs of CJK characters into overlapping character bigrams.
+
+    Japanese and Chinese are written without spaces, so whitespace splitting
+    returns a whole answer as one token. Single-character stopwords break a
+    run before the bigrams are formed; non-CJK words are kept whole.
+    """
+
+    name = "cjk-bigram"
+
+    def _segment(self, run: str) -> List[str]:
+        pieces = []
+        current = []
+        for ch in run:
+            if ch in self.stopwords:
+                if current:
+                    pieces.append("".join(current))
+                current = []
+            else:
+                current.append(ch)
+        if current:
+            pieces.append("".join(current))
+
+        grams = []
+        for piece in pieces:
+            if len(piece) == 1 and "\u3040" <= piece <= "\u30ff":
+                # A lone kana left over after stopword removal carries no meaning.
+                continue
+            if len(piece) <= 2:
+                grams.append(piece)
+            else:
+                grams.extend(piece[i : i + 2] for i in range(len(piece) - 1))
+        return [g for g in grams if g not in self.stopwords]
+
+    def tokenize(self, text: str) -> List[str]:
+        text = text.lower().translate(self.punctuation_table)
+        tokens = []
+        for cjk_run, word in _CJK_OR_WORD.findall(text):
+            if cjk_run:
+                tokens.extend(self._segment(cjk_run))
+            elif word not in self.stopwords:
+                tokens.append(word)
+        return tokens
+
+    def join_phrase(self, tokens: Sequence[str]) -> str:
+        # Consecutive bigrams overlap by one character: "客服" + "服务" -> "客服务".
+        out = tokens[0]
+        for tok in tokens[1:]:
+            if out and tok and out[-1] == tok[0] and len(tok) == 2:
+                out += tok[1:]
+            else:
+                out += " " + tok
+        return out
+
+
+TOKENIZER_CLASSES: Dict[str, Type[Tokenizer]] = {
+    "JP": CJKBigramTokenizer,
+    "CN": CJKBigramTokenizer,
+}
+
+
+def register_tokenizer(language: str, tokenizer_cls: Type[Tokenizer]) -> None:
+    TOKENIZER_CLASSES[language] = tokenizer_cls
+
+
+def make_tokenizer(language: str, stopwords: set, punctuation_table: dict) -> Tokenizer:
+    tokenizer_cls = TOKENIZER_CLASSES.get(language, Tokenizer)
+    return tokenizer_cls(language, stopwords, punctuation_table)
+
+
+PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
+def _nltk_stopwords(name: str) -> set:
+    try:
+        from nltk.corpus import stopwords
+
+        return set(stopwords.words(name))
+    except (LookupError, OSError, ValueError):
+        return set()
+
+
+@lru_cache(maxsize=None)
+def language_stopwords(language: str) -> frozenset:
+    # English stopwords are kept for every language because answers often mix in English.
+    words = _nltk_stopwords("english") | EXTRA_STOPWORDS.get(language, set())
+    if language == "ID":
+        words |= _nltk_stopwords("indonesian")
+    elif language == "CN":
+        words |= _nltk_stopwords("chinese")
+    return frozenset(words)
+
+
+def get_tokenizer(language: str) -> Tokenizer:
+    return make_tokenizer(language, language_stopwords(language), PUNCTUATION_TABLE)
+
+# ------------------------------------------------------------
+# Text statistics engine
+# ------------------------------------------------------------
+class TextStats:
+    """Mergeable per-column text counts: one heavy-hitters sketch per n-gram size."""
+
+    def __init__(self, ngram_max: int = 3, capacity: int = 2000, sample_size: int = 50):
+        self.ngram_max = ngram_max
+        self.capacity = capacity
+        self.sample_size = sample_size
+        self.sketches: Dict[int, SpaceSaving] = {
+            n: SpaceSaving(capacity) for n in range(1, ngram_max + 1)
+        }
+        self.n_docs = 0
+        self.sample_tokens: List[str] = []
+
+    def add_tokens(
+        self,
+        docs: Iterable[Sequence[str]],
+        join_phrase: Callable[[Sequence[str]], str] = " ".join,
+    ) -> None:
+        local = {n: Counter() for n in self.sketches}
+        for tokens in docs:
+            self.n_docs += 1
+            if len(self.sample_tokens) < self.sample_size:
+                self.sample_tokens.extend(tokens[: self.sample_size - len(self.sample_tokens)])
+            for n, counter in local.items():
+                if len(tokens) < n:
+                    continue
+                if n == 1:
+                    counter.update(tokens)
+                else:
+                    counter.update(
+                        join_phrase(tokens[i : i + n]) for i in range(len(tokens) - n + 1)
+                    )
+        for n, counter in local.items():
+            self.sketches[n].update_counts(counter)
+
+    def merge(self, other: "TextStats") -> "TextStats":
+        for n, sketch in other.sketches.items():
+            if n in self.sketches:
+                self.sketches[n].merge(sketch)
+        self.n_docs += other.n_docs
+        if len(self.sample_tokens) < self.sample_size:
+            self.sample_tokens.extend(
+                other.sample_tokens[: self.sample_size - len(self.sample_tokens)]
+            )
+        return self
+
+    def top(self, n: int = 1, k: int = 10) -> List[Tuple[str, int]]:
+        if n not in self.sketches:
+            return []
+        return self.sketches[n].most_common(k)
+
+    def most_common(self, k: int = 10) -> List[Tuple[str, int]]:
+        return self.top(1, k)
+
+
+# ------------------------------------------------------------
+# Parallel multi-column analysis with a shared result cache
+# ------------------------------------------------------------
+class TextStatsCache:
+    """Small thread-safe LRU shared by every session in the server process."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, TextStats]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[TextStats]:
+        with self._lock:
+            stats = self._data.get(key)
+            if stats is not None:
+                self._data.move_to_end(key)
+            return stats
+
+    def put(self, key: Hashable, stats: TextStats) -> None:
+        with self._lock:
+            self._data[key] = stats
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+
+TEXT_STATS_CACHE = TextStatsCache()
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+POOL_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # spawn: forking a threaded server process is not safe.
+            _POOL = ProcessPoolExecutor(
+                max_workers=POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_POOL.shutdown, wait=False, cancel_futures=True)
+        return _POOL
+
+
+def reset_process_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+
+def _run_shards(fn: Callable, arg_tuples: List[tuple]) -> list:
+    """fn(*args) for every shard, across the process pool when there is more than one.
+
+    Inside a pool worker (for example while building a segment report) the
+    shards run inline instead of nesting pools.
+    """
+    in_worker = multiprocessing.parent_process() is not None
+    if len(arg_tuples) > 1 and (os.cpu_count() or 1) > 1 and not in_worker:
+        try:
+            pool = get_process_pool()
+            futures = [pool.submit(fn, *args) for args in arg_tuples]
+            return [f.result() for f in futures]
+        except (BrokenProcessPool, OSError):
+            reset_process_pool()
+    return [fn(*args) for args in arg_tuples]
+
+
+def _count_shard(
+    tokenizer: Tokenizer, values: List[str], ngram_max: int, capacity: int
+) -> TextStats:
+    stats = TextStats(ngram_max=ngram_max, capacity=capacity)
+    stats.add_tokens((tokenizer.tokenize(val) for val in values), tokenizer.join_phrase)
+    return stats
+
+
+def analyze_text_columns(
+    columns: Mapping[str, pd.Series],
+    tokenizer: Tokenizer,
+    column_keys: Mapping[str, str],
+    ngram_max: int = 3,
+    capacity: int = 2000,
+    shard_rows: int = 20000,
+    cache: TextStatsCache = TEXT_STATS_CACHE,
+) -> Dict[str, TextStats]:
+    """Count words and phrases for several text columns at once.
+
+    Rows of every uncached column are cut into shards of ``shard_rows`` and
+    counted across a process pool; shard sketches are merged per column in
+    row order. Results are cached under (column hash, tokenizer config).
+    """
+    results: Dict[str, TextStats] = {}
+    missing: List[str] = []
+    shards: List[Tuple[str, List[str]]] = []
+    for col, series in columns.items():
+        key = (column_keys[col], tokenizer.config_key, ngram_max, capacity)
+        cached = cache.get(key)
+        if cached is not None:
+            results[col] = cached
+            continue
+        missing.append(col)
+        values = [str(val) for val in series.dropna()]
+        results[col] = TextStats(ngram_max=ngram_max, capacity=capacity)
+        for start in range(0, len(values), shard_rows):
+            shards.append((col, values[start : start + shard_rows]))
+
+    partials = _run_shards(
+        _count_shard, [(tokenizer, values, ngram_max, capacity) for _, values in shards]
+    )
+
+    for (col, _), partial in zip(shards, partials):
+        results[col].merge(partial)
+    for col in missing:
+        key = (column_keys[col], tokenizer.config_key, ngram_max, capacity)
+        cache.put(key, results[col])
+    return results
+
+
+# ------------------------------------------------------------
+# Hashed TF-IDF, distinctive keywords and response themes
+# ------------------------------------------------------------
+HASH_FEATURES = 2**18
+
+
+def _hash_shard(tokenizer: Tokenizer, values: List[str], n_features: int):
+    """Sparse term counts of one shard and the first word seen for each hashed feature."""
+    docs = [tokenizer.tokenize(val) for val in values]
+    lengths = np.fromiter((len(d) for d in docs), dtype=np.int64, count=len(docs))
+    words = np.array([tok for doc in docs for tok in doc], dtype=object)
+    features = (pd.util.hash_array(words) % np.uint64(n_features)).astype(np.int64)
+    rows = np.repeat(np.arange(len(docs)), lengths)
+    counts = sparse.csr_matrix(
+        (np.ones(words.size, dtype=np.float32), (rows, features)), shape=(len(docs), n_features)
+    )
+    counts.sum_duplicates()
+    first = pd.Series(words).groupby(features).first()
+    return counts, dict(zip(first.index.tolist(), first.tolist()))
+
+
+def hashed_term_counts(
+    series: pd.Series, tokenizer: Tokenizer, n_features: int = HASH_FEATURES, shard_rows: int = 20000
+) -> Tuple[sparse.csr_matrix, Dict[int, str]]:
+    """Documents x hashed-features count matrix, one row per entry of ``series``.
+
+    Words are hashed into ``n_features`` columns, so memory does not grow
+    with the vocabulary; shards are tokenized across the process pool.
+    Missing answers give empty rows. The dict maps a feature back to a word
+    for display (colliding words share a feature).
+    """
+    values = series.fillna("").astype(str).tolist()
+    shards = [
+        (tokenizer, values[start : start + shard_rows], n_features)
+        for start in range(0, len(values), shard_rows)
+    ]
+    parts = _run_shards(_hash_shard, shards)
+    if not parts:
+        return sparse.csr_matrix((0, n_features), dtype=np.float32), {}
+    terms: Dict[int, str] = {}
+    for _, shard_terms in parts:
+        for feature, word in shard_terms.items():
+            terms.setdefault(feature, word)
+    return sparse.vstack([counts for counts, _ in parts], format="csr"), terms
+
+
+def tfidf(counts: sparse.csr_matrix) -> sparse.csr_matrix:
+    """Sublinear TF times smoothed IDF, rows scaled to unit length."""
+    n_docs = counts.shape[0]
+    doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = np.log((1.0 + n_docs) / (1.0 + doc_freq)) + 1.0
+    x = counts.copy()
+    x.data = (1.0 + np.log(x.data)) * idf[x.indices]
+    norms = np.sqrt(np.asarray(x.multiply(x).sum(axis=1)).ravel())
+    return sparse.diags(np.where(norms > 0, 1.0 / np.maximum(norms, 1e-12), 0.0)) @ x
+
+
+def group_keywords(
+    counts: sparse.csr_matrix, codes: np.ndarray, groups: Sequence, terms: Dict[int, str], top: int = 10
+) -> Dict[str, List[Tuple[str, float]]]:
+    """Distinctive words per group by class-based TF-IDF.
+
+    Term counts are summed per group (one sparse product); a word scores
+    high in a group when it is frequent there and rare across groups.
+    Rows with code -1 belong to no group.
+    """
+    valid = codes >= 0
+    indicator = sparse.csr_matrix(
+        (np.ones(int(valid.sum())), (codes[valid], np.flatnonzero(valid))),
+        shape=(len(groups), counts.shape[0]),
+    )
+    per_group = (indicator @ counts).tocsr()
+    totals = np.asarray(per_group.sum(axis=1)).ravel()
+    word_totals = np.asarray(per_group.sum(axis=0)).ravel()
+    avg_words = totals.mean() if len(totals) else 0.0
+    out = {}
+    for g, name in enumerate(groups):
+        row = per_group.getrow(g)
+        if totals[g] <= 0 or row.nnz == 0:
+            out[str(name)] = []
+            continue
+        score = row.data / totals[g] * np.log1p(avg_words / word_totals[row.indices])
+        best = np.argsort(-score, kind="stable")[:top]
+        out[str(name)] = [(terms.get(int(row.indices[i]), "?"), float(score[i])) for i in best]
+    return out
+
+
+def _kmeans_run(x: sparse.csr_matrix, sample: sparse.csr_matrix, k: int, batch_size: int, n_iter: int, rng):
+    centers = np.zeros((k, x.shape[1]))
+    centers[0] = sample[rng.integers(sample.shape[0])].toarray()
+    best = 1.0 - sample @ centers[0]
+    for i in range(1, k):
+        # k-means++: sample far from the chosen centres (cosine distance).
+        d = np.maximum(best, 0.0)
+        pick = rng.choice(sample.shape[0], p=d / d.sum()) if d.sum() > 0 else rng.integers(sample.shape[0])
+        centers[i] = sample[pick].toarray()
+        best = np.minimum(best, 1.0 - sample @ centers[i])
+
+    seen = np.zeros(k)
+    for _ in range(n_iter):
+        batch = x[rng.choice(x.shape[0], min(batch_size, x.shape[0]), replace=False)]
+        assign = np.asarray((batch @ centers.T).argmax(axis=1)).ravel()
+        members = sparse.csr_matrix(
+            (np.ones(assign.size), (assign, np.arange(assign.size))), shape=(k, assign.size)
+        )
+        n_c = np.bincount(assign, minlength=k)
+        seen += n_c
+        moved = n_c > 0
+        sums = (members @ batch).toarray()
+        centers[moved] += (sums[moved] - n_c[moved, None] * centers[moved]) / seen[moved, None]
+        norms = np.linalg.norm(centers, axis=1, keepdims=True)
+        centers = centers / np.where(norms > 0, norms, 1.0)
+    return centers
+
+
+def minibatch_kmeans(
+    x: sparse.csr_matrix, k: int, batch_size: int = 2048, n_iter: int = 100, n_init: int = 3, seed: int = 0
+) -> np.ndarray:
+    """Cluster labels from spherical mini-batch k-means on unit-length rows.
+
+    Only features that occur are kept, so centres stay small. Each of
+    ``n_init`` runs starts from k-means++ on a sample and updates the
+    centres from random batches with per-centre learning rates; the run
+    with the highest total cosine similarity on the sample wins. Rows
+    without any words get label -1.
+    """
+    rng = np.random.default_rng(seed)
+    rows = np.flatnonzero(x.getnnz(axis=1) > 0)
+    labels = np.full(x.shape[0], -1, dtype=np.int64)
+    if rows.size == 0:
+        return labels
+    used = np.unique(x.indices)
+    x = x[rows][:, used].tocsr()
+    k = min(k, x.shape[0])
+    sample = x[rng.choice(x.shape[0], min(x.shape[0], 20 * k + 1000), replace=False)]
+
+    centers, score = None, -np.inf
+    for _ in range(n_init):
+        run = _kmeans_run(x, sample, k, batch_size, n_iter, rng)
+        run_score = np.asarray((sample @ run.T).max(axis=1)).sum()
+        if run_score > score:
+            centers, score = run, run_score
+
+    for start in range(0, rows.size, 50_000):
+        labels[rows[start : start + 50_000]] = np.asarray(
+            (x[start : start + 50_000] @ centers.T).argmax(axis=1)
+        ).ravel()
+    return labels
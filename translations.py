@@ -0,0 +1,1212 @@
+# ------------------------------------------------------------
+# Multi-language texts (EN, ID, JP, KR, CN)
+# ------------------------------------------------------------
+TEXTS = {
+    "EN": {
+        "title": "Survey Analysis Dashboard 📊",
+        "subtitle": "Upload your survey data to see clear statistics, visual insights, and multi-language PDF reports ready to share 📈.",
+        "dark_mode": "Dark mode 🌙",
+        "language": "Language 🌐",
+        "upload_label": "Upload CSV or Excel file 📂",
+        "no_file": "Please upload a CSV or Excel file to get started 🚀.",
+        "invalid_file_type": "This file type is not supported, please upload a CSV, XLS, or XLSX file ⚠️.",
+        "preview_title": "Data preview 👀",
+        "summary_title": "Dataset overview 📂",
+        "rows": "Rows 🔢",
+        "cols": "Columns 🔢",
+        "num_cols": "Numeric columns 🔢",
+        "cat_cols": "Categorical columns 🧩",
+        "text_cols": "Text columns 📝",
+        "tab_desc": "Descriptive statistics 📌",
+        "tab_visual": "Visualizations 📊",
+        "tab_corr": "Correlations & tests 🔗",
+        "tab_text": "Text analysis 💬",
+        "select_numeric_col": "Select a numeric column 🎯",
+        "select_numeric_col_x": "Select numeric variable X 📈",
+        "select_numeric_col_y": "Select numeric variable Y 📉",
+        "select_cat_col1": "Select categorical variable 1 🧩",
+        "select_cat_col2": "Select categorical variable 2 🧩",
+        "select_cat_col": "Select a categorical column 🧩",
+        "select_text_col": "Select a text column 📝",
+        "desc_stats_title": "Summary statistics for your data 📌",
+        "normaltest_title": "Normality test (D’Agostino–Pearson) 📏",
+        "normaltest_not_enough": "There are not enough valid observations for a normality test (need at least 8) ⚠️.",
+        "statistic": "Statistic 📊",
+        "pvalue": "p-value 📉",
+        "alpha_note": "Using significance level α = 0.05 🎯.",
+        "normal_interpret": "The data is likely consistent with a normal distribution (fail to reject H₀) ✅.",
+        "not_normal_interpret": "The data is unlikely to follow a normal distribution (reject H₀) ⚠️.",
+        "hist_title": "Histogram 📊",
+        "box_title": "Boxplot 📦",
+        "freq_table_title": "Frequency table 📋",
+        "count": "Count 🔢",
+        "percent": "Percent (%) 📈",
+        "visual_hist_title": "Histogram for the selected numeric column 📊",
+        "visual_box_title": "Boxplot for the selected numeric column 📦",
+        "scatter_title": "Scatter plot 🔍",
+        "scatter_x": "X axis ➡️",
+        "scatter_y": "Y axis ⬆️",
+        "bar_title": "Bar chart (top 20 categories) 📊",
+        "corr_matrix_title": "Pearson correlation matrix 🧮",
+        "pearson_title": "Pearson correlation 📐",
+        "spearman_title": "Spearman correlation 📐",
+        "r_label": "Correlation (r) 🔗",
+        "strength": "Strength 💪",
+        "direction": "Direction ➡️",
+        "p_label": "p-value 📉",
+        "strength_very_weak": "Very weak 💧",
+        "strength_weak": "Weak 🌱",
+        "strength_moderate": "Moderate ⚖️",
+        "strength_strong": "Strong 💪",
+        "strength_very_strong": "Very strong 🔥",
+        "direction_positive": "Positive 📈",
+        "direction_negative": "Negative 📉",
+        "direction_none": "None 🚫",
+        "chi_square_title": "Chi-square test of independence 🧪",
+        "chi2_label": "Chi-square (χ²) 🧮",
+        "df_label": "Degrees of freedom 🎚️",
+        "expected_title": "Expected frequencies 📊",
+        "observed_title": "Observed frequencies 📊",
+        "text_preview_title": "Sample tokens from your text 👀",
+        "top_words_title": "Top 10 most frequent words 🔝",
+        "pdf_title": "Export PDF report 📄",
+        "pdf_button": "Create PDF report 🖨️",
+        "pdf_ready": "Your PDF report is ready, use the button below to download it ✅.",
+        "pdf_download": "Download PDF report 📥",
+        "pdf_filename": "survey_report_en.pdf",
+        "no_numeric": "No numeric columns were detected in this dataset ⚠️.",
+        "no_categorical": "No categorical columns were detected in this dataset ⚠️.",
+        "no_text": "No text columns were detected in this dataset ⚠️.",
+        "loading_pdf": "Building your PDF report, please wait ⏳.",
+        "scatter_note": "The scatter plot only uses rows where both selected columns have valid values ✅.",
+        "matrix_note": "The correlation matrix is computed using the Pearson method for all numeric columns 📐.",
+        "text_processing_note": "Text is lowercased, punctuation and stopwords for the text language are removed, and Japanese/Chinese text is split into character pairs 🧹.",
+        "app_footer": "Built with Streamlit · Survey analysis assistant 💡.",
+        "team_members_title": "Team members 👥",
+        "team_members_box_title": "Project team 👥",
+        "team_member_1": "Regina Vinta Amanullah (004202400133) 🎓",
+        "team_member_2": "Bill Christian Panjaitan (004202400058) 🎓",
+        "team_member_3": "Putri Lasrida Malau (004202400132) 🎓",
+        "team_member_4": "Elizabeth Kurniawan (004202400001) 🎓",
+        "pdf_generated_on": "Generated on %Y-%m-%d %H:%M:%S 🕒",
+        "pdf_dataset_metadata": "Dataset metadata ℹ️",
+        "pdf_numeric_stats": "Numeric column statistics 🔢",
+        "pdf_scatter_plots": "Scatter plots for numeric pairs �",
+        "pdf_ready": "Your PDF report is ready, use the button below to download it ✅.",
+        "pdf_download": "Download PDF report 📥",
+        "pdf_filename": "survey_report_en.pdf",
+        "no_numeric": "No numeric columns were detected in this dataset ⚠️.",
+        "no_categorical": "No categorical columns were detected in this dataset ⚠️.",
+        "no_text": "No text columns were detected in this dataset ⚠️.",
+        "loading_pdf": "Building your PDF report, please wait ⏳.",
+        "scatter_note": "The scatter plot only uses rows where both selected columns have valid values ✅.",
+        "matrix_note": "The correlation matrix is computed using the Pearson method for all numeric columns 📐.",
+        "text_processing_note": "Text is lowercased, punctuation and stopwords for the text language are removed, and Japanese/Chinese text is split into character pairs 🧹.",
+        "app_footer": "Built with Streamlit · Survey analysis assistant 💡.",
+        "team_members_title": "Team members 👥",
+        "team_members_box_title": "Project team 👥",
+        "team_member_1": "Regina Vinta Amanullah (004202400133) 🎓",
+        "team_member_2": "Bill Christian Panjaitan (004202400058) 🎓",
+        "team_member_3": "Putri Lasrida Malau (004202400132) 🎓",
+        "team_member_4": "Elizabeth Kurniawan (004202400001) 🎓",
+        "pdf_generated_on": "Generated on %Y-%m-%d %H:%M:%S 🕒",
+        "pdf_dataset_metadata": "Dataset metadata ℹ️",
+        "pdf_numeric_stats": "Numeric column statistics 🔢",
+        "pdf_scatter_plots": "Scatter plots for numeric pairs 🔍",
+        "pdf_cat_cols": "Categorical columns (top 10 categories) 🧩",
+        "pdf_text_summary": "Text analysis summary (top 10 words per column) 💬",
+        "pdf_column": "Column 📁",
+        "pdf_text_column": "Text column 📝",
+        "pdf_normaltest_stat_label": "Normality statistic 📏",
+        "pdf_p_value_label": "p-value 📉",
+        "pdf_count": "Count 🔢",
+        "pdf_mean": "Mean 📊",
+        "pdf_median": "Median 📊",
+        "pdf_mode": "Mode 📊",
+        "pdf_min": "Min 🔽",
+        "pdf_max": "Max 🔼",
+        "pdf_std": "Std. deviation 📊",
+        "pdf_normaltest_not_enough": "Normality test: not enough data (n < 8) ⚠️.",
+        "no_valid_data": "There are no valid values in the selected column ⚠️.",
+        "select_two_diff_numeric": "Please select two different numeric columns 🙂.",
+        "not_enough_corr": "There is not enough data to compute a reliable correlation ⚠️.",
+        "not_enough_scatter": "There is not enough complete data to draw a scatter plot ⚠️.",
+        "select_two_diff_categorical": "Please select two different categorical columns 🙂.",
+        "not_enough_chi": "There is not enough data to run a Chi-square test ⚠️.",
+        "quick_interp_title": "Quick interpretation 💡",
+        "quick_interp_hist_1": "The histogram shows how often values fall into each range, revealing the overall shape of the distribution 📊.",
+        "quick_interp_hist_2": "The boxplot summarizes the median, spread, and possible outliers in the selected numeric column 📦.",
+        "quick_interp_scatter_1": "An upward pattern suggests a positive relationship between the two variables 📈.",
+        "quick_interp_scatter_2": "A downward pattern suggests a negative relationship, while a cloud of points suggests little or no linear relationship 📉.",
+        "quick_interp_corr_1": "Correlations close to +1 or -1 indicate a strong linear relationship between the variables 📐.",
+        "quick_interp_corr_2": "Correlations near 0 suggest little or no linear relationship ⚖️.",
+        "x_total": "X Total",
+        "y_total": "Y Total",
+        "x_total_interp": "X Total is the sum of all values in the 'x' column.",
+        "y_total_interp": "Y Total is the sum of all values in the 'y' column.",
+        "rows_interp": "Number of rows in the dataset.",
+        "cols_interp": "Number of columns in the dataset.",
+        "num_cols_interp": "Number of numeric columns.",
+        "cat_cols_interp": "Number of categorical columns.",
+        "top_phrases_title": "Top 10 most frequent phrases (2–3 words) 🔝",
+        "pdf_top_phrases": "Top phrases",
+        "text_language": "Text language 🌐",
+        "column_roles_title": "Column roles ⚙️",
+        "max_categories_label": "Max. distinct values for a categorical text column",
+        "max_codes_label": "Max. distinct integer codes for an ordinal numeric column",
+        "column_roles_note": "Roles are detected from a sample and checked with an approximate distinct count. Ordinal columns are analysed both as numbers and as categories. Your changes are saved for files with the same columns 💾.",
+        "queue_position": "The server is busy, your request is number {pos} in the queue ⏳.",
+        "limits_rows": "This dataset is larger than the per-session limit, so a random sample of {rows} of {total} rows is analysed 🎲.",
+        "limits_cols": "Only the first {cols} of {total} columns are analysed because of the per-session limit ⚠️.",
+        "missing_title": "Missing data overview 🕳️",
+        "complete_rows": "Complete rows ✅",
+        "cols_with_missing": "Columns with missing values ⚠️",
+        "missing_by_column": "Missing values per column (%)",
+        "missing_patterns": "Most common missing-data patterns",
+        "pairwise_complete_title": "Rows available for each pair of numeric columns",
+        "no_missing": "There are no missing values in this dataset ✅.",
+        "wave_title": "Wave-over-wave comparison 📈",
+        "wave_upload_label": "Upload two or more survey waves (same questionnaire)",
+        "wave_note": "Waves are ordered by file name. Each file is summarised once and its summary is cached, so adding a wave only processes the new file.",
+        "wave_need_two": "Upload at least two waves to compare them.",
+        "wave_numeric_trend": "Mean per wave (95% CI)",
+        "wave_tests_title": "Change between consecutive waves (Welch t-test)",
+        "wave_cat_trend": "Distribution per wave (%) with Chi-square test",
+        "wave_corr_trend": "Correlation per wave (p_change: Fisher z test against the previous wave)",
+        "history_title": "Saved analyses 🗂️",
+        "history_empty": "No saved analyses yet. Results are stored automatically as you explore a dataset.",
+        "history_note": "Results are saved per dataset on this server, so reopening the same file reuses them instead of recomputing. The oldest results are removed when the store reaches its size limit.",
+        "history_clear": "Clear saved results",
+        "history_cleared": "Saved results cleared.",
+        "engine_note": "Frequencies, Chi-square tests, descriptive statistics and correlations are computed with DuckDB over the complete uploaded file.",
+        "heatmap_cluster": "Group related variables (hierarchical clustering)",
+        "heatmap_threshold": "Hide correlations with |r| below",
+        "heatmap_rows": "Drill-down rows (positions in the heatmap)",
+        "heatmap_cols": "Drill-down columns (positions in the heatmap)",
+        "heatmap_pairs_title": "Pairs in the selected region (strongest first)",
+        "preview_show": "Show data preview",
+        "preview_page_rows": "Rows per page",
+        "preview_row_page": "Row page (of {total})",
+        "preview_col_page": "Column page (of {total})",
+        "preview_note": "Pages are loaded on demand; text longer than {chars} characters is shortened.",
+        "group_tests_title": "Group comparisons (numeric × categorical) 👥",
+        "group_tests_note": "Welch t-test for two groups, one-way ANOVA for more, plus Kruskal-Wallis as a rank-based check. Effect sizes: Hedges g, eta² and epsilon². Sorted by p-value.",
+        "group_means_title": "Group means for a pair",
+        "not_enough_groups": "No numeric × categorical pair has at least two groups with data.",
+        "pdf_group_by": "Group by",
+        "pdf_test": "Test",
+        "pdf_effect": "Effect size",
+        "weight_title": "Survey weights (raking) ⚖️",
+        "weight_note": "Pick the variables with known population distributions and enter the target percentages. Weights are fitted by raking and used for descriptive statistics, frequencies, crosstabs, Chi-square tests, correlations and group comparisons.",
+        "weight_vars": "Raking variables",
+        "weight_category": "Category",
+        "weight_target": "Target %",
+        "weight_apply": "Apply weights",
+        "weight_deff": "Design effect",
+        "weight_range": "Weight range",
+        "weight_iterations": "Iterations",
+        "weight_not_converged": "Raking did not fully converge (largest share error {error:.2g}).",
+        "weight_empty": "No respondents in: {categories}. These targets were left out and the rest rescaled.",
+        "pdf_weighted": "Weighted by raking, design effect",
+        "quality_title": "Response quality 🧹",
+        "quality_note": "Flags straight-lining (the same answer to every X or Y item), exact duplicate rows, near-duplicate open-ended answers and, with a duration column, speeders who finished much faster than the median.",
+        "quality_duration": "Duration column",
+        "quality_no_duration": "(none)",
+        "quality_speeder_ratio": "Speeder threshold (share of median duration)",
+        "quality_straightline": "Straight-lining ({group} items)",
+        "quality_duplicate": "Exact duplicates",
+        "quality_near_duplicate": "Near-duplicate text",
+        "quality_speeder": "Speeders",
+        "quality_any": "Any flag",
+        "quality_exclude": "Exclude flagged rows from all analyses",
+        "quality_excluded": "{rows} flagged rows are excluded from every analysis below.",
+        "multi_title": "Multiple-response questions ☑️",
+        "multi_select": "Multiple-response column",
+        "multi_option": "Option",
+        "multi_pct_respondents": "% of respondents",
+        "multi_note": "Percentages of respondents can add up to more than 100% because each respondent may choose several options.",
+        "multi_no_options": "No options found in this column.",
+        "multi_co_selection": "Options chosen together",
+        "multi_by": "Break down by",
+        "multi_crosstab_note": "Share (%) of each group's answering respondents that chose the option.",
+        "fa_title": "Factor analysis (PCA / EFA) 🧭",
+        "fa_items": "Items",
+        "fa_not_enough": "Select at least 3 items.",
+        "fa_method": "Method",
+        "fa_pca": "Principal components",
+        "fa_efa": "Exploratory factor analysis",
+        "fa_factors": "Number of factors (0 = eigenvalue > 1)",
+        "fa_scree": "Scree plot",
+        "fa_kept": "Factors kept",
+        "fa_explained": "Variance explained",
+        "fa_item": "Item",
+        "fa_communality": "Communality",
+        "fa_note": "Loadings are varimax-rotated and computed from pairwise-complete correlations. Items loading strongly (|loading| ≥ 0.4) on the same factor tend to measure the same construct.",
+        "themes_title": "Themes and keywords 🗂️",
+        "themes_no_words": "No words left after tokenization.",
+        "themes_count": "Number of themes",
+        "keywords_by": "Keywords for",
+        "keywords_by_theme": "Themes (clusters)",
+        "themes_theme": "Theme",
+        "themes_keywords": "Keywords",
+        "themes_example": "Example response",
+        "themes_note": "Responses are grouped by similar wording (TF-IDF + k-means). Keywords are the words most typical of each theme compared with the others.",
+        "keywords_note": "Keywords are the words most typical of each group compared with the other groups (class-based TF-IDF).",
+        "segment_title": "Reports by segment 🗃️",
+        "segment_by": "One report per value of",
+        "segment_button": "Create segment reports (ZIP)",
+        "segment_starting": "Starting segment reports...",
+        "segment_progress": "{done}/{total} reports ready (last: {name})",
+        "segment_too_many": "This column has more than {max} values; pick a column with fewer segments.",
+        "segment_download": "Download segment reports (ZIP)",
+        "pdf_pairs_top": "The {n} most strongly correlated pairs (by |r|)",
+        "fa_no_variance": "Fewer than 2 of the selected items vary; factor analysis needs items whose answers differ.",
+        "weight_negative": "Negative targets for: {categories}. They were treated as 0%.",
+        "group_tests_weighted": "Weighted: means, variances and t/ANOVA use the survey weights with Kish effective sizes; Kruskal-Wallis uses unweighted ranks; n is unweighted.",
+        "engine_note_sample": "Frequencies, Chi-square tests, descriptive statistics and correlations are computed with DuckDB over the sampled rows.",
+    },
+    "ID": {
+        "title": "Dasbor Analisis Survei 📊",
+        "subtitle": "Unggah data survei Anda untuk melihat statistik, visualisasi, dan laporan PDF multi-bahasa yang siap dibagikan 📈.",
+        "dark_mode": "Mode gelap 🌙",
+        "language": "Bahasa 🌐",
+        "upload_label": "Unggah file CSV atau Excel 📂",
+        "no_file": "Silakan unggah file CSV atau Excel terlebih dahulu 🚀.",
+        "invalid_file_type": "Tipe file tidak didukung, unggah file CSV, XLS, atau XLSX ⚠️.",
+        "preview_title": "Pratinjau data 👀",
+        "summary_title": "Ringkasan dataset 📂",
+        "rows": "Jumlah baris 🔢",
+        "cols": "Jumlah kolom 🔢",
+        "num_cols": "Kolom numerik 🔢",
+        "cat_cols": "Kolom kategorikal 🧩",
+        "text_cols": "Kolom teks 📝",
+        "tab_desc": "Statistik deskriptif 📌",
+        "tab_visual": "Visualisasi 📊",
+        "tab_corr": "Korelasi & uji 🔗",
+        "tab_text": "Analisis teks 💬",
+        "select_numeric_col": "Pilih satu kolom numerik 🎯",
+        "select_numeric_col_x": "Pilih variabel numerik X 📈",
+        "select_numeric_col_y": "Pilih variabel numerik Y 📉",
+        "select_cat_col1": "Pilih variabel kategorikal 1 🧩",
+        "select_cat_col2": "Pilih variabel kategorikal 2 🧩",
+        "select_cat_col": "Pilih kolom kategorikal 🧩",
+        "select_text_col": "Pilih kolom teks 📝",
+        "desc_stats_title": "Statistik ringkas untuk data Anda 📌",
+        "normaltest_title": "Uji normalitas (D’Agostino–Pearson) 📏",
+        "normaltest_not_enough": "Data valid belum cukup untuk uji normalitas (minimal 8) ⚠️.",
+        "statistic": "Statistik 📊",
+        "pvalue": "p-value 📉",
+        "alpha_note": "Menggunakan taraf signifikansi α = 0,05 🎯.",
+        "normal_interpret": "Data kemungkinan mengikuti distribusi normal (gagal menolak H₀) ✅.",
+        "not_normal_interpret": "Data kemungkinan tidak berdistribusi normal (menolak H₀) ⚠️.",
+        "hist_title": "Histogram 📊",
+        "box_title": "Boxplot 📦",
+        "freq_table_title": "Tabel frekuensi 📋",
+        "count": "Frekuensi 🔢",
+        "percent": "Persentase (%) 📈",
+        "visual_hist_title": "Histogram untuk kolom numerik terpilih 📊",
+        "visual_box_title": "Boxplot untuk kolom numerik terpilih 📦",
+        "scatter_title": "Scatter plot 🔍",
+        "scatter_x": "Sumbu X ➡️",
+        "scatter_y": "Sumbu Y ⬆️",
+        "bar_title": "Diagram batang (20 kategori teratas) 📊",
+        "corr_matrix_title": "Matriks korelasi Pearson 🧮",
+        "pearson_title": "Korelasi Pearson 📐",
+        "spearman_title": "Korelasi Spearman 📐",
+        "r_label": "Korelasi (r) 🔗",
+        "strength": "Kekuatan 💪",
+        "direction": "Arah ➡️",
+        "p_label": "p-value 📉",
+        "strength_very_weak": "Sangat lemah 💧",
+        "strength_weak": "Lemah 🌱",
+        "strength_moderate": "Sedang ⚖️",
+        "strength_strong": "Kuat 💪",
+        "strength_very_strong": "Sangat kuat 🔥",
+        "direction_positive": "Positif 📈",
+        "direction_negative": "Negatif 📉",
+        "direction_none": "Tidak ada 🚫",
+        "chi_square_title": "Uji Chi-square keterkaitan 🧪",
+        "chi2_label": "Chi-square (χ²) 🧮",
+        "df_label": "Derajat bebas 🎚️",
+        "expected_title": "Frekuensi harapan 📊",
+        "observed_title": "Frekuensi teramati 📊",
+        "text_preview_title": "Contoh token dari teks 👀",
+        "top_words_title": "10 kata paling sering muncul 🔝",
+        "pdf_title": "Ekspor laporan PDF 📄",
+        "pdf_button": "Buat laporan PDF 🖨️",
+        "pdf_ready": "Laporan PDF siap, gunakan tombol di bawah untuk mengunduh ✅.",
+        "pdf_download": "Unduh laporan PDF 📥",
+        "pdf_filename": "laporan_survei_id.pdf",
+        "no_numeric": "Tidak ada kolom numerik yang terdeteksi di dataset ini ⚠️.",
+        "no_categorical": "Tidak ada kolom kategorikal yang terdeteksi di dataset ini ⚠️.",
+        "no_text": "Tidak ada kolom teks yang terdeteksi di dataset ini ⚠️.",
+        "loading_pdf": "Sedang membuat laporan PDF, harap tunggu ⏳.",
+        "scatter_note": "Scatter plot hanya menggunakan baris dengan data lengkap pada kedua kolom ✅.",
+        "matrix_note": "Matriks korelasi dihitung dengan metode Pearson untuk semua kolom numerik 📐.",
+        "text_processing_note": "Teks diubah ke huruf kecil, tanda baca dan stopword sesuai bahasa teks dihapus, dan teks Jepang/Mandarin dipecah menjadi pasangan karakter 🧹.",
+        "app_footer": "Dibangun dengan Streamlit · Asisten analisis survei 💡.",
+        "team_members_title": "Anggota tim 👥",
+        "team_members_box_title": "Tim proyek 👥",
+        "team_member_1": "Regina Vinta Amanullah (004202400133) 🎓",
+        "team_member_2": "Bill Christian Panjaitan (004202400058) 🎓",
+        "team_member_3": "Putri Lasrida Malau (004202400132) 🎓",
+        "team_member_4": "Elizabeth Kurniawan (004202400001) 🎓",
+        "pdf_generated_on": "Dihasilkan pada %Y-%m-%d %H:%M:%S 🕒",
+        "pdf_dataset_metadata": "Metadata dataset ℹ️",
+        "pdf_numeric_stats": "Statistik kolom numerik 🔢",
+        "pdf_scatter_plots": "Scatter plot untuk pasangan numerik 🔍",
+        "pdf_cat_cols": "Kolom kategorikal (20 kategori teratas) 🧩",
+        "pdf_text_summary": "Ringkasan analisis teks (10 kata teratas per kolom) 💬",
+        "pdf_column": "Kolom 📁",
+        "pdf_text_column": "Kolom teks 📝",
+        "pdf_normaltest_stat_label": "Statistik normalitas 📏",
+        "pdf_p_value_label": "p-value 📉",
+        "pdf_count": "Jumlah 🔢",
+        "pdf_mean": "Rata-rata 📊",
+        "pdf_median": "Median 📊",
+        "pdf_mode": "Modus 📊",
+        "pdf_min": "Min 🔽",
+        "pdf_max": "Maks 🔼",
+        "pdf_std": "Simpangan baku 📊",
+        "pdf_normaltest_not_enough": "Uji normalitas: data belum cukup (n < 8) ⚠️.",
+        "no_valid_data": "Tidak ada nilai valid pada kolom yang dipilih ⚠️.",
+        "select_two_diff_numeric": "Pilih dua kolom numerik yang berbeda 🙂.",
+        "not_enough_corr": "Data belum cukup untuk menghitung korelasi yang andal ⚠️.",
+        "not_enough_scatter": "Data lengkap belum cukup untuk membuat scatter plot ⚠️.",
+        "select_two_diff_categorical": "Pilih dua kolom kategorikal yang berbeda 🙂.",
+        "not_enough_chi": "Data belum cukup untuk menjalankan uji Chi-square ⚠️.",
+        "quick_interp_title": "Interpretasi singkat 💡",
+        "quick_interp_hist_1": "Histogram menunjukkan seberapa sering nilai muncul pada tiap rentang sehingga bentuk distribusi data terlihat 📊.",
+        "quick_interp_hist_2": "Boxplot merangkum median, sebaran, dan kemungkinan outlier pada kolom numerik terpilih 📦.",
+        "quick_interp_scatter_1": "Pola yang cenderung naik menunjukkan hubungan positif antara dua variabel 📈.",
+        "quick_interp_scatter_2": "Pola yang cenderung turun menunjukkan hubungan negatif, sedangkan titik menyebar acak menandakan hubungan linear yang lemah atau tidak ada 📉.",
+        "quick_interp_corr_1": "Korelasi mendekati +1 atau -1 menandakan hubungan linear yang kuat antara variabel 📐.",
+        "quick_interp_corr_2": "Korelasi mendekati 0 menandakan hubungan linear yang lemah atau hampir tidak ada ⚖️.",
+        "x_total": "Total X",
+        "y_total": "Total Y",
+        "x_total_interp": "Total X adalah jumlah semua nilai di kolom 'x'.",
+        "y_total_interp": "Total Y adalah jumlah semua nilai di kolom 'y'.",
+        "rows_interp": "Jumlah baris dalam dataset.",
+        "cols_interp": "Jumlah kolom dalam dataset.",
+        "num_cols_interp": "Jumlah kolom numerik.",
+        "cat_cols_interp": "Jumlah kolom kategorikal.",
+        "top_phrases_title": "10 frasa paling sering muncul (2–3 kata) 🔝",
+        "pdf_top_phrases": "Frasa teratas",
+        "text_language": "Bahasa teks 🌐",
+        "column_roles_title": "Peran kolom ⚙️",
+        "max_categories_label": "Maks. nilai unik untuk kolom teks kategorikal",
+        "max_codes_label": "Maks. kode bilangan bulat unik untuk kolom numerik ordinal",
+        "column_roles_note": "Peran dideteksi dari sampel lalu dicek dengan perkiraan jumlah nilai unik. Kolom ordinal dianalisis sebagai angka sekaligus kategori. Perubahan Anda disimpan untuk file dengan kolom yang sama 💾.",
+        "queue_position": "Server sedang sibuk, permintaan Anda berada di antrean nomor {pos} ⏳.",
+        "limits_rows": "Dataset melebihi batas per sesi, sehingga dianalisis sampel acak {rows} dari {total} baris 🎲.",
+        "limits_cols": "Hanya {cols} dari {total} kolom pertama yang dianalisis karena batas per sesi ⚠️.",
+        "missing_title": "Ringkasan data hilang 🕳️",
+        "complete_rows": "Baris lengkap ✅",
+        "cols_with_missing": "Kolom dengan nilai hilang ⚠️",
+        "missing_by_column": "Nilai hilang per kolom (%)",
+        "missing_patterns": "Pola data hilang yang paling umum",
+        "pairwise_complete_title": "Jumlah baris yang tersedia untuk tiap pasangan kolom numerik",
+        "no_missing": "Tidak ada nilai yang hilang di dataset ini ✅.",
+        "wave_title": "Perbandingan antar gelombang 📈",
+        "wave_upload_label": "Unggah dua gelombang survei atau lebih (kuesioner yang sama)",
+        "wave_note": "Gelombang diurutkan berdasarkan nama file. Setiap file diringkas sekali dan ringkasannya disimpan, sehingga menambah gelombang hanya memproses file baru.",
+        "wave_need_two": "Unggah minimal dua gelombang untuk membandingkannya.",
+        "wave_numeric_trend": "Rata-rata per gelombang (IK 95%)",
+        "wave_tests_title": "Perubahan antar gelombang berurutan (uji t Welch)",
+        "wave_cat_trend": "Distribusi per gelombang (%) dengan uji Chi-square",
+        "wave_corr_trend": "Korelasi per gelombang (p_change: uji z Fisher terhadap gelombang sebelumnya)",
+        "history_title": "Analisis tersimpan 🗂️",
+        "history_empty": "Belum ada analisis tersimpan. Hasil disimpan otomatis saat Anda menjelajahi dataset.",
+        "history_note": "Hasil disimpan per dataset di server ini, sehingga membuka file yang sama memakai ulang hasil tersebut tanpa menghitung ulang. Hasil terlama dihapus saat penyimpanan mencapai batas ukurannya.",
+        "history_clear": "Hapus hasil tersimpan",
+        "history_cleared": "Hasil tersimpan telah dihapus.",
+        "engine_note": "Frekuensi, uji Chi-square, statistik deskriptif, dan korelasi dihitung dengan DuckDB atas seluruh file yang diunggah.",
+        "heatmap_cluster": "Kelompokkan variabel yang berkaitan (klaster hierarkis)",
+        "heatmap_threshold": "Sembunyikan korelasi dengan |r| di bawah",
+        "heatmap_rows": "Baris rincian (posisi pada heatmap)",
+        "heatmap_cols": "Kolom rincian (posisi pada heatmap)",
+        "heatmap_pairs_title": "Pasangan dalam area terpilih (terkuat lebih dulu)",
+        "preview_show": "Tampilkan pratinjau data",
+        "preview_page_rows": "Baris per halaman",
+        "preview_row_page": "Halaman baris (dari {total})",
+        "preview_col_page": "Halaman kolom (dari {total})",
+        "preview_note": "Halaman dimuat sesuai kebutuhan; teks lebih dari {chars} karakter dipersingkat.",
+        "group_tests_title": "Perbandingan kelompok (numerik × kategorikal) 👥",
+        "group_tests_note": "Uji t Welch untuk dua kelompok, ANOVA satu arah untuk lebih, ditambah Kruskal-Wallis sebagai pemeriksaan berbasis peringkat. Ukuran efek: Hedges g, eta² dan epsilon². Diurutkan menurut p-value.",
+        "group_means_title": "Rata-rata kelompok untuk satu pasangan",
+        "not_enough_groups": "Tidak ada pasangan numerik × kategorikal dengan setidaknya dua kelompok berisi data.",
+        "pdf_group_by": "Kelompok",
+        "pdf_test": "Uji",
+        "pdf_effect": "Ukuran efek",
+        "weight_title": "Bobot survei (raking) ⚖️",
+        "weight_note": "Pilih variabel yang distribusi populasinya diketahui dan isi persentase targetnya. Bobot dihitung dengan raking dan dipakai untuk statistik deskriptif, frekuensi, tabulasi silang, uji Chi-square, korelasi, dan perbandingan kelompok.",
+        "weight_vars": "Variabel raking",
+        "weight_category": "Kategori",
+        "weight_target": "Target %",
+        "weight_apply": "Terapkan bobot",
+        "weight_deff": "Design effect",
+        "weight_range": "Rentang bobot",
+        "weight_iterations": "Iterasi",
+        "weight_not_converged": "Raking belum sepenuhnya konvergen (galat proporsi terbesar {error:.2g}).",
+        "weight_empty": "Tidak ada responden pada: {categories}. Target ini diabaikan dan sisanya diskalakan ulang.",
+        "pdf_weighted": "Dibobot dengan raking, design effect",
+        "quality_title": "Kualitas respons 🧹",
+        "quality_note": "Menandai straight-lining (jawaban sama untuk semua item X atau Y), baris duplikat persis, jawaban terbuka yang hampir sama, dan, jika ada kolom durasi, responden yang selesai jauh lebih cepat dari median.",
+        "quality_duration": "Kolom durasi",
+        "quality_no_duration": "(tidak ada)",
+        "quality_speeder_ratio": "Ambang speeder (proporsi durasi median)",
+        "quality_straightline": "Straight-lining (item {group})",
+        "quality_duplicate": "Duplikat persis",
+        "quality_near_duplicate": "Teks hampir duplikat",
+        "quality_speeder": "Speeder",
+        "quality_any": "Ada tanda",
+        "quality_exclude": "Keluarkan baris bertanda dari semua analisis",
+        "quality_excluded": "{rows} baris bertanda dikeluarkan dari semua analisis di bawah.",
+        "multi_title": "Pertanyaan jawaban ganda ☑️",
+        "multi_select": "Kolom jawaban ganda",
+        "multi_option": "Opsi",
+        "multi_pct_respondents": "% responden",
+        "multi_note": "Persentase responden bisa berjumlah lebih dari 100% karena setiap responden dapat memilih beberapa opsi.",
+        "multi_no_options": "Tidak ada opsi yang ditemukan di kolom ini.",
+        "multi_co_selection": "Opsi yang dipilih bersamaan",
+        "multi_by": "Rinci menurut",
+        "multi_crosstab_note": "Persentase (%) responden yang menjawab di setiap kelompok yang memilih opsi tersebut.",
+        "fa_title": "Analisis faktor (PCA / EFA) 🧭",
+        "fa_items": "Butir",
+        "fa_not_enough": "Pilih minimal 3 butir.",
+        "fa_method": "Metode",
+        "fa_pca": "Komponen utama",
+        "fa_efa": "Analisis faktor eksploratori",
+        "fa_factors": "Jumlah faktor (0 = nilai eigen > 1)",
+        "fa_scree": "Scree plot",
+        "fa_kept": "Faktor dipertahankan",
+        "fa_explained": "Varians yang dijelaskan",
+        "fa_item": "Butir",
+        "fa_communality": "Komunalitas",
+        "fa_note": "Muatan dirotasi varimax dan dihitung dari korelasi pairwise-complete. Butir yang bermuatan kuat (|muatan| ≥ 0,4) pada faktor yang sama cenderung mengukur konstruk yang sama.",
+        "themes_title": "Tema dan kata kunci 🗂️",
+        "themes_no_words": "Tidak ada kata yang tersisa setelah tokenisasi.",
+        "themes_count": "Jumlah tema",
+        "keywords_by": "Kata kunci untuk",
+        "keywords_by_theme": "Tema (klaster)",
+        "themes_theme": "Tema",
+        "themes_keywords": "Kata kunci",
+        "themes_example": "Contoh jawaban",
+        "themes_note": "Jawaban dikelompokkan berdasarkan kemiripan kata (TF-IDF + k-means). Kata kunci adalah kata yang paling khas untuk setiap tema dibandingkan tema lainnya.",
+        "keywords_note": "Kata kunci adalah kata yang paling khas untuk setiap kelompok dibandingkan kelompok lainnya (TF-IDF berbasis kelas).",
+        "segment_title": "Laporan per segmen 🗃️",
+        "segment_by": "Satu laporan per nilai dari",
+        "segment_button": "Buat laporan per segmen (ZIP)",
+        "segment_starting": "Memulai laporan per segmen...",
+        "segment_progress": "{done}/{total} laporan selesai (terakhir: {name})",
+        "segment_too_many": "Kolom ini memiliki lebih dari {max} nilai; pilih kolom dengan segmen yang lebih sedikit.",
+        "segment_download": "Unduh laporan per segmen (ZIP)",
+        "pdf_pairs_top": "{n} pasangan dengan korelasi terkuat (menurut |r|)",
+        "fa_no_variance": "Kurang dari 2 butir terpilih yang bervariasi; analisis faktor memerlukan butir dengan jawaban yang berbeda-beda.",
+        "weight_negative": "Target negatif pada: {categories}. Target ini dianggap 0%.",
+        "group_tests_weighted": "Berbobot: rata-rata, varians, serta uji t/ANOVA memakai bobot survei dengan ukuran efektif Kish; Kruskal-Wallis memakai peringkat tanpa bobot; n tanpa bobot.",
+        "engine_note_sample": "Frekuensi, uji Chi-square, statistik deskriptif, dan korelasi dihitung dengan DuckDB atas baris sampel.",
+    },
+    "JP": {
+        "title": "アンケート分析ダッシュボード 📊",
+        "subtitle": "アンケートデータをアップロードして、多言語PDFレポート付きの統計と可視化を確認できます 📈。",
+        "dark_mode": "ダークモード 🌙",
+        "language": "言語 🌐",
+        "upload_label": "CSV または Excel ファイルをアップロード 📂",
+        "no_file": "はじめに CSV または Excel ファイルをアップロードしてください 🚀。",
+        "invalid_file_type": "このファイル形式はサポートされていません。CSV・XLS・XLSX をアップロードしてください ⚠️。",
+        "preview_title": "データプレビュー 👀",
+        "summary_title": "データセット概要 📂",
+        "rows": "行数 🔢",
+        "cols": "列数 🔢",
+        "num_cols": "数値列 🔢",
+        "cat_cols": "カテゴリ列 🧩",
+        "text_cols": "テキスト列 📝",
+        "tab_desc": "記述統計 📌",
+        "tab_visual": "可視化 📊",
+        "tab_corr": "相関・検定 🔗",
+        "tab_text": "テキスト分析 💬",
+        "select_numeric_col": "数値列を選択してください 🎯",
+        "select_numeric_col_x": "数値変数 X を選択 📈",
+        "select_numeric_col_y": "数値変数 Y を選択 📉",
+        "select_cat_col1": "カテゴリ変数 1 を選択 🧩",
+        "select_cat_col2": "カテゴリ変数 2 を選択 🧩",
+        "select_cat_col": "カテゴリ列を選択 🧩",
+        "select_text_col": "テキスト列を選択 📝",
+        "desc_stats_title": "データの要約統計量 📌",
+        "normaltest_title": "正規性検定（D’Agostino–Pearson）📏",
+        "normaltest_not_enough": "正規性検定を行うには有効なデータが 8 件以上必要です ⚠️。",
+        "statistic": "統計量 📊",
+        "pvalue": "p 値 📉",
+        "alpha_note": "有意水準 α = 0.05 を使用します 🎯。",
+        "normal_interpret": "データは正規分布とみなせる可能性があります（帰無仮説を棄却しません）✅。",
+        "not_normal_interpret": "データは正規分布から外れている可能性があります（帰無仮説を棄却します）⚠️。",
+        "hist_title": "ヒストグラム 📊",
+        "box_title": "箱ひげ図 📦",
+        "freq_table_title": "度数表 📋",
+        "count": "件数 🔢",
+        "percent": "割合 (%) 📈",
+        "visual_hist_title": "選択した数値列のヒストグラム 📊",
+        "visual_box_title": "選択した数値列の箱ひげ図 📦",
+        "scatter_title": "散布図 🔍",
+        "scatter_x": "X 軸 ➡️",
+        "scatter_y": "Y 軸 ⬆️",
+        "bar_title": "棒グラフ（上位 20 カテゴリ）📊",
+        "corr_matrix_title": "ピアソン相関行列 🧮",
+        "pearson_title": "ピアソン相関係数 📐",
+        "spearman_title": "スピアマン相関係数 📐",
+        "r_label": "相関係数 (r) 🔗",
+        "strength": "強さ 💪",
+        "direction": "方向 ➡️",
+        "p_label": "p 値 📉",
+        "strength_very_weak": "とても弱い 💧",
+        "strength_weak": "弱い 🌱",
+        "strength_moderate": "中程度 ⚖️",
+        "strength_strong": "強い 💪",
+        "strength_very_strong": "非常に強い 🔥",
+        "direction_positive": "正の相関 📈",
+        "direction_negative": "負の相関 📉",
+        "direction_none": "相関なし 🚫",
+        "chi_square_title": "カイ二乗検定（独立性）🧪",
+        "chi2_label": "カイ二乗値 (χ²) 🧮",
+        "df_label": "自由度 🎚️",
+        "expected_title": "期待度数 📊",
+        "observed_title": "観測度数 📊",
+        "text_preview_title": "テキストからのサンプルトークン 👀",
+        "top_words_title": "出現頻度トップ 10 の単語 🔝",
+        "pdf_title": "PDF レポートをエクスポート 📄",
+        "pdf_button": "PDF レポートを作成 🖨️",
+        "pdf_ready": "PDF レポートの準備ができました。下のボタンからダウンロードできます ✅。",
+        "pdf_download": "PDF レポートをダウンロード 📥",
+        "pdf_filename": "survey_report_jp.pdf",
+        "no_numeric": "このデータセットには数値列がありません ⚠️。",
+        "no_categorical": "このデータセットにはカテゴリ列がありません ⚠️。",
+        "no_text": "このデータセットにはテキスト列がありません ⚠️。",
+        "loading_pdf": "PDF レポートを作成しています。しばらくお待ちください ⏳。",
+        "scatter_note": "散布図は両方の列に有効な値がある行のみを使用します ✅。",
+        "matrix_note": "相関行列はすべての数値列に対してピアソン法で計算されます 📐。",
+        "text_processing_note": "テキストは小文字化され、句読点とテキスト言語のストップワードが除去され、日本語・中国語は 2 文字単位に分割されます 🧹。",
+        "app_footer": "Streamlit で構築されたアンケート分析アシスタントです 💡。",
+        "team_members_title": "チームメンバー 👥",
+        "team_members_box_title": "プロジェクトチーム 👥",
+        "team_member_1": "Regina Vinta Amanullah (004202400133) 🎓",
+        "team_member_2": "Bill Christian Panjaitan (004202400058) 🎓",
+        "team_member_3": "Putri Lasrida Malau (004202400132) 🎓",
+        "team_member_4": "Elizabeth Kurniawan (004202400001) 🎓",
+        "pdf_generated_on": "%Y-%m-%d %H:%M:%S に生成 🕒",
+        "pdf_dataset_metadata": "データセットのメタデータ ℹ️",
+        "pdf_numeric_stats": "数値列の統計量 🔢",
+        "pdf_scatter_plots": "数値ペアの散布図 🔍",
+        "pdf_cat_cols": "カテゴリ列（上位 10 カテゴリ）🧩",
+        "pdf_text_summary": "テキスト分析サマリー（各列の上位 10 単語）💬",
+        "pdf_column": "列 📁",
+        "pdf_text_column": "テキスト列 📝",
+        "pdf_normaltest_stat_label": "正規性統計量 📏",
+        "pdf_p_value_label": "p 値 📉",
+        "pdf_count": "件数 🔢",
+        "pdf_mean": "平均 📊",
+        "pdf_median": "中央値 📊",
+        "pdf_mode": "最頻値 📊",
+        "pdf_min": "最小値 🔽",
+        "pdf_max": "最大値 🔼",
+        "pdf_std": "標準偏差 📊",
+        "pdf_normaltest_not_enough": "正規性検定：データが不足しています（n < 8）⚠️。",
+        "no_valid_data": "選択した列には有効な値がありません ⚠️。",
+        "select_two_diff_numeric": "異なる 2 つの数値列を選択してください 🙂。",
+        "not_enough_corr": "相関を計算するにはデータが不足しています ⚠️。",
+        "not_enough_scatter": "散布図を描くには十分なデータがありません ⚠️。",
+        "select_two_diff_categorical": "異なる 2 つのカテゴリ列を選択してください 🙂。",
+        "not_enough_chi": "カイ二乗検定を行うにはデータが不足しています ⚠️。",
+        "quick_interp_title": "かんたんな読み取りポイント 💡",
+        "quick_interp_hist_1": "ヒストグラムは値がどの範囲にどれくらい出現するかを示し、分布の形を直感的に確認できます 📊。",
+        "quick_interp_hist_2": "箱ひげ図は中央値、ばらつき、および外れ値の有無を一度に把握するのに役立ちます 📦。",
+        "quick_interp_scatter_1": "右上がりのパターンは 2 つの変数の間に正の関係があることを示します 📈。",
+        "quick_interp_scatter_2": "右下がりのパターンは負の関係を示し、点が雲のように散らばっている場合は線形な関係が弱いかほとんどないことを示します 📉。",
+        "quick_interp_corr_1": "相関係数が +1 や -1 に近いほど、2 つの変数の線形関係は強くなります 📐。",
+        "quick_interp_corr_2": "相関係数が 0 に近い場合は、線形な関係が弱いかほとんどないことを意味します ⚖️。",
+        "top_phrases_title": "出現頻度トップ 10 のフレーズ（2〜3 語）🔝",
+        "pdf_top_phrases": "上位フレーズ",
+        "text_language": "テキストの言語 🌐",
+        "column_roles_title": "列の役割 ⚙️",
+        "max_categories_label": "カテゴリ列とみなす最大ユニーク値数",
+        "max_codes_label": "順序尺度の数値列とみなす最大整数コード数",
+        "column_roles_note": "役割はサンプルから推定され、近似ユニーク数で確認されます。順序列は数値とカテゴリの両方として分析されます。変更は同じ列構成のファイルに保存されます 💾。",
+        "queue_position": "サーバーが混み合っています。あなたのリクエストは待ち行列の {pos} 番目です ⏳。",
+        "limits_rows": "データセットがセッションごとの上限を超えているため、{total} 行のうち {rows} 行の無作為サンプルを分析します 🎲。",
+        "limits_cols": "セッションごとの上限により、{total} 列のうち最初の {cols} 列のみを分析します ⚠️。",
+        "missing_title": "欠損データの概要 🕳️",
+        "complete_rows": "欠損のない行 ✅",
+        "cols_with_missing": "欠損のある列 ⚠️",
+        "missing_by_column": "列ごとの欠損率 (%)",
+        "missing_patterns": "よく見られる欠損パターン",
+        "pairwise_complete_title": "数値列ペアごとの利用可能な行数",
+        "no_missing": "このデータセットに欠損値はありません ✅。",
+        "wave_title": "ウェーブ間比較 📈",
+        "wave_upload_label": "2 つ以上の調査ウェーブをアップロード（同じ質問票）",
+        "wave_note": "ウェーブはファイル名順に並びます。各ファイルは一度だけ集計されキャッシュされるため、ウェーブを追加しても新しいファイルだけが処理されます。",
+        "wave_need_two": "比較するには 2 つ以上のウェーブをアップロードしてください。",
+        "wave_numeric_trend": "ウェーブごとの平均（95% 信頼区間）",
+        "wave_tests_title": "連続するウェーブ間の変化（Welch の t 検定）",
+        "wave_cat_trend": "ウェーブごとの分布（%）とカイ二乗検定",
+        "wave_corr_trend": "ウェーブごとの相関（p_change: 前のウェーブとの Fisher z 検定）",
+        "history_title": "保存済みの分析 🗂️",
+        "history_empty": "保存済みの分析はまだありません。データセットを操作すると結果が自動的に保存されます。",
+        "history_note": "結果はこのサーバーにデータセットごとに保存され、同じファイルを開き直すと再計算せずに再利用されます。保存容量の上限に達すると古い結果から削除されます。",
+        "history_clear": "保存済みの結果を削除",
+        "history_cleared": "保存済みの結果を削除しました。",
+        "engine_note": "度数、カイ二乗検定、記述統計、相関はアップロードされたファイル全体に対して DuckDB で計算されます。",
+        "heatmap_cluster": "関連する変数をまとめる（階層クラスタリング）",
+        "heatmap_threshold": "|r| がこの値未満の相関を非表示",
+        "heatmap_rows": "ドリルダウンの行（ヒートマップ上の位置）",
+        "heatmap_cols": "ドリルダウンの列（ヒートマップ上の位置）",
+        "heatmap_pairs_title": "選択した範囲のペア（強い順）",
+        "preview_show": "データのプレビューを表示",
+        "preview_page_rows": "1 ページあたりの行数",
+        "preview_row_page": "行ページ（全 {total}）",
+        "preview_col_page": "列ページ（全 {total}）",
+        "preview_note": "ページは必要なときに読み込まれます。{chars} 文字を超えるテキストは短縮されます。",
+        "group_tests_title": "グループ比較（数値 × カテゴリ）👥",
+        "group_tests_note": "2群はWelchのt検定、3群以上は一元配置分散分析、順位ベースの確認としてKruskal-Wallis検定。効果量：Hedges g、eta²、epsilon²。p値順に並べています。",
+        "group_means_title": "ペアのグループ平均",
+        "not_enough_groups": "データのある群が2つ以上ある数値 × カテゴリのペアがありません。",
+        "pdf_group_by": "グループ",
+        "pdf_test": "検定",
+        "pdf_effect": "効果量",
+        "weight_title": "調査ウェイト（レイキング）⚖️",
+        "weight_note": "母集団の分布がわかっている変数を選び、目標の割合を入力してください。ウェイトはレイキングで推定され、記述統計、度数、クロス集計、カイ二乗検定、相関、グループ比較に使われます。",
+        "weight_vars": "レイキング変数",
+        "weight_category": "カテゴリ",
+        "weight_target": "目標 %",
+        "weight_apply": "ウェイトを適用",
+        "weight_deff": "デザイン効果",
+        "weight_range": "ウェイトの範囲",
+        "weight_iterations": "反復回数",
+        "weight_not_converged": "レイキングが完全には収束しませんでした（最大の割合誤差 {error:.2g}）。",
+        "weight_empty": "回答者がいないカテゴリ：{categories}。これらの目標は除外し、残りを再スケールしました。",
+        "pdf_weighted": "レイキングによる重み付け、デザイン効果",
+        "quality_title": "回答品質 🧹",
+        "quality_note": "ストレートライン（X または Y のすべての項目に同じ回答）、完全な重複行、ほぼ同じ自由回答、さらに所要時間の列があれば中央値よりはるかに速く回答したスピーダーを検出します。",
+        "quality_duration": "所要時間の列",
+        "quality_no_duration": "（なし）",
+        "quality_speeder_ratio": "スピーダーのしきい値（所要時間の中央値に対する割合）",
+        "quality_straightline": "ストレートライン（{group} 項目）",
+        "quality_duplicate": "完全重複",
+        "quality_near_duplicate": "ほぼ重複するテキスト",
+        "quality_speeder": "スピーダー",
+        "quality_any": "いずれかに該当",
+        "quality_exclude": "該当する行をすべての分析から除外",
+        "quality_excluded": "該当する {rows} 行を以下のすべての分析から除外しています。",
+        "multi_title": "複数回答の設問 ☑️",
+        "multi_select": "複数回答の列",
+        "multi_option": "選択肢",
+        "multi_pct_respondents": "回答者の割合 (%)",
+        "multi_note": "回答者は複数の選択肢を選べるため、回答者の割合の合計は 100% を超えることがあります。",
+        "multi_no_options": "この列に選択肢が見つかりません。",
+        "multi_co_selection": "同時に選ばれた選択肢",
+        "multi_by": "内訳の基準",
+        "multi_crosstab_note": "各グループの回答者のうち、その選択肢を選んだ割合 (%)。",
+        "fa_title": "因子分析 (PCA / EFA) 🧭",
+        "fa_items": "項目",
+        "fa_not_enough": "3 つ以上の項目を選択してください。",
+        "fa_method": "手法",
+        "fa_pca": "主成分分析",
+        "fa_efa": "探索的因子分析",
+        "fa_factors": "因子数（0 = 固有値 > 1）",
+        "fa_scree": "スクリープロット",
+        "fa_kept": "採用した因子数",
+        "fa_explained": "説明された分散",
+        "fa_item": "項目",
+        "fa_communality": "共通性",
+        "fa_note": "負荷量はバリマックス回転済みで、ペアワイズ完全な相関から計算されています。同じ因子に強く負荷する項目（|負荷量| ≥ 0.4）は同じ構成概念を測定している傾向があります。",
+        "themes_title": "テーマとキーワード 🗂️",
+        "themes_no_words": "トークン化後に単語が残りませんでした。",
+        "themes_count": "テーマ数",
+        "keywords_by": "キーワードの対象",
+        "keywords_by_theme": "テーマ（クラスター）",
+        "themes_theme": "テーマ",
+        "themes_keywords": "キーワード",
+        "themes_example": "回答例",
+        "themes_note": "回答は言葉の類似性（TF-IDF + k-means）でグループ化されます。キーワードは、他のテーマと比べて各テーマに最も特徴的な単語です。",
+        "keywords_note": "キーワードは、他のグループと比べて各グループに最も特徴的な単語です（クラスベース TF-IDF）。",
+        "segment_title": "セグメント別レポート 🗃️",
+        "segment_by": "値ごとにレポートを作成する列",
+        "segment_button": "セグメント別レポートを作成 (ZIP)",
+        "segment_starting": "セグメント別レポートを開始しています...",
+        "segment_progress": "{done}/{total} 件のレポートが完了（最新: {name}）",
+        "segment_too_many": "この列には {max} を超える値があります。セグメントの少ない列を選んでください。",
+        "segment_download": "セグメント別レポートをダウンロード (ZIP)",
+        "pdf_pairs_top": "相関が最も強い {n} 組（|r| 順）",
+        "fa_no_variance": "選択した項目のうちばらつきのある項目が 2 つ未満です。因子分析には回答にばらつきのある項目が必要です。",
+        "weight_negative": "負の目標値：{categories}。0% として扱いました。",
+        "group_tests_weighted": "重み付き：平均・分散・t検定/分散分析は調査ウェイトと Kish の有効サンプルサイズを使用します。Kruskal-Wallis は重みなしの順位、n は重みなしの件数です。",
+        "engine_note_sample": "度数、カイ二乗検定、記述統計、相関はサンプリングされた行に対して DuckDB で計算されます。",
+    },
+    "KR": {
+        "title": "설문 분석 대시보드 📊",
+        "subtitle": "설문 데이터를 업로드하고 통계, 시각화, 다국어 PDF 보고서를 한눈에 확인하세요 📈.",
+        "dark_mode": "다크 모드 🌙",
+        "language": "언어 🌐",
+        "upload_label": "CSV 또는 Excel 파일 업로드 📂",
+        "no_file": "먼저 CSV 또는 Excel 파일을 업로드해 주세요 🚀.",
+        "invalid_file_type": "지원되지 않는 파일 형식입니다. CSV, XLS 또는 XLSX 파일을 업로드해 주세요 ⚠️.",
+        "preview_title": "데이터 미리보기 👀",
+        "summary_title": "데이터셋 개요 📂",
+        "rows": "행 수 🔢",
+        "cols": "열 수 🔢",
+        "num_cols": "수치형 열 🔢",
+        "cat_cols": "범주형 열 🧩",
+        "text_cols": "텍스트 열 📝",
+        "tab_desc": "기술 통계 📌",
+        "tab_visual": "시각화 📊",
+        "tab_corr": "상관관계 및 검정 🔗",
+        "tab_text": "텍스트 분석 💬",
+        "select_numeric_col": "수치형 열을 선택하세요 🎯",
+        "select_numeric_col_x": "수치 변수 X 선택 📈",
+        "select_numeric_col_y": "수치 변수 Y 선택 📉",
+        "select_cat_col1": "범주형 변수 1 선택 🧩",
+        "select_cat_col2": "범주형 변수 2 선택 🧩",
+        "select_cat_col": "범주형 열 선택 🧩",
+        "select_text_col": "텍스트 열 선택 📝",
+        "desc_stats_title": "데이터 요약 통계 📌",
+        "normaltest_title": "정규성 검정 (D’Agostino–Pearson) 📏",
+        "normaltest_not_enough": "정규성 검정을 수행할 만큼 충분한 데이터(최소 8개)가 없습니다 ⚠️.",
+        "statistic": "통계량 📊",
+        "pvalue": "p 값 📉",
+        "alpha_note": "유의수준 α = 0.05 를 사용합니다 🎯.",
+        "normal_interpret": "데이터가 정규 분포와 일치할 가능성이 높습니다 (귀무가설 기각 실패) ✅.",
+        "not_normal_interpret": "데이터가 정규 분포에서 벗어날 가능성이 큽니다 (귀무가설 기각) ⚠️.",
+        "hist_title": "히스토그램 📊",
+        "box_title": "박스플롯 📦",
+        "freq_table_title": "도수표 📋",
+        "count": "개수 🔢",
+        "percent": "비율 (%) 📈",
+        "visual_hist_title": "선택한 수치형 열의 히스토그램 📊",
+        "visual_box_title": "선택한 수치형 열의 박스플롯 📦",
+        "scatter_title": "산점도 🔍",
+        "scatter_x": "X축 ➡️",
+        "scatter_y": "Y축 ⬆️",
+        "bar_title": "막대 그래프 (상위 20개 범주) 📊",
+        "corr_matrix_title": "피어슨 상관 행렬 🧮",
+        "pearson_title": "피어슨 상관계수 📐",
+        "spearman_title": "스피어만 상관계수 📐",
+        "r_label": "상관계수 (r) 🔗",
+        "strength": "강도 💪",
+        "direction": "방향 ➡️",
+        "p_label": "p 값 📉",
+        "strength_very_weak": "매우 약함 💧",
+        "strength_weak": "약함 🌱",
+        "strength_moderate": "보통 ⚖️",
+        "strength_strong": "강함 💪",
+        "strength_very_strong": "매우 강함 🔥",
+        "direction_positive": "양의 상관 📈",
+        "direction_negative": "음의 상관 📉",
+        "direction_none": "상관 없음 🚫",
+        "chi_square_title": "카이제곱 독립성 검정 🧪",
+        "chi2_label": "카이제곱 (χ²) 🧮",
+        "df_label": "자유도 🎚️",
+        "expected_title": "기대 도수 📊",
+        "observed_title": "관측 도수 📊",
+        "text_preview_title": "텍스트 토큰 예시 👀",
+        "top_words_title": "가장 자주 등장한 단어 10개 🔝",
+        "pdf_title": "PDF 보고서 내보내기 📄",
+        "pdf_button": "PDF 보고서 생성 🖨️",
+        "pdf_ready": "PDF 보고서가 준비되었습니다. 아래 버튼으로 다운로드하세요 ✅.",
+        "pdf_download": "PDF 보고서 다운로드 📥",
+        "pdf_filename": "survey_report_kr.pdf",
+        "no_numeric": "이 데이터셋에는 수치형 열이 없습니다 ⚠️.",
+        "no_categorical": "이 데이터셋에는 범주형 열이 없습니다 ⚠️.",
+        "no_text": "이 데이터셋에는 텍스트 열이 없습니다 ⚠️.",
+        "loading_pdf": "PDF 보고서를 생성하는 중입니다. 잠시만 기다려 주세요 ⏳.",
+        "scatter_note": "산점도는 두 열 모두 값이 존재하는 행만 사용합니다 ✅.",
+        "matrix_note": "상관 행렬은 모든 수치형 열에 대해 피어슨 방법으로 계산됩니다 📐.",
+        "text_processing_note": "텍스트는 소문자로 변환되고, 구두점과 텍스트 언어의 불용어가 제거되며, 일본어/중국어는 두 글자 단위로 분할됩니다 🧹.",
+        "app_footer": "Streamlit으로 제작된 설문 분석 도우미입니다 💡.",
+        "team_members_title": "팀 구성원 👥",
+        "team_members_box_title": "프로젝트 팀 👥",
+        "team_member_1": "Regina Vinta Amanullah (004202400133) 🎓",
+        "team_member_2": "Bill Christian Panjaitan (004202400058) 🎓",
+        "team_member_3": "Putri Lasrida Malau (004202400132) 🎓",
+        "team_member_4": "Elizabeth Kurniawan (004202400001) 🎓",
+        "pdf_generated_on": "%Y-%m-%d %H:%M:%S 에 생성됨 🕒",
+        "pdf_dataset_metadata": "데이터셋 메타데이터 ℹ️",
+        "pdf_numeric_stats": "수치형 열 통계 🔢",
+        "pdf_scatter_plots": "수치형 쌍에 대한 산점도 🔍",
+        "pdf_cat_cols": "범주형 열 (상위 10개 범주) 🧩",
+        "pdf_text_summary": "텍스트 분석 요약 (열별 상위 10개 단어) 💬",
+        "pdf_column": "열 📁",
+        "pdf_text_column": "텍스트 열 📝",
+        "pdf_normaltest_stat_label": "정규성 통계량 📏",
+        "pdf_p_value_label": "p 값 📉",
+        "pdf_count": "개수 🔢",
+        "pdf_mean": "평균 📊",
+        "pdf_median": "중앙값 📊",
+        "pdf_mode": "최빈값 📊",
+        "pdf_min": "최솟값 🔽",
+        "pdf_max": "최댓값 🔼",
+        "pdf_std": "표준편차 📊",
+        "pdf_normaltest_not_enough": "정규성 검정: 데이터가 부족합니다 (n < 8) ⚠️.",
+        "no_valid_data": "선택한 열에 유효한 값이 없습니다 ⚠️.",
+        "select_two_diff_numeric": "서로 다른 두 개의 수치형 열을 선택해 주세요 🙂.",
+        "not_enough_corr": "상관 분석을 수행하기에 데이터가 부족합니다 ⚠️.",
+        "not_enough_scatter": "산점도를 그리기에 충분한 데이터가 없습니다 ⚠️.",
+        "select_two_diff_categorical": "서로 다른 두 개의 범주형 열을 선택해 주세요 🙂.",
+        "not_enough_chi": "카이제곱 검정을 수행하기에 데이터가 부족합니다 ⚠️.",
+        "quick_interp_title": "빠른 해석 포인트 💡",
+        "quick_interp_hist_1": "히스토그램은 값이 각 구간에 얼마나 자주 나타나는지 보여 주어 분포의 전반적인 모양을 파악할 수 있습니다 📊.",
+        "quick_interp_hist_2": "박스플롯은 선택한 수치형 열의 중앙값, 분산 정도, 이상치를 한눈에 요약해 줍니다 📦.",
+        "quick_interp_scatter_1": "점들이 대체로 오른쪽 위로 증가하는 모양이면 두 변수 사이에 양의 관계가 있음을 의미합니다 📈.",
+        "quick_interp_scatter_2": "점들이 오른쪽 아래로 줄어드는 모양이면 음의 관계를, 구름처럼 흩어져 있으면 선형 관계가 약하거나 거의 없음을 의미합니다 📉.",
+        "quick_interp_corr_1": "상관계수가 +1 또는 -1에 가까울수록 두 변수 간의 선형 관계가 강하다는 뜻입니다 📐.",
+        "quick_interp_corr_2": "상관계수가 0에 가까우면 선형 관계가 약하거나 거의 없다는 뜻입니다 ⚖️.",
+        "top_phrases_title": "가장 자주 등장한 구절 10개 (2–3단어) 🔝",
+        "pdf_top_phrases": "상위 구절",
+        "text_language": "텍스트 언어 🌐",
+        "column_roles_title": "열 역할 ⚙️",
+        "max_categories_label": "범주형 텍스트 열의 최대 고유값 수",
+        "max_codes_label": "서열형 수치 열의 최대 정수 코드 수",
+        "column_roles_note": "역할은 표본으로 추정한 뒤 근사 고유값 수로 확인합니다. 서열형 열은 수치와 범주 모두로 분석됩니다. 변경 사항은 같은 열 구성의 파일에 저장됩니다 💾.",
+        "queue_position": "서버가 바쁩니다. 요청이 대기열 {pos}번째입니다 ⏳.",
+        "limits_rows": "데이터셋이 세션별 한도를 초과하여 {total}행 중 {rows}행의 무작위 표본을 분석합니다 🎲.",
+        "limits_cols": "세션별 한도로 인해 {total}개 열 중 처음 {cols}개 열만 분석합니다 ⚠️.",
+        "missing_title": "결측 데이터 개요 🕳️",
+        "complete_rows": "완전한 행 ✅",
+        "cols_with_missing": "결측값이 있는 열 ⚠️",
+        "missing_by_column": "열별 결측 비율 (%)",
+        "missing_patterns": "가장 흔한 결측 패턴",
+        "pairwise_complete_title": "수치형 열 쌍별 사용 가능한 행 수",
+        "no_missing": "이 데이터셋에는 결측값이 없습니다 ✅.",
+        "wave_title": "웨이브 간 비교 📈",
+        "wave_upload_label": "두 개 이상의 설문 웨이브 업로드 (동일한 설문지)",
+        "wave_note": "웨이브는 파일 이름 순으로 정렬됩니다. 각 파일은 한 번만 요약되어 캐시되므로 웨이브를 추가하면 새 파일만 처리됩니다.",
+        "wave_need_two": "비교하려면 최소 두 개의 웨이브를 업로드하세요.",
+        "wave_numeric_trend": "웨이브별 평균 (95% 신뢰구간)",
+        "wave_tests_title": "연속 웨이브 간 변화 (Welch t-검정)",
+        "wave_cat_trend": "웨이브별 분포 (%) 및 카이제곱 검정",
+        "wave_corr_trend": "웨이브별 상관 (p_change: 이전 웨이브 대비 Fisher z 검정)",
+        "history_title": "저장된 분석 🗂️",
+        "history_empty": "아직 저장된 분석이 없습니다. 데이터셋을 탐색하면 결과가 자동으로 저장됩니다.",
+        "history_note": "결과는 이 서버에 데이터셋별로 저장되므로 같은 파일을 다시 열면 다시 계산하지 않고 재사용합니다. 저장 공간이 한도에 도달하면 가장 오래된 결과부터 삭제됩니다.",
+        "history_clear": "저장된 결과 삭제",
+        "history_cleared": "저장된 결과를 삭제했습니다.",
+        "engine_note": "빈도, 카이제곱 검정, 기술 통계 및 상관은 업로드된 전체 파일에 대해 DuckDB로 계산됩니다.",
+        "heatmap_cluster": "관련 변수 묶기 (계층적 군집화)",
+        "heatmap_threshold": "|r|이 이 값 미만인 상관 숨기기",
+        "heatmap_rows": "세부 보기 행 (히트맵 상 위치)",
+        "heatmap_cols": "세부 보기 열 (히트맵 상 위치)",
+        "heatmap_pairs_title": "선택한 영역의 변수 쌍 (강한 순)",
+        "preview_show": "데이터 미리보기 표시",
+        "preview_page_rows": "페이지당 행 수",
+        "preview_row_page": "행 페이지 (전체 {total})",
+        "preview_col_page": "열 페이지 (전체 {total})",
+        "preview_note": "페이지는 필요할 때 불러옵니다. {chars}자를 넘는 텍스트는 줄여서 표시됩니다.",
+        "group_tests_title": "그룹 비교 (수치형 × 범주형) 👥",
+        "group_tests_note": "두 그룹은 Welch t-검정, 그 이상은 일원분산분석, 순위 기반 확인으로 Kruskal-Wallis 검정을 사용합니다. 효과 크기: Hedges g, eta², epsilon². p-값 순으로 정렬됩니다.",
+        "group_means_title": "쌍별 그룹 평균",
+        "not_enough_groups": "데이터가 있는 그룹이 두 개 이상인 수치형 × 범주형 쌍이 없습니다.",
+        "pdf_group_by": "그룹",
+        "pdf_test": "검정",
+        "pdf_effect": "효과 크기",
+        "weight_title": "조사 가중치 (레이킹) ⚖️",
+        "weight_note": "모집단 분포를 알고 있는 변수를 선택하고 목표 비율을 입력하세요. 가중치는 레이킹으로 계산되며 기술 통계, 빈도, 교차표, 카이제곱 검정, 상관, 그룹 비교에 사용됩니다.",
+        "weight_vars": "레이킹 변수",
+        "weight_category": "범주",
+        "weight_target": "목표 %",
+        "weight_apply": "가중치 적용",
+        "weight_deff": "설계 효과",
+        "weight_range": "가중치 범위",
+        "weight_iterations": "반복 횟수",
+        "weight_not_converged": "레이킹이 완전히 수렴하지 않았습니다 (최대 비율 오차 {error:.2g}).",
+        "weight_empty": "응답자가 없는 범주: {categories}. 이 목표는 제외하고 나머지를 재조정했습니다.",
+        "pdf_weighted": "레이킹 가중치 적용, 설계 효과",
+        "quality_title": "응답 품질 🧹",
+        "quality_note": "일자형 응답(모든 X 또는 Y 문항에 같은 답), 완전히 중복된 행, 거의 같은 주관식 응답, 그리고 소요 시간 열이 있으면 중앙값보다 훨씬 빨리 끝낸 응답자를 표시합니다.",
+        "quality_duration": "소요 시간 열",
+        "quality_no_duration": "(없음)",
+        "quality_speeder_ratio": "빠른 응답 기준 (소요 시간 중앙값 대비 비율)",
+        "quality_straightline": "일자형 응답 ({group} 문항)",
+        "quality_duplicate": "완전 중복",
+        "quality_near_duplicate": "유사 중복 텍스트",
+        "quality_speeder": "빠른 응답자",
+        "quality_any": "하나 이상 해당",
+        "quality_exclude": "표시된 행을 모든 분석에서 제외",
+        "quality_excluded": "표시된 {rows}개 행이 아래의 모든 분석에서 제외됩니다.",
+        "multi_title": "복수 응답 문항 ☑️",
+        "multi_select": "복수 응답 열",
+        "multi_option": "선택지",
+        "multi_pct_respondents": "응답자 비율 (%)",
+        "multi_note": "응답자가 여러 선택지를 고를 수 있으므로 응답자 비율의 합은 100%를 넘을 수 있습니다.",
+        "multi_no_options": "이 열에서 선택지를 찾을 수 없습니다.",
+        "multi_co_selection": "함께 선택된 선택지",
+        "multi_by": "분류 기준",
+        "multi_crosstab_note": "각 그룹의 응답자 중 해당 선택지를 고른 비율 (%).",
+        "fa_title": "요인 분석 (PCA / EFA) 🧭",
+        "fa_items": "문항",
+        "fa_not_enough": "문항을 3개 이상 선택하세요.",
+        "fa_method": "방법",
+        "fa_pca": "주성분 분석",
+        "fa_efa": "탐색적 요인 분석",
+        "fa_factors": "요인 수 (0 = 고유값 > 1)",
+        "fa_scree": "스크리 도표",
+        "fa_kept": "유지된 요인",
+        "fa_explained": "설명된 분산",
+        "fa_item": "문항",
+        "fa_communality": "공통성",
+        "fa_note": "적재량은 베리맥스 회전되었으며 쌍별 완전 상관에서 계산됩니다. 같은 요인에 강하게 적재되는 문항(|적재량| ≥ 0.4)은 같은 구성 개념을 측정하는 경향이 있습니다.",
+        "themes_title": "주제와 키워드 🗂️",
+        "themes_no_words": "토큰화 후 남은 단어가 없습니다.",
+        "themes_count": "주제 수",
+        "keywords_by": "키워드 기준",
+        "keywords_by_theme": "주제 (클러스터)",
+        "themes_theme": "주제",
+        "themes_keywords": "키워드",
+        "themes_example": "응답 예시",
+        "themes_note": "응답은 유사한 단어 사용(TF-IDF + k-means)에 따라 묶입니다. 키워드는 다른 주제와 비교해 각 주제에 가장 특징적인 단어입니다.",
+        "keywords_note": "키워드는 다른 그룹과 비교해 각 그룹에 가장 특징적인 단어입니다 (클래스 기반 TF-IDF).",
+        "segment_title": "세그먼트별 보고서 🗃️",
+        "segment_by": "값마다 보고서를 만들 열",
+        "segment_button": "세그먼트별 보고서 생성 (ZIP)",
+        "segment_starting": "세그먼트별 보고서를 시작하는 중...",
+        "segment_progress": "{done}/{total}개 보고서 완료 (최근: {name})",
+        "segment_too_many": "이 열에는 {max}개가 넘는 값이 있습니다. 세그먼트가 더 적은 열을 선택하세요.",
+        "segment_download": "세그먼트별 보고서 다운로드 (ZIP)",
+        "pdf_pairs_top": "상관이 가장 강한 {n}개 쌍 (|r| 기준)",
+        "fa_no_variance": "선택한 문항 중 변동이 있는 문항이 2개 미만입니다. 요인 분석에는 응답이 서로 다른 문항이 필요합니다.",
+        "weight_negative": "음수 목표값: {categories}. 0%로 처리했습니다.",
+        "group_tests_weighted": "가중치 적용: 평균, 분산, t-검정/분산분석은 조사 가중치와 Kish 유효 표본 크기를 사용합니다. Kruskal-Wallis는 가중치 없는 순위를, n은 가중치 없는 건수를 사용합니다.",
+        "engine_note_sample": "빈도, 카이제곱 검정, 기술 통계 및 상관은 표본으로 추출된 행에 대해 DuckDB로 계산됩니다.",
+    },
+    "CN": {
+        "title": "问卷分析仪表盘 📊",
+        "subtitle": "上传问卷数据，一站式查看统计结果、可视化图表和多语言 PDF 报告 📈。",
+        "dark_mode": "深色模式 🌙",
+        "language": "语言 🌐",
+        "upload_label": "上传 CSV 或 Excel 文件 📂",
+        "no_file": "请先上传一个 CSV 或 Excel 文件以开始分析 🚀。",
+        "invalid_file_type": "不支持的文件类型，请上传 CSV、XLS 或 XLSX 文件 ⚠️。",
+        "preview_title": "数据预览 👀",
+        "summary_title": "数据集概览 📂",
+        "rows": "行数 🔢",
+        "cols": "列数 🔢",
+        "num_cols": "数值列 🔢",
+        "cat_cols": "类别列 🧩",
+        "text_cols": "文本列 📝",
+        "tab_desc": "描述性统计 📌",
+        "tab_visual": "可视化 📊",
+        "tab_corr": "相关与检验 🔗",
+        "tab_text": "文本分析 💬",
+        "select_numeric_col": "请选择一个数值列 🎯",
+        "select_numeric_col_x": "请选择数值变量 X 📈",
+        "select_numeric_col_y": "请选择数值变量 Y 📉",
+        "select_cat_col1": "请选择类别变量 1 🧩",
+        "select_cat_col2": "请选择类别变量 2 🧩",
+        "select_cat_col": "请选择一个类别列 🧩",
+        "select_text_col": "请选择一个文本列 📝",
+        "desc_stats_title": "数据的汇总统计量 📌",
+        "normaltest_title": "正态性检验（D’Agostino–Pearson）📏",
+        "normaltest_not_enough": "有效样本不足，无法进行正态性检验（至少需要 8 个样本）⚠️。",
+        "statistic": "统计量 📊",
+        "pvalue": "p 值 📉",
+        "alpha_note": "使用显著性水平 α = 0.05 🎯。",
+        "normal_interpret": "数据大致符合正态分布（无法拒绝原假设 H₀）✅。",
+        "not_normal_interpret": "数据可能不符合正态分布（拒绝原假设 H₀）⚠️。",
+        "hist_title": "直方图 📊",
+        "box_title": "箱线图 📦",
+        "freq_table_title": "频数表 📋",
+        "count": "频数 🔢",
+        "percent": "百分比 (%) 📈",
+        "visual_hist_title": "选定数值列的直方图 📊",
+        "visual_box_title": "选定数值列的箱线图 📦",
+        "scatter_title": "散点图 🔍",
+        "scatter_x": "X 轴 ➡️",
+        "scatter_y": "Y 轴 ⬆️",
+        "bar_title": "柱状图（前 20 个类别）📊",
+        "corr_matrix_title": "皮尔逊相关矩阵 🧮",
+        "pearson_title": "皮尔逊相关系数 📐",
+        "spearman_title": "斯皮尔曼相关系数 📐",
+        "r_label": "相关系数 (r) 🔗",
+        "strength": "强度 💪",
+        "direction": "方向 ➡️",
+        "p_label": "p 值 📉",
+        "strength_very_weak": "非常弱 💧",
+        "strength_weak": "较弱 🌱",
+        "strength_moderate": "中等 ⚖️",
+        "strength_strong": "较强 💪",
+        "strength_very_strong": "非常强 🔥",
+        "direction_positive": "正相关 📈",
+        "direction_negative": "负相关 📉",
+        "direction_none": "无明显相关 🚫",
+        "chi_square_title": "卡方独立性检验 🧪",
+        "chi2_label": "卡方值 (χ²) 🧮",
+        "df_label": "自由度 🎚️",
+        "expected_title": "期望频数 📊",
+        "observed_title": "观测频数 📊",
+        "text_preview_title": "文本样本词汇 👀",
+        "top_words_title": "出现频率最高的 10 个词 🔝",
+        "pdf_title": "导出 PDF 报告 📄",
+        "pdf_button": "生成 PDF 报告 🖨️",
+        "pdf_ready": "PDF 报告已生成，可以通过下方按钮下载 ✅。",
+        "pdf_download": "下载 PDF 报告 📥",
+        "pdf_filename": "survey_report_cn.pdf",
+        "no_numeric": "此数据集中未检测到数值列 ⚠️。",
+        "no_categorical": "此数据集中未检测到类别列 ⚠️。",
+        "no_text": "此数据集中未检测到文本列 ⚠️。",
+        "loading_pdf": "正在生成 PDF 报告，请稍候 ⏳。",
+        "scatter_note": "散点图仅使用在两个列中同时具有有效数值的行 ✅。",
+        "matrix_note": "相关矩阵基于所有数值列，使用皮尔逊方法计算 📐。",
+        "text_processing_note": "文本将被转换为小写，移除标点符号和文本语言的停用词，日文/中文按双字切分 🧹。",
+        "app_footer": "基于 Streamlit 构建的问卷分析助手 💡。",
+        "team_members_title": "团队成员 👥",
+        "team_members_box_title": "项目团队 👥",
+        "team_member_1": "Regina Vinta Amanullah (004202400133) 🎓",
+        "team_member_2": "Bill Christian Panjaitan (004202400058) 🎓",
+        "team_member_3": "Putri Lasrida Malau (004202400132) 🎓",
+        "team_member_4": "Elizabeth Kurniawan (004202400001) 🎓",
+        "pdf_generated_on": "生成时间：%Y-%m-%d %H:%M:%S 🕒",
+        "pdf_dataset_metadata": "数据集元信息 ℹ️",
+        "pdf_numeric_stats": "数值列统计信息 🔢",
+        "pdf_scatter_plots": "数值对的散点图 🔍",
+        "pdf_cat_cols": "类别列（前 10 个类别）🧩",
+        "pdf_text_summary": "文本分析摘要（每列前 10 个高频词）💬",
+        "pdf_column": "列 📁",
+        "pdf_text_column": "文本列 📝",
+        "pdf_normaltest_stat_label": "正态性统计量 📏",
+        "pdf_p_value_label": "p 值 📉",
+        "pdf_count": "频数 🔢",
+        "pdf_mean": "平均值 📊",
+        "pdf_median": "中位数 📊",
+        "pdf_mode": "众数 📊",
+        "pdf_min": "最小值 🔽",
+        "pdf_max": "最大值 🔼",
+        "pdf_std": "标准差 📊",
+        "pdf_normaltest_not_enough": "正态性检验：样本数量不足（n < 8）⚠️。",
+        "no_valid_data": "所选列中没有有效的数值 ⚠️。",
+        "select_two_diff_numeric": "请选择两个不同的数值列 🙂。",
+        "not_enough_corr": "数据不足以计算可靠的相关系数 ⚠️。",
+        "not_enough_scatter": "数据不足以绘制散点图 ⚠️。",
+        "select_two_diff_categorical": "请选择两个不同的类别列 🙂。",
+        "not_enough_chi": "数据不足以执行卡方检验 ⚠️。",
+        "quick_interp_title": "快速解读要点 💡",
+        "quick_interp_hist_1": "直方图展示数值在各个区间内出现的频率，可以直观地看出数据分布的整体形状 📊。",
+        "quick_interp_hist_2": "箱线图可以同时概括中位数、数据离散程度以及是否存在异常值 📦。",
+        "quick_interp_scatter_1": "点大致呈向右上方的趋势，说明两个变量之间存在正相关关系 📈。",
+        "quick_interp_scatter_2": "点大致向右下方分布，说明存在负相关；如果点云分布杂乱，则线性相关关系较弱或几乎不存在 📉。",
+        "quick_interp_corr_1": "相关系数接近 +1 或 -1 时，表示两个变量之间的线性关系非常强 📐。",
+        "quick_interp_corr_2": "相关系数接近 0 时，说明变量之间几乎没有线性关系或关系很弱 ⚖️。",
+        "top_phrases_title": "出现频率最高的 10 个短语（2–3 个词）🔝",
+        "pdf_top_phrases": "高频短语",
+        "text_language": "文本语言 🌐",
+        "column_roles_title": "列角色 ⚙️",
+        "max_categories_label": "类别文本列的最大不同值数量",
+        "max_codes_label": "有序数值列的最大整数编码数量",
+        "column_roles_note": "角色先由样本推断，再用近似去重计数核实。有序列同时按数值和类别进行分析。您的修改会为列结构相同的文件保存 💾。",
+        "queue_position": "服务器繁忙，您的请求在队列中排第 {pos} 位 ⏳。",
+        "limits_rows": "数据集超出单会话限制，将分析 {total} 行中随机抽取的 {rows} 行 🎲。",
+        "limits_cols": "由于单会话限制，仅分析 {total} 列中的前 {cols} 列 ⚠️。",
+        "missing_title": "缺失数据概览 🕳️",
+        "complete_rows": "完整行数 ✅",
+        "cols_with_missing": "含缺失值的列 ⚠️",
+        "missing_by_column": "各列缺失比例 (%)",
+        "missing_patterns": "最常见的缺失模式",
+        "pairwise_complete_title": "每对数值列可用的行数",
+        "no_missing": "此数据集中没有缺失值 ✅。",
+        "wave_title": "多轮调查对比 📈",
+        "wave_upload_label": "上传两轮或以上的调查数据（相同问卷）",
+        "wave_note": "各轮按文件名排序。每个文件只汇总一次并缓存，因此新增一轮时只处理新文件。",
+        "wave_need_two": "请至少上传两轮数据进行对比。",
+        "wave_numeric_trend": "各轮均值（95% 置信区间）",
+        "wave_tests_title": "相邻两轮之间的变化（Welch t 检验）",
+        "wave_cat_trend": "各轮分布（%）及卡方检验",
+        "wave_corr_trend": "各轮相关系数（p_change：与上一轮的 Fisher z 检验）",
+        "history_title": "已保存的分析 🗂️",
+        "history_empty": "暂无已保存的分析。浏览数据集时结果会自动保存。",
+        "history_note": "结果按数据集保存在此服务器上，重新打开同一文件时会直接复用而无需重新计算。存储达到容量上限时会先删除最旧的结果。",
+        "history_clear": "清除已保存的结果",
+        "history_cleared": "已清除保存的结果。",
+        "engine_note": "频数、卡方检验、描述性统计和相关系数均由 DuckDB 基于完整的上传文件计算。",
+        "heatmap_cluster": "将相关变量归组（层次聚类）",
+        "heatmap_threshold": "隐藏 |r| 低于此值的相关",
+        "heatmap_rows": "下钻行（热图中的位置）",
+        "heatmap_cols": "下钻列（热图中的位置）",
+        "heatmap_pairs_title": "所选区域内的变量对（由强到弱）",
+        "preview_show": "显示数据预览",
+        "preview_page_rows": "每页行数",
+        "preview_row_page": "行页（共 {total} 页）",
+        "preview_col_page": "列页（共 {total} 页）",
+        "preview_note": "页面按需加载；超过 {chars} 个字符的文本会被截断。",
+        "group_tests_title": "分组比较（数值 × 分类）👥",
+        "group_tests_note": "两组使用 Welch t 检验，多组使用单因素方差分析，并以 Kruskal-Wallis 作为基于秩的检验。效应量：Hedges g、eta² 和 epsilon²。按 p 值排序。",
+        "group_means_title": "某一配对的分组均值",
+        "not_enough_groups": "没有任何数值 × 分类配对包含至少两个有数据的组。",
+        "pdf_group_by": "分组",
+        "pdf_test": "检验",
+        "pdf_effect": "效应量",
+        "weight_title": "调查权重（Raking）⚖️",
+        "weight_note": "选择已知总体分布的变量并输入目标百分比。权重通过 raking 迭代求得，并用于描述性统计、频数、交叉表、卡方检验、相关分析和分组比较。",
+        "weight_vars": "Raking 变量",
+        "weight_category": "类别",
+        "weight_target": "目标 %",
+        "weight_apply": "应用权重",
+        "weight_deff": "设计效应",
+        "weight_range": "权重范围",
+        "weight_iterations": "迭代次数",
+        "weight_not_converged": "Raking 未完全收敛（最大比例误差 {error:.2g}）。",
+        "weight_empty": "以下类别没有受访者：{categories}。这些目标已被忽略，其余已重新缩放。",
+        "pdf_weighted": "已按 raking 加权，设计效应",
+        "quality_title": "回答质量 🧹",
+        "quality_note": "标记直线作答（所有 X 或 Y 题目答案相同）、完全重复的行、几乎相同的开放式回答，以及（如有时长列）比中位数快得多的速答者。",
+        "quality_duration": "时长列",
+        "quality_no_duration": "（无）",
+        "quality_speeder_ratio": "速答阈值（占时长中位数的比例）",
+        "quality_straightline": "直线作答（{group} 题目）",
+        "quality_duplicate": "完全重复",
+        "quality_near_duplicate": "近似重复文本",
+        "quality_speeder": "速答者",
+        "quality_any": "任一标记",
+        "quality_exclude": "在所有分析中排除被标记的行",
+        "quality_excluded": "已在下方所有分析中排除 {rows} 行被标记的数据。",
+        "multi_title": "多选题 ☑️",
+        "multi_select": "多选列",
+        "multi_option": "选项",
+        "multi_pct_respondents": "受访者占比 (%)",
+        "multi_note": "每位受访者可以选择多个选项，因此受访者占比之和可能超过 100%。",
+        "multi_no_options": "此列中未找到选项。",
+        "multi_co_selection": "同时被选择的选项",
+        "multi_by": "细分依据",
+        "multi_crosstab_note": "各组作答受访者中选择该选项的比例 (%)。",
+        "fa_title": "因子分析（PCA / EFA）🧭",
+        "fa_items": "题项",
+        "fa_not_enough": "请至少选择 3 个题项。",
+        "fa_method": "方法",
+        "fa_pca": "主成分分析",
+        "fa_efa": "探索性因子分析",
+        "fa_factors": "因子数（0 = 特征值 > 1）",
+        "fa_scree": "碎石图",
+        "fa_kept": "保留的因子",
+        "fa_explained": "解释的方差",
+        "fa_item": "题项",
+        "fa_communality": "共同度",
+        "fa_note": "载荷经过最大方差旋转，并基于成对完整相关计算。在同一因子上载荷较高（|载荷| ≥ 0.4）的题项往往测量同一构念。",
+        "themes_title": "主题与关键词 🗂️",
+        "themes_no_words": "分词后没有剩余的词。",
+        "themes_count": "主题数",
+        "keywords_by": "关键词对象",
+        "keywords_by_theme": "主题（聚类）",
+        "themes_theme": "主题",
+        "themes_keywords": "关键词",
+        "themes_example": "示例回答",
+        "themes_note": "回答按用词相似度（TF-IDF + k-means）分组。关键词是与其他主题相比最能代表各主题的词。",
+        "keywords_note": "关键词是与其他组相比最能代表各组的词（基于类别的 TF-IDF）。",
+        "segment_title": "分段报告 🗃️",
+        "segment_by": "按此列的每个值生成一份报告",
+        "segment_button": "生成分段报告 (ZIP)",
+        "segment_starting": "正在开始生成分段报告...",
+        "segment_progress": "已完成 {done}/{total} 份报告（最新：{name}）",
+        "segment_too_many": "此列的取值超过 {max} 个；请选择分段较少的列。",
+        "segment_download": "下载分段报告 (ZIP)",
+        "pdf_pairs_top": "相关性最强的 {n} 对（按 |r|）",
+        "fa_no_variance": "所选题项中有变化的少于 2 个；因子分析需要回答有差异的题项。",
+        "weight_negative": "以下类别的目标为负数：{categories}。已按 0% 处理。",
+        "group_tests_weighted": "已加权：均值、方差及 t 检验/方差分析使用调查权重和 Kish 有效样本量；Kruskal-Wallis 使用未加权的秩；n 为未加权计数。",
+        "engine_note_sample": "频数、卡方检验、描述性统计和相关系数均由 DuckDB 基于抽样的行计算。",
+    },
+}
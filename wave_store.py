@@ -0,0 +1,242 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2_contingency, norm, t as t_dist, ttest_ind_from_stats
+
+from app_home import app_path
+from schema_infer import ROLE_CATEGORICAL, ROLE_NUMERIC, ROLE_ORDINAL, infer_schema
+
+WAVE_SCHEMA_VERSION = 1
+MAX_COMOMENT_COLS = 100
+
+
+# ------------------------------------------------------------
+# Mergeable per-wave aggregates
+# ------------------------------------------------------------
+def _chunk_aggregates(df: pd.DataFrame, numeric_cols: List, cat_cols: List) -> dict:
+    x = df[numeric_cols].to_numpy(dtype=float, na_value=np.nan) if numeric_cols else np.zeros((len(df), 0))
+    valid = np.isfinite(x)
+    x0 = np.where(valid, x, 0.0)
+    n = valid.sum(axis=0)
+    mean = np.divide(x0.sum(axis=0), n, out=np.full(n.shape, np.nan), where=n > 0)
+    m2 = np.where(valid, (x - mean) ** 2, 0.0).sum(axis=0)
+    agg = {
+        "rows": int(len(df)),
+        "numeric": {
+            str(col): {
+                "n": int(n[i]),
+                "mean": float(mean[i]),
+                "m2": float(m2[i]),
+                "min": float(np.min(x[valid[:, i], i])) if n[i] else float("nan"),
+                "max": float(np.max(x[valid[:, i], i])) if n[i] else float("nan"),
+            }
+            for i, col in enumerate(numeric_cols)
+        },
+        "counts": {
+            str(col): {str(k): int(v) for k, v in df[col].value_counts().items()}
+            for col in cat_cols
+        },
+    }
+    co_cols = numeric_cols[:MAX_COMOMENT_COLS]
+    if len(co_cols) >= 2:
+        k = len(co_cols)
+        v = valid[:, :k].astype(float)
+        xs = x0[:, :k]
+        agg["comoments"] = {
+            "columns": [str(c) for c in co_cols],
+            "n": (v.T @ v).tolist(),
+            "s1": (xs.T @ v).tolist(),
+            "s2": ((xs * xs).T @ v).tolist(),
+            "p": (xs.T @ xs).tolist(),
+        }
+    return agg
+
+
+def merge_moments(a: dict, b: dict) -> dict:
+    """Chan et al. parallel update of (n, mean, M2)."""
+    if a["n"] == 0:
+        return dict(b)
+    if b["n"] == 0:
+        return dict(a)
+    n = a["n"] + b["n"]
+    delta = b["mean"] - a["mean"]
+    return {
+        "n": n,
+        "mean": a["mean"] + delta * b["n"] / n,
+        "m2": a["m2"] + b["m2"] + delta * delta * a["n"] * b["n"] / n,
+        "min": min(a["min"], b["min"]),
+        "max": max(a["max"], b["max"]),
+    }
+
+
+def merge_aggregates(a: dict, b: dict) -> dict:
+    out = {"rows": a["rows"] + b["rows"], "numeric": dict(a["numeric"]), "counts": {}}
+    for col, mom in b["numeric"].items():
+        out["numeric"][col] = merge_moments(out["numeric"][col], mom) if col in out["numeric"] else mom
+    for col in set(a["counts"]) | set(b["counts"]):
+        merged = dict(a["counts"].get(col, {}))
+        for key, cnt in b["counts"].get(col, {}).items():
+            merged[key] = merged.get(key, 0) + cnt
+        out["counts"][col] = merged
+    ca, cb = a.get("comoments"), b.get("comoments")
+    if ca and cb and ca["columns"] == cb["columns"]:
+        out["comoments"] = {"columns": ca["columns"]}
+        for key in ("n", "s1", "s2", "p"):
+            out["comoments"][key] = (np.asarray(ca[key]) + np.asarray(cb[key])).tolist()
+    return out
+
+
+def wave_aggregates(df: pd.DataFrame, max_categories: int = 30, chunk_rows: int = 100_000) -> dict:
+    schema = infer_schema(df, max_categories=max_categories)
+    numeric_cols = [c for c, i in schema.items() if i["role"] in (ROLE_NUMERIC, ROLE_ORDINAL)]
+    cat_cols = [c for c, i in schema.items() if i["role"] in (ROLE_ORDINAL, ROLE_CATEGORICAL)]
+    agg = None
+    for start in range(0, max(len(df), 1), chunk_rows):
+        part = _chunk_aggregates(df.iloc[start : start + chunk_rows], numeric_cols, cat_cols)
+        agg = part if agg is None else merge_aggregates(agg, part)
+    agg["version"] = WAVE_SCHEMA_VERSION
+    return agg
+
+
+# ------------------------------------------------------------
+# On-disk cache: one JSON file per wave content hash
+# ------------------------------------------------------------
+class WaveStore:
+    """Aggregates are small and keyed by file content, so a wave is only
+    ever parsed once; comparing waves afterwards never touches raw rows."""
+
+    def __init__(self, root: str, memory_items: int = 64):
+        self.root = root
+        self.memory_items = memory_items
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, dict]" = OrderedDict()
+
+    def _remember(self, content_hash: str, agg: dict) -> None:
+        with self._lock:
+            self._memory[content_hash] = agg
+            self._memory.move_to_end(content_hash)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def _path(self, content_hash: str) -> str:
+        return os.path.join(self.root, f"{content_hash}.json")
+
+    def get(self, content_hash: str) -> Optional[dict]:
+        with self._lock:
+            if content_hash in self._memory:
+                self._memory.move_to_end(content_hash)
+                return self._memory[content_hash]
+        try:
+            with open(self._path(content_hash), encoding="utf-8") as f:
+                agg = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if agg.get("version") != WAVE_SCHEMA_VERSION:
+            return None
+        self._remember(content_hash, agg)
+        return agg
+
+    def put(self, content_hash: str, agg: dict) -> None:
+        path = self._path(content_hash)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with self._lock:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(agg, f)
+            os.replace(tmp, path)
+        self._remember(content_hash, agg)
+
+
+WAVE_STORE = WaveStore(os.path.dirname(app_path("waves", "_")))
+
+
+# ------------------------------------------------------------
+# Trends and wave-to-wave tests from aggregates only
+# ------------------------------------------------------------
+def numeric_trend(waves: Sequence[Tuple[str, dict]], column: str, alpha: float = 0.05) -> pd.DataFrame:
+    rows = []
+    for label, agg in waves:
+        mom = agg["numeric"].get(column)
+        if mom is None or mom["n"] == 0:
+            rows.append({"wave": label, "n": 0, "mean": np.nan, "std": np.nan, "ci_low": np.nan, "ci_high": np.nan})
+            continue
+        n = mom["n"]
+        std = np.sqrt(mom["m2"] / (n - 1)) if n > 1 else np.nan
+        half = t_dist.ppf(1 - alpha / 2, n - 1) * std / np.sqrt(n) if n > 1 else np.nan
+        rows.append(
+            {
+                "wave": label,
+                "n": n,
+                "mean": mom["mean"],
+                "std": std,
+                "ci_low": mom["mean"] - half,
+                "ci_high": mom["mean"] + half,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def numeric_wave_tests(trend: pd.DataFrame) -> pd.DataFrame:
+    """Welch t-test between each wave and the one before it."""
+    rows = []
+    for prev, cur in zip(trend.iloc[:-1].itertuples(), trend.iloc[1:].itertuples()):
+        if prev.n < 2 or cur.n < 2:
+            continue
+        stat, p = ttest_ind_from_stats(cur.mean, cur.std, cur.n, prev.mean, prev.std, prev.n, equal_var=False)
+        rows.append(
+            {
+                "from": prev.wave,
+                "to": cur.wave,
+                "diff": cur.mean - prev.mean,
+                "t": stat,
+                "p": p,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def category_trend(waves: Sequence[Tuple[str, dict]], column: str):
+    table = pd.DataFrame(
+        {label: pd.Series(agg["counts"].get(column, {}), dtype=float) for label, agg in waves}
+    ).fillna(0)
+    if table.empty:
+        return table, None
+    table = table.loc[table.sum(axis=1).sort_values(ascending=False).index]
+    used = table.loc[:, table.sum(axis=0) > 0]
+    test = None
+    if used.shape[0] >= 2 and used.shape[1] >= 2:
+        chi2, p, dof, _ = chi2_contingency(used.to_numpy())
+        test = {"chi2": chi2, "p": p, "dof": dof}
+    pct = (table / table.sum(axis=0).replace(0, np.nan) * 100).round(2)
+    return pct, test
+
+
+def correlation_trend(waves: Sequence[Tuple[str, dict]], col_x: str, col_y: str) -> pd.DataFrame:
+    """Pearson r per wave from co-moments, with a Fisher z test against the previous wave."""
+    rows = []
+    prev = None
+    for label, agg in waves:
+        co = agg.get("comoments")
+        r = np.nan
+        n = 0
+        if co and col_x in co["columns"] and col_y in co["columns"]:
+            i, j = co["columns"].index(col_x), co["columns"].index(col_y)
+            n = co["n"][i][j]
+            sx, sy = co["s1"][i][j], co["s1"][j][i]
+            sxx, syy = co["s2"][i][j], co["s2"][j][i]
+            sxy = co["p"][i][j]
+            denom = np.sqrt(max(n * sxx - sx * sx, 0.0) * max(n * syy - sy * sy, 0.0))
+            if n > 2 and denom > 0:
+                r = float(np.clip((n * sxy - sx * sy) / denom, -1.0, 1.0))
+        p_change = np.nan
+        if prev is not None and np.isfinite(r) and np.isfinite(prev[0]) and n > 3 and prev[1] > 3:
+            z = (np.arctanh(r) - np.arctanh(prev[0])) / np.sqrt(1 / (n - 3) + 1 / (prev[1] - 3))
+            p_change = float(2 * norm.sf(abs(z)))
+        rows.append({"wave": label, "n": int(n), "r": r, "p_change": p_change})
+        prev = (r, n)
+    return pd.DataFrame(rows)
@@ -0,0 +1,150 @@
+import hashlib
+from typing import Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import t as t_dist
+
+
+# ------------------------------------------------------------
+# Raking (iterative proportional fitting) to population margins
+# ------------------------------------------------------------
+def _margin_codes(series: pd.Series, categories: Sequence) -> np.ndarray:
+    """Row codes into ``categories`` (matched as strings); -1 where there is no target."""
+    codes, uniques = pd.factorize(series)
+    lookup = {str(c): i for i, c in enumerate(categories)}
+    to_target = np.array([lookup.get(str(u), -1) for u in uniques] + [-1], dtype=np.int64)
+    return to_target[codes]
+
+
+def rake(
+    df: pd.DataFrame,
+    margins: Mapping[str, Mapping[str, float]],
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    cap: Optional[float] = None,
+) -> Tuple[np.ndarray, dict]:
+    """Weights whose weighted category shares match ``margins``.
+
+    ``margins`` maps a column to ``{category: target share}``; shares are
+    normalised per column. Each column is integer-coded once, and every
+    iteration adjusts the weights one column at a time from a bincount of
+    the current weights per category. Rows whose category has no target
+    are left out of that column's adjustment. ``cap`` trims weights above
+    ``cap`` times the mean after each iteration. Target categories without
+    any respondents cannot be reached; they are dropped and the remaining
+    shares renormalised (listed in ``info["empty_categories"]``). Negative
+    targets are treated as 0 (listed in ``info["negative_targets"]``).
+    Weights are returned with mean 1, aligned with the rows of ``df``.
+    """
+    n = len(df)
+    w = np.ones(n)
+    dims = []
+    empty = []
+    negative = []
+    for col, targets in margins.items():
+        categories = list(targets)
+        codes = _margin_codes(df[col], categories)
+        rows = np.flatnonzero(codes >= 0)
+        present = np.bincount(codes[rows], minlength=len(categories)) > 0
+        wanted = np.array([float(targets[c]) for c in categories])
+        negative.extend(f"{col}={c}" for c, t in zip(categories, wanted) if t < 0)
+        wanted = np.maximum(wanted, 0.0)
+        share = wanted * present
+        empty.extend(f"{col}={c}" for c, ok, t in zip(categories, present, wanted) if not ok and t)
+        if share.sum() <= 0:
+            continue
+        dims.append((rows, codes[rows], share / share.sum()))
+
+    iterations, worst, converged = 0, 0.0, not dims
+    for iterations in range(1, max_iter + 1):
+        worst = 0.0
+        for rows, codes, share in dims:
+            wr = w[rows]
+            totals = np.bincount(codes, weights=wr, minlength=share.size)
+            total = totals.sum()
+            if total <= 0:
+                continue
+            worst = max(worst, float(np.abs(totals / total - share).max()))
+            factor = np.divide(share * total, totals, out=np.ones_like(totals), where=totals > 0)
+            w[rows] = wr * factor[codes]
+        if cap:
+            np.minimum(w, cap * w.mean(), out=w)
+        if worst < tol:
+            converged = True
+            break
+
+    if n:
+        w *= n / w.sum()
+    info = {
+        "iterations": iterations,
+        "converged": converged,
+        "max_error": worst,
+        "design_effect": design_effect(w),
+        "min": float(w.min()) if n else np.nan,
+        "max": float(w.max()) if n else np.nan,
+        "empty_categories": empty,
+        "negative_targets": negative,
+    }
+    return w, info
+
+
+def effective_n(w: np.ndarray) -> float:
+    """Kish effective sample size."""
+    w = np.asarray(w, dtype=float)
+    sq = float((w * w).sum())
+    return float(w.sum()) ** 2 / sq if sq > 0 else 0.0
+
+
+def design_effect(w: np.ndarray) -> float:
+    n_eff = effective_n(w)
+    return len(w) / n_eff if n_eff > 0 else np.nan
+
+
+def weights_tag(w: np.ndarray) -> str:
+    """Short content hash of a weight vector, for cache keys."""
+    return hashlib.sha1(np.ascontiguousarray(w, dtype=np.float64).tobytes()).hexdigest()[:16]
+
+
+# ------------------------------------------------------------
+# Weighted counterparts of the profile statistics
+# ------------------------------------------------------------
+def weighted_value_counts(series: pd.Series, w: np.ndarray) -> pd.Series:
+    """Like ``series.value_counts(dropna=False)`` with summed weights as counts."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    totals = np.bincount(codes, weights=w, minlength=len(uniques))
+    out = pd.Series(totals, index=pd.Index(uniques, name=series.name), name="count")
+    return out.sort_values(ascending=False, kind="stable")
+
+
+def weighted_crosstab(a: pd.Series, b: pd.Series, w: np.ndarray) -> pd.DataFrame:
+    """Weighted ``pd.crosstab(a, b)``: rows with a missing value in either are dropped."""
+    ca, ua = pd.factorize(a, sort=True)
+    cb, ub = pd.factorize(b, sort=True)
+    keep = (ca >= 0) & (cb >= 0)
+    if not keep.any():
+        return pd.DataFrame()
+    cells = np.bincount(
+        ca[keep] * len(ub) + cb[keep], weights=np.asarray(w)[keep], minlength=len(ua) * len(ub)
+    ).reshape(len(ua), len(ub))
+    ct = pd.DataFrame(cells, index=pd.Index(ua, name=a.name), columns=pd.Index(ub, name=b.name))
+    # pd.crosstab drops categories that only occur next to a missing value.
+    return ct.loc[ct.sum(axis=1) > 0, ct.sum(axis=0) > 0]
+
+
+def weighted_pearson(x: np.ndarray, y: np.ndarray, w: np.ndarray) -> Tuple[float, float]:
+    """Weighted r with a t-test on the Kish effective sample size."""
+    w = np.asarray(w, dtype=float)
+    mx = np.average(x, weights=w)
+    my = np.average(y, weights=w)
+    dx, dy = x - mx, y - my
+    denom = np.sqrt((w * dx * dx).sum() * (w * dy * dy).sum())
+    if denom == 0:
+        return np.nan, np.nan
+    r = float(np.clip((w * dx * dy).sum() / denom, -1.0, 1.0))
+    n_eff = effective_n(w)
+    if n_eff <= 2:
+        return r, np.nan
+    df = n_eff - 2
+    t = r * np.sqrt(df / max(1.0 - r * r, 1e-300))
+    return r, float(2 * t_dist.sf(abs(t), df))